@@ -0,0 +1,283 @@
+"""
+Benchmarks for performance-sensitive operations on ``TimeSeries``.
+
+Run from the root of the repository with ``python -m benchmarks.benchmark_time_series``.
+"""
+from data_tools.collections import TimeSeries
+import pandas as pd
+import numpy as np
+import datetime
+import tempfile
+import timeit
+import tracemalloc
+import math
+import os
+
+
+# One hour of 10Hz data
+NUM_ELEMENTS = 36_000
+PERIOD = 0.1
+REPEATS = 20
+
+
+def make_time_series(values: np.ndarray, units: str, offset: float = 0.0) -> TimeSeries:
+    start = datetime.datetime(2024, 7, 16, 15, 0, 0, tzinfo=datetime.timezone.utc) + datetime.timedelta(seconds=offset)
+    length = (len(values) - 1) * PERIOD
+
+    return TimeSeries(values,
+                      start,
+                      start + datetime.timedelta(seconds=length),
+                      period=PERIOD,
+                      length=length,
+                      units=units)
+
+
+def report(name: str, statement, repeats: int = REPEATS, setup=None) -> float:
+    seconds = min(timeit.repeat(statement, setup=setup or "pass", number=1, repeat=repeats))
+    print(f"{name:<60} {seconds * 1e3:>10.3f} ms")
+
+    return seconds
+
+
+def benchmark_aligned_arithmetic():
+    rng = np.random.default_rng(0)
+    voltage = make_time_series(rng.normal(100, 1, NUM_ELEMENTS), "V")
+    current = make_time_series(rng.normal(10, 1, NUM_ELEMENTS), "A")
+    losses = make_time_series(rng.normal(5, 1, NUM_ELEMENTS), "W")
+
+    def forced_alignment():
+        aligned_voltage, aligned_current = TimeSeries.align(voltage, current)
+        power = aligned_voltage * aligned_current
+        aligned_power, aligned_losses = TimeSeries.align(power, losses)
+
+        return aligned_power - aligned_losses
+
+    print("Arithmetic: v * i - losses")
+    baseline = report("  with alignment", forced_alignment)
+    fast = report("  already-aligned fast path", lambda: voltage * current - losses)
+    print(f"  speedup: {baseline / fast:.1f}x")
+
+
+def legacy_from_query_dataframe(query_df: pd.DataFrame, period: float, field: str, units: str) -> TimeSeries:
+    """
+    The implementation of ``TimeSeries.from_query_dataframe`` prior to vectorized ingestion, kept for comparison.
+    """
+    query_df['_time'] = pd.to_datetime(query_df['_time'])
+    query_df.set_index('_time', inplace=True)
+
+    x_axis = query_df.index.map(lambda x: x.timestamp()).to_numpy()
+    x_axis -= x_axis[0]
+
+    temporal_length: float = x_axis[-1]
+    desired_num_elements: int = math.ceil(temporal_length / period)
+    desired_x_axis = np.linspace(0, temporal_length, desired_num_elements + 1, endpoint=True)
+
+    wave = query_df[[field]].to_numpy().reshape(-1)
+    wave_interpolated = np.interp(desired_x_axis, x_axis, wave)
+
+    actual_granularity = np.mean(np.diff(desired_x_axis))
+
+    meta: dict = {
+        "car": query_df["car"].to_numpy()[0],
+        "measurement": query_df["_measurement"].to_numpy()[0],
+        "field": field
+    }
+
+    return TimeSeries(wave_interpolated,
+                      start_time=query_df.index.to_numpy()[0].to_pydatetime(),
+                      stop_time=query_df.index.to_numpy()[-1].to_pydatetime(),
+                      period=actual_granularity,
+                      length=temporal_length,
+                      units=units,
+                      meta=meta)
+
+
+def benchmark_query_ingestion(num_rows: int = 1_000_000):
+    rng = np.random.default_rng(0)
+    start_ns = 1_721_142_000 * 10 ** 9
+    timestamps = start_ns + np.cumsum(rng.integers(90, 110, num_rows)) * 10 ** 6
+
+    query_df = pd.DataFrame({
+        "_time": pd.to_datetime(timestamps, utc=True),
+        "car": "Brightside",
+        "_measurement": "BMS",
+        "TotalPackVoltage": rng.normal(130, 2, num_rows),
+    })
+
+    # The legacy implementation mutates its input, so it is given a fresh copy before each run
+    context = {"query_df": query_df, "legacy": legacy_from_query_dataframe}
+
+    print(f"Ingestion: from_query_dataframe with {num_rows} rows")
+    baseline = min(timeit.repeat("legacy(df, 0.1, 'TotalPackVoltage', 'V')", setup="df = query_df.copy()",
+                                 globals=context, number=1, repeat=3))
+    print(f"{'  legacy (per-row timestamp conversion)':<60} {baseline * 1e3:>10.3f} ms")
+    fast = report("  vectorized", lambda: TimeSeries.from_query_dataframe(query_df, 0.1, "TotalPackVoltage", "V"),
+                  repeats=3)
+    print(f"  speedup: {baseline / fast:.1f}x")
+
+
+def legacy_merge(*args, fill_value: float = 0) -> TimeSeries:
+    """
+    The implementation of ``TimeSeries.merge`` prior to vectorized merging, kept for comparison.
+    """
+    start_time = min(ts.start.timestamp() for ts in args)
+    end_time = max(ts.stop.timestamp() for ts in args)
+    period = min(ts.period for ts in args)
+
+    num_points = math.ceil((end_time - start_time) / period) + 1
+    merged_values = np.full(num_points, fill_value, dtype=float)
+
+    for ts in args:
+        indices = np.round((ts.unix_x_axis - start_time) / period).astype(int)
+        merged_values[indices] = np.asarray(ts)
+
+    return merged_values
+
+
+def benchmark_merge(num_chunks: int = 500):
+    from data_tools.collections import ChunkedTimeSeries
+
+    rng = np.random.default_rng(0)
+    ts = make_time_series(rng.normal(130, 2, NUM_ELEMENTS * 10), "V")
+
+    # Fresh chunks for each run, so that cached x-axes do not favour either implementation
+    setup = "chunks = list(ChunkedTimeSeries.from_time_series(ts, duration).chunks())"
+    context = {"ChunkedTimeSeries": ChunkedTimeSeries, "ts": ts, "duration": len(ts) * PERIOD / num_chunks,
+               "legacy": legacy_merge, "TimeSeries": TimeSeries}
+
+    print(f"Merge: {num_chunks} chunks of {len(ts) // num_chunks} elements")
+    baseline = min(timeit.repeat("legacy(*chunks)", setup=setup, globals=context, number=1, repeat=5))
+    print(f"{'  legacy (per-series loop)':<60} {baseline * 1e3:>10.3f} ms")
+    fast = min(timeit.repeat("TimeSeries.merge(*chunks)", setup=setup, globals=context, number=1, repeat=5))
+    print(f"{'  vectorized':<60} {fast * 1e3:>10.3f} ms")
+    print(f"  speedup: {baseline / fast:.1f}x")
+
+
+def benchmark_open(num_elements: int = 7 * 24 * 3600 * 10):
+    rng = np.random.default_rng(0)
+    ts = make_time_series(rng.normal(130, 2, num_elements), "V")
+
+    with tempfile.TemporaryDirectory() as directory:
+        binary_path = os.path.join(directory, "pack_voltage.ts")
+        npy_path = os.path.join(directory, "pack_voltage.npy")
+        ts.save(binary_path)
+        np.save(npy_path, np.asarray(ts))
+
+        print(f"Persistence: open one week of 10Hz data ({ts.nbytes / 1e6:.0f} MB)")
+        baseline = report("  np.load (reads everything)", lambda: np.load(npy_path), repeats=5)
+        fast = report("  TimeSeries.open (memory-mapped)", lambda: TimeSeries.open(binary_path), repeats=5)
+        print(f"  speedup: {baseline / fast:.1f}x")
+
+
+def benchmark_range_stats(num_elements: int = 7 * 24 * 3600 * 10, num_queries: int = 100):
+    rng = np.random.default_rng(0)
+    ts = make_time_series(rng.normal(10, 2, num_elements), "A")
+
+    windows = np.sort(rng.integers(0, num_elements, (num_queries, 2)), axis=1)
+    times = [(ts.start + datetime.timedelta(seconds=i * PERIOD), ts.start + datetime.timedelta(seconds=j * PERIOD))
+             for i, j in windows]
+
+    def sliced():
+        for start, stop in times:
+            window = ts.slice(start, stop).view(np.ndarray)
+            _ = (window.min(), window.max(), window.mean())
+
+    def pyramid():
+        for start, stop in times:
+            _ = ts.range_stats(start, stop)
+
+    print(f"Range statistics: {num_queries} random windows of one week of 10Hz data")
+    report("  build pyramid", lambda: TimeSeries.build_pyramid(ts.view(TimeSeries)), repeats=5)
+    ts.build_pyramid()
+    baseline = report("  slice and reduce", sliced, repeats=5)
+    fast = report("  range_stats (pyramid)", pyramid, repeats=5)
+    print(f"  speedup: {baseline / fast:.1f}x")
+
+
+def benchmark_at(num_times: int = 2000):
+    rng = np.random.default_rng(0)
+    ts = make_time_series(rng.normal(10, 2, NUM_ELEMENTS), "A")
+
+    offsets = rng.uniform(0, (NUM_ELEMENTS - 1) * PERIOD, num_times)
+    times = [ts.start + datetime.timedelta(seconds=offset) for offset in offsets]
+
+    print(f"Sampling: {num_times} datetimes")
+    baseline = report("  per-datetime __getitem__", lambda: [ts[t] for t in times])
+    fast = report("  TimeSeries.at (vectorized)", lambda: ts.at(times))
+    print(f"  speedup: {baseline / fast:.1f}x")
+
+
+def benchmark_asof(num_events: int = 1000):
+    from data_tools.collections import RawSeries
+
+    rng = np.random.default_rng(0)
+    current = make_time_series(rng.normal(10, 2, NUM_ELEMENTS), "A")
+
+    # Sparse events, such as brake presses, which must be paired with the telemetry current at each
+    event_times = np.round(np.sort(rng.uniform(current.start.timestamp(), current.stop.timestamp(), num_events)), 6)
+    events = RawSeries(event_times, rng.integers(0, 2, num_events), "")
+    events_on_grid = events.to_time_series(PERIOD * 10)
+
+    print(f"As-of: pair {num_events} events with {len(current)} elements of telemetry")
+    baseline = report("  TimeSeries.align onto a common grid", lambda: TimeSeries.align(current, events_on_grid))
+    fast = report("  TimeSeries.asof (closed form)", lambda: current.asof(events.times))
+    print(f"  speedup: {baseline / fast:.1f}x")
+
+
+def benchmark_lazy(num_elements: int = 2_000_000):
+    rng = np.random.default_rng(0)
+    voltages = [make_time_series(rng.normal(100, 1, num_elements), "V") for _ in range(3)]
+    currents = [make_time_series(rng.normal(5, 1, num_elements), "A") for _ in range(3)]
+    pack_power = make_time_series(rng.normal(1500, 10, num_elements), "W")
+
+    def eager():
+        return (voltages[0] * currents[0] + voltages[1] * currents[1] + voltages[2] * currents[2]) / pack_power
+
+    def lazy():
+        v_a, v_b, v_c = (v.lazy() for v in voltages)
+        return ((v_a * currents[0] + v_b * currents[1] + v_c * currents[2]) / pack_power).evaluate()
+
+    def peak_memory(statement) -> float:
+        tracemalloc.start()
+        statement()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        return peak / 1e6
+
+    print(f"MPPT efficiency expression over {num_elements} elements")
+    baseline = report("  eager", eager, repeats=5)
+    fast = report("  lazy (fused chunks)", lazy, repeats=5)
+    print(f"  speedup: {baseline / fast:.1f}x")
+    print(f"  peak memory: eager {peak_memory(eager):.0f} MB, lazy {peak_memory(lazy):.0f} MB")
+
+
+def benchmark_stats(num_elements: int = 7 * 24 * 3600 * 10):
+    rng = np.random.default_rng(0)
+    ts = make_time_series(rng.normal(1500, 10, num_elements), "W")
+    values = ts.view(np.ndarray)
+
+    def separate():
+        _ = (len(values), np.mean(values), np.min(values), np.max(values), np.std(values), np.sum(values),
+             np.trapezoid(values, dx=PERIOD))
+
+    frozen = ts.copy().freeze()
+    _ = frozen.stats()
+
+    print("Summary statistics of one week of 10Hz data")
+    baseline = report("  separate numpy reductions", separate, repeats=5)
+    report("  TimeSeries.stats (one fused pass)", lambda: ts.stats(), repeats=5)
+    fast = report("  TimeSeries.stats (frozen, cached)", lambda: frozen.stats().to_dict(), repeats=5)
+    print(f"  speedup when cached: {baseline / fast:.0f}x")
+
+
+if __name__ == "__main__":
+    benchmark_aligned_arithmetic()
+    benchmark_query_ingestion()
+    benchmark_merge()
+    benchmark_open()
+    benchmark_range_stats()
+    benchmark_at()
+    benchmark_asof()
+    benchmark_lazy()
+    benchmark_stats()
@@ -9,11 +9,46 @@ Time Series Data
    :toctree: generated/
 
    TimeSeries    -- Enhanced `ndarray` with powerful data analysis features
+   TimeAxis      -- Compact description of an evenly-spaced temporal axis
+   SegmentedTimeSeries -- Time-series data with gaps, stored as contiguous segments
+   RawSeries     -- Irregularly-spaced time-series data that keeps its original timestamps
+   TimeSeriesFrame -- Several channels of time-series data sharing one x–axis
+   SharedTimeSeries -- Handle to a TimeSeries placed in shared memory for other processes
+   ChunkedTimeSeries -- Out-of-core time-series data stored as lazily-loaded chunks
+   LazyTimeSeries -- Expression of TimeSeries arithmetic which is evaluated in fused chunks
+   SeriesStats   -- Mergeable descriptive statistics of time-series data
+
+Units
+=====
+.. autosummary::
+   :toctree: generated/
+
+   unit_cache_info    -- Report the hit rate of the process-wide unit conversion cache
+   clear_unit_cache   -- Empty the process-wide unit conversion cache
 
 """
 from .time_series import TimeSeries
+from ._time_axis import TimeAxis
+from .segmented_time_series import SegmentedTimeSeries
+from .raw_series import RawSeries
+from .time_series_frame import TimeSeriesFrame
+from ._shared_memory import SharedTimeSeries
+from .chunked_time_series import ChunkedTimeSeries
+from .lazy_time_series import LazyTimeSeries
+from ._series_stats import SeriesStats
+from ._units import unit_cache_info, clear_unit_cache
 
 
 __all__ = [
     "TimeSeries",
+    "TimeAxis",
+    "SegmentedTimeSeries",
+    "RawSeries",
+    "TimeSeriesFrame",
+    "SharedTimeSeries",
+    "ChunkedTimeSeries",
+    "LazyTimeSeries",
+    "SeriesStats",
+    "unit_cache_info",
+    "clear_unit_cache",
 ]
@@ -0,0 +1,155 @@
+"""
+A compact binary file format for ``TimeSeries``, which can be memory-mapped when read.
+
+A file consists of:
+
+1. An 8-byte magic number, ``b"\\x89DTTS\\r\\n\\x1a"``.
+2. The length, in bytes, of the header, as a little-endian unsigned 32-bit integer.
+3. The header, as UTF-8 encoded JSON containing the dtype and shape of the data, as well as the start, stop,
+   period, length, units, and metadata of the TimeSeries. It is padded with spaces so that the data begins
+   on a multiple of 64 bytes.
+4. The data, as raw C-ordered bytes.
+"""
+import numpy as np
+import datetime
+import tempfile
+import struct
+import json
+import os
+
+
+MAGIC = b"\x89DTTS\r\n\x1a"
+VERSION = 1
+
+# Data is aligned so that it can be memory-mapped and used with SIMD instructions directly
+_ALIGNMENT = 64
+_HEADER_LENGTH_FORMAT = "<I"
+_PREAMBLE_SIZE = len(MAGIC) + struct.calcsize(_HEADER_LENGTH_FORMAT)
+
+# Modes which memory-map an existing file without truncating it
+_READ_MODES = ("r", "r+", "c")
+
+
+def _encode_header(array: np.ndarray, state: dict) -> bytes:
+    header = {
+        "version": VERSION,
+        "dtype": array.dtype.str,
+        "shape": list(array.shape),
+        "start": state["start"].isoformat() if state["start"] is not None else None,
+        "stop": state["stop"].isoformat() if state["stop"] is not None else None,
+        "period": state["period"],
+        "length": state["length"],
+        "units": state["units"],
+        "meta": state["meta"],
+    }
+
+    try:
+        encoded = json.dumps(header).encode("utf-8")
+    except TypeError as e:
+        raise ValueError("TimeSeries metadata must be JSON-serializable to be saved!") from e
+
+    padding = -(_PREAMBLE_SIZE + len(encoded)) % _ALIGNMENT
+
+    return encoded + b" " * padding
+
+
+def read_header(path: str | os.PathLike) -> tuple[dict, int]:
+    """
+    Read the header of a TimeSeries file.
+
+    :param path: path to the file
+    :raises ValueError: if the file is not a TimeSeries file, or was written by a newer version of this format
+    :return: the header, and the offset in bytes at which the data begins
+    """
+    with open(path, "rb") as file:
+        magic = file.read(len(MAGIC))
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a TimeSeries file!")
+
+        (header_length,) = struct.unpack(_HEADER_LENGTH_FORMAT, file.read(struct.calcsize(_HEADER_LENGTH_FORMAT)))
+        header = json.loads(file.read(header_length).decode("utf-8"))
+
+    if header["version"] > VERSION:
+        raise ValueError(f"{path} was written by a newer version (v{header['version']}) of the TimeSeries format!")
+
+    return header, _PREAMBLE_SIZE + header_length
+
+
+def header_to_state(header: dict) -> dict:
+    """
+    Convert a header into the state understood by ``TimeSeries.__setstate__``.
+    """
+    return {
+        "start": datetime.datetime.fromisoformat(header["start"]) if header["start"] is not None else None,
+        "stop": datetime.datetime.fromisoformat(header["stop"]) if header["stop"] is not None else None,
+        "period": header["period"],
+        "length": header["length"],
+        "units": header["units"],
+        "meta": header["meta"],
+    }
+
+
+def _default_permissions() -> int:
+    """
+    Obtain the permissions of a newly created file under the current umask, as temporary files are
+    only readable by their owner.
+    """
+    umask = os.umask(0)
+    os.umask(umask)
+
+    return 0o666 & ~umask
+
+
+def write(path: str | os.PathLike, array: np.ndarray, state: dict) -> None:
+    """
+    Atomically write ``array`` and the TimeSeries ``state`` to ``path``. The file is written to a temporary
+    file in the same directory which then replaces ``path``, so that readers never observe a partial file.
+
+    :param path: path to the file
+    :param np.ndarray array: the data
+    :param dict state: the metadata of the TimeSeries, as produced by ``TimeSeries.__getstate__``
+    """
+    array = np.ascontiguousarray(array)
+    header = _encode_header(array, state)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    with tempfile.NamedTemporaryFile(dir=directory, prefix=".", suffix=".tmp", delete=False) as file:
+        try:
+            file.write(MAGIC)
+            file.write(struct.pack(_HEADER_LENGTH_FORMAT, len(header)))
+            file.write(header)
+            file.write(array.data)
+
+            file.flush()
+            os.fsync(file.fileno())
+            os.chmod(file.name, _default_permissions())
+
+        except BaseException:
+            file.close()
+            os.remove(file.name)
+            raise
+
+    os.replace(file.name, path)
+
+
+def read(path: str | os.PathLike, mode: str = "r") -> tuple[np.ndarray, dict]:
+    """
+    Memory-map the data of a TimeSeries file. Only the pages of the file that are accessed are read.
+
+    :param path: path to the file
+    :param str mode: "r" for read-only, "r+" to write changes through to the file, or "c" for copy-on-write
+    :raises ValueError: if ``mode`` is not one of "r", "r+", or "c"
+    :return: the memory-mapped data, and the state of the TimeSeries
+    """
+    if mode not in _READ_MODES:
+        raise ValueError(f"Invalid mode {mode!r}, expected one of {_READ_MODES}")
+
+    header, offset = read_header(path)
+    shape = tuple(header["shape"])
+
+    if np.prod(shape) == 0:
+        array = np.empty(shape, dtype=header["dtype"])
+    else:
+        array = np.memmap(path, dtype=header["dtype"], mode=mode, offset=offset, shape=shape)
+
+    return array, header_to_state(header)
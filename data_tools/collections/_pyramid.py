@@ -0,0 +1,137 @@
+"""
+A multi-resolution summary of a 1D array, from which statistics over any range of the array,
+and decimated envelopes for plotting, are obtained without visiting every element.
+"""
+import numpy as np
+
+
+# Blocks at the finest level of the pyramid span 2**_BASE_LEVEL elements, which keeps the pyramid at
+# a small fraction of the size of the data; ranges are resolved to single elements at their edges
+_BASE_LEVEL = 5
+
+
+class Pyramid:
+    """
+    The minimum, maximum, sum, and count of every block of ``2**k`` consecutive elements of an array,
+    for every level ``k`` from ``_BASE_LEVEL`` until a single block spans the array.
+
+    NaN elements are excluded from every statistic, so that gaps filled with NaN do not poison a block.
+    The pyramid is a snapshot, and must be rebuilt if the array it summarizes is modified.
+    """
+    def __init__(self, values: np.ndarray):
+        """
+        :param np.ndarray values: the 1D array that will be summarized
+        """
+        self._values: np.ndarray = values
+
+        finite = ~np.isnan(values) if values.dtype.kind in "fc" else np.ones(len(values), dtype=bool)
+
+        block = 2 ** _BASE_LEVEL
+        num_blocks = -(-len(values) // block)
+        padding = num_blocks * block - len(values)
+
+        def blocks(array: np.ndarray, fill) -> np.ndarray:
+            return np.concatenate((array, np.full(padding, fill, dtype=array.dtype))).reshape(num_blocks, block)
+
+        as_float = values.astype(float)
+        minimums = blocks(np.where(finite, as_float, np.inf), np.inf).min(axis=1)
+        maximums = blocks(np.where(finite, as_float, -np.inf), -np.inf).max(axis=1)
+        sums = blocks(np.where(finite, as_float, 0.0), 0.0).sum(axis=1)
+        counts = blocks(finite, False).sum(axis=1)
+
+        self._levels: list[tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]] = [(minimums, maximums, sums, counts)]
+
+        while len(minimums) > 1:
+            if len(minimums) % 2:
+                minimums = np.append(minimums, np.inf)
+                maximums = np.append(maximums, -np.inf)
+                sums = np.append(sums, 0.0)
+                counts = np.append(counts, 0)
+
+            minimums = np.minimum(minimums[0::2], minimums[1::2])
+            maximums = np.maximum(maximums[0::2], maximums[1::2])
+            sums = sums[0::2] + sums[1::2]
+            counts = counts[0::2] + counts[1::2]
+
+            self._levels.append((minimums, maximums, sums, counts))
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The number of bytes occupied by the summaries, excluding the array itself.
+        """
+        return sum(array.nbytes for level in self._levels for array in level)
+
+    def block_size(self, level: int) -> int:
+        """
+        The number of elements summarized by each block of ``level``, where level 0 is the finest.
+        """
+        return 2 ** (_BASE_LEVEL + level)
+
+    def level(self, level: int) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        The minimum, maximum, sum, and count of each block of ``level``, where level 0 is the finest.
+        """
+        return self._levels[level]
+
+    def level_within(self, num_blocks: int) -> int:
+        """
+        The finest level which has no more than ``num_blocks`` blocks.
+        """
+        for level, (minimums, _, _, _) in enumerate(self._levels):
+            if len(minimums) <= num_blocks:
+                return level
+
+        return len(self._levels) - 1
+
+    def query(self, start: int, stop: int) -> tuple[float, float, float, int]:
+        """
+        Obtain the minimum, maximum, sum, and count of the non-NaN elements from ``start`` to ``stop`` (exclusive).
+        Visits at most ``2**(_BASE_LEVEL + 1)`` elements and two blocks per level, so runs in O(log n).
+
+        :return: the minimum and maximum (NaN if there are no elements), sum, and count
+        """
+        minimum, maximum, total, count = np.inf, -np.inf, 0.0, 0
+
+        def include(values: np.ndarray):
+            nonlocal minimum, maximum, total, count
+            values = values[~np.isnan(values)] if values.dtype.kind in "fc" else values
+
+            if len(values) > 0:
+                minimum = min(minimum, float(values.min()))
+                maximum = max(maximum, float(values.max()))
+                total += float(values.sum())
+                count += len(values)
+
+        block = 2 ** _BASE_LEVEL
+        first_block = -(-start // block)
+        last_block = stop // block
+
+        # Ranges within a single block are summarized directly from the array
+        if first_block >= last_block:
+            include(self._values[start:stop])
+
+        else:
+            include(self._values[start:first_block * block])
+            include(self._values[last_block * block:stop])
+
+            # Climb the pyramid, taking the blocks at the edges of the range which are not covered by the level above
+            low, high = first_block, last_block
+            for minimums, maximums, sums, counts in self._levels:
+                if low >= high:
+                    break
+
+                for i in ((low,) if low % 2 else ()) + ((high - 1,) if high % 2 else ()):
+                    if counts[i] > 0:
+                        minimum = min(minimum, float(minimums[i]))
+                        maximum = max(maximum, float(maximums[i]))
+                        total += float(sums[i])
+                        count += int(counts[i])
+
+                low = (low + 1) // 2
+                high = high // 2
+
+        if count == 0:
+            return np.nan, np.nan, 0.0, 0
+
+        return minimum, maximum, total, count
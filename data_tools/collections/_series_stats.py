@@ -0,0 +1,311 @@
+"""
+Mergeable descriptive statistics of evenly-spaced time-series data.
+"""
+import numpy as np
+import math
+from pint.registry import Unit
+
+from data_tools.collections import _units
+from data_tools import unit_registry
+
+
+# Elements reduced at a time, so that each block is read from memory once and then reduced while in cache
+_BLOCK_SIZE = 2 ** 16
+
+
+class SeriesStats:
+    """
+    The count, sum, mean, variance, minimum, maximum, and integral of time-series data, computed in a
+    single pass over the data.
+
+    Statistics of consecutive pieces of a series, such as chunks or slices, can be merged with :meth:`merge`
+    or :meth:`combine` into the statistics of the whole, with the variance combined by the parallel algorithm of
+    Chan et al. and the integral bridged across adjacent pieces, so that the data never has to be scanned again.
+    """
+    UnitRegistry = unit_registry
+
+    def __init__(self,
+                 count: int,
+                 total: float,
+                 m2: float,
+                 minimum: float,
+                 maximum: float,
+                 integral: float,
+                 first: float,
+                 last: float,
+                 start: float,
+                 stop: float,
+                 period: float,
+                 units: Unit):
+        """
+        :param int count: the number of elements
+        :param float total: the sum of the elements
+        :param float m2: the sum of squared deviations of the elements from their mean
+        :param float minimum: the smallest element
+        :param float maximum: the largest element
+        :param float integral: the integral of the elements with respect to time, in ``units`` multiplied by seconds
+        :param float first: the first element
+        :param float last: the last element
+        :param float start: UNIX timestamp of the first element
+        :param float stop: UNIX timestamp of the last element
+        :param float period: time, in seconds, between subsequent elements
+        :param Unit units: the units of the elements
+        """
+        self._count: int = count
+        self._sum: float = total
+        self._m2: float = m2
+        self._min: float = minimum
+        self._max: float = maximum
+        self._integral: float = integral
+        self._first: float = first
+        self._last: float = last
+        self._start: float = start
+        self._stop: float = stop
+        self._period: float = period
+        self._units: Unit = units
+
+    @staticmethod
+    def of(values: np.ndarray, start: float, period: float, units: Unit):
+        """
+        Compute the statistics of ``values`` in one pass, reducing one cache-sized block at a time.
+
+        :param np.ndarray values: the data elements
+        :param float start: UNIX timestamp of the first element
+        :param float period: time, in seconds, between subsequent elements
+        :param Unit units: the units of the elements
+        :return: the statistics of ``values``
+        """
+        count = len(values)
+        stop = start + max(count - 1, 0) * period
+
+        if count == 0:
+            return SeriesStats(0, 0.0, 0.0, np.nan, np.nan, 0.0, np.nan, np.nan, start, stop, period, units)
+
+        total, m2, minimum, maximum, seen = 0.0, 0.0, np.inf, -np.inf, 0
+        for block_start in range(0, count, _BLOCK_SIZE):
+            block = values[block_start:block_start + _BLOCK_SIZE].astype(float, copy=False)
+            block_sum = float(np.sum(block))
+            block_m2 = float(np.sum(np.square(block - block_sum / len(block))))
+
+            m2 = _combine_m2(seen, total, m2, len(block), block_sum, block_m2)
+            total += block_sum
+            seen += len(block)
+            minimum = min(minimum, float(np.min(block)))
+            maximum = max(maximum, float(np.max(block)))
+
+            # NaN does not compare, so it must be propagated explicitly
+            if math.isnan(block_sum):
+                minimum = maximum = np.nan
+
+        first, last = float(values[0]), float(values[-1])
+        integral = period * (total - (first + last) / 2)
+
+        return SeriesStats(count, total, m2, minimum, maximum, integral, first, last, start, stop, period, units)
+
+    @property
+    def ureg(self):
+        return SeriesStats.UnitRegistry
+
+    @property
+    def units(self) -> Unit:
+        """
+        The units of the data.
+        """
+        return self._units
+
+    @property
+    def count(self) -> int:
+        """
+        The number of data elements.
+        """
+        return self._count
+
+    @property
+    def sum(self) -> float:
+        """
+        The sum of the data elements.
+        """
+        return self._sum
+
+    @property
+    def mean(self) -> float:
+        """
+        The mean of the data elements.
+        """
+        return self._sum / self._count if self._count > 0 else np.nan
+
+    @property
+    def min(self) -> float:
+        """
+        The minimum of the data elements.
+        """
+        return self._min
+
+    @property
+    def max(self) -> float:
+        """
+        The maximum of the data elements.
+        """
+        return self._max
+
+    def var(self, ddof: int = 0) -> float:
+        """
+        The variance of the data elements.
+
+        :param int ddof: delta degrees of freedom, such that the divisor is ``N - ddof`` for ``N`` elements
+        """
+        return self._m2 / (self._count - ddof) if self._count - ddof > 0 else np.nan
+
+    def std(self, ddof: int = 0) -> float:
+        """
+        The standard deviation of the data elements.
+
+        :param int ddof: delta degrees of freedom, such that the divisor is ``N - ddof`` for ``N`` elements
+        """
+        return math.sqrt(self.var(ddof))
+
+    def integral(self, units: Unit | str = None) -> float:
+        """
+        The integral of the data with respect to time by the trapezoidal rule.
+
+        :param str | Unit units: the units of the result, defaults to the units of the data multiplied by seconds
+        :raises ValueError: if ``units`` is not compatible with the units of the data multiplied by time
+        :return: the integral in ``units``
+        """
+        integral_units = _units.multiply_units(self._units, self.ureg.second)
+        if units is None:
+            units = integral_units
+        elif isinstance(units, str):
+            units = _units.parse_units(units)
+
+        if not _units.is_compatible(integral_units, units):
+            raise ValueError(f"Incompatible units: {integral_units} and {units}")
+
+        return self._integral * _units.conversion_factor(integral_units, units)
+
+    def to_dict(self) -> dict[str, float]:
+        """
+        Every statistic, by name.
+        """
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "min": self.min,
+            "max": self.max,
+            "std": self.std(),
+            "sum": self.sum,
+            "integral": self.integral(),
+        }
+
+    def __repr__(self) -> str:
+        statistics = ", ".join(f"{name}={value:.6g}" for name, value in self.to_dict().items())
+
+        return f"SeriesStats({statistics}, units={self._units})"
+
+    def _converted(self, units: Unit):
+        """
+        Express these statistics in ``units``.
+        """
+        if units == self._units:
+            return self
+
+        if not _units.is_compatible(self._units, units):
+            raise ValueError(f"Incompatible units: {self._units} and {units}")
+
+        factor = _units.conversion_factor(self._units, units)
+
+        return SeriesStats(self._count, self._sum * factor, self._m2 * factor ** 2, self._min * factor,
+                           self._max * factor, self._integral * factor, self._first * factor, self._last * factor,
+                           self._start, self._stop, self._period, units)
+
+    @staticmethod
+    def combine(pieces):
+        """
+        Merge the statistics of any number of pieces of the same series, given in any order, by merging
+        them in time order. See :meth:`merge`.
+
+        :param pieces: the statistics of each piece, which are converted into the units of the first piece
+        :raises ValueError: if there are no pieces, the pieces overlap in time, or they have incompatible units
+        :return: the statistics of every piece
+        """
+        pieces = list(pieces)
+        if len(pieces) == 0:
+            raise ValueError("At least one SeriesStats is required!")
+
+        units = pieces[0].units
+        pieces = sorted((piece._converted(units) for piece in pieces), key=lambda piece: piece._start)
+
+        combined = pieces[0]
+        for piece in pieces[1:]:
+            combined = combined.merge(piece)
+
+        return combined
+
+    def merge(self, other):
+        """
+        Combine these statistics with those of another piece of the same series, which must not overlap in time.
+        The integral is bridged across the period between the pieces if they are adjacent, while larger gaps are
+        skipped, as in :meth:`ChunkedTimeSeries.integral`.
+
+        Merged statistics span the time from their first to their last element, so a piece lying between pieces
+        which have already been merged cannot be merged into them; use :meth:`combine` to merge pieces in any order.
+
+        :param SeriesStats other: the statistics to combine with, which are converted into the units of these
+        :raises ValueError: if the pieces overlap in time, or have incompatible units
+        :return: the statistics of both pieces
+        """
+        other = other._converted(self._units)
+
+        if other._count == 0:
+            return self
+        if self._count == 0:
+            return other
+
+        earlier, later = (self, other) if self._start <= other._start else (other, self)
+
+        gap = later._start - earlier._stop
+        if gap <= 0:
+            raise ValueError("Statistics of overlapping pieces of a series cannot be merged! "
+                             "Use SeriesStats.combine to merge pieces in any order.")
+
+        integral = earlier._integral + later._integral
+        if gap <= max(earlier._period, later._period) * (1 + 1e-6):
+            integral += gap * (earlier._last + later._first) / 2
+
+        return SeriesStats(self._count + other._count,
+                           self._sum + other._sum,
+                           _combine_m2(self._count, self._sum, self._m2, other._count, other._sum, other._m2),
+                           float(np.minimum(self._min, other._min)),
+                           float(np.maximum(self._max, other._max)),
+                           integral,
+                           earlier._first,
+                           later._last,
+                           earlier._start,
+                           later._stop,
+                           min(self._period, other._period),
+                           self._units)
+
+    def __getstate__(self) -> dict:
+        # Units are pickled as strings so that they are re-attached to the shared registry when unpickled
+        state = self.__dict__.copy()
+        state["_units"] = str(self._units)
+
+        return state
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self._units = _units.parse_units(state["_units"])
+
+
+def _combine_m2(count_a: int, sum_a: float, m2_a: float, count_b: int, sum_b: float, m2_b: float) -> float:
+    """
+    Combine the sums of squared deviations from the mean of two sets of elements.
+    """
+    if count_a == 0:
+        return m2_b
+    if count_b == 0:
+        return m2_a
+
+    delta = sum_b / count_b - sum_a / count_a
+
+    return m2_a + m2_b + delta ** 2 * count_a * count_b / (count_a + count_b)
@@ -0,0 +1,161 @@
+"""
+Transport of ``TimeSeries`` data between processes through ``multiprocessing.shared_memory``.
+
+The data is copied into a shared memory segment once, and only a small handle naming the segment is
+pickled for each task, so that workers attach to the data without copying it.
+"""
+from multiprocessing import shared_memory
+import numpy as np
+import sys
+
+
+# Shared memory segments attached to by this process, which must outlive every array viewing them
+_ATTACHED_SEGMENTS: dict[str, shared_memory.SharedMemory] = {}
+
+# Segments which have been released while arrays in this process still view them, and which are
+# closed once those arrays have been garbage-collected
+_RELEASED_SEGMENTS: list[shared_memory.SharedMemory] = []
+
+
+def _close(segment: shared_memory.SharedMemory) -> bool:
+    """
+    Close ``segment``, or keep it in ``_RELEASED_SEGMENTS`` to be closed later if arrays still view it.
+
+    :return: whether the segment was closed
+    """
+    try:
+        segment.close()
+
+    # Unmapping the segment now would invalidate the arrays viewing it
+    except BufferError:
+        if segment not in _RELEASED_SEGMENTS:
+            _RELEASED_SEGMENTS.append(segment)
+
+        return False
+
+    return True
+
+
+def _close_released() -> None:
+    """
+    Close every released segment which is no longer viewed by any array.
+    """
+    _RELEASED_SEGMENTS[:] = [segment for segment in _RELEASED_SEGMENTS if not _close(segment)]
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """
+    Attach to the existing shared memory segment ``name``, re-using a previous attachment from this process.
+    """
+    _close_released()
+
+    if name not in _ATTACHED_SEGMENTS:
+        if sys.version_info >= (3, 13):
+            # Only the creator of a segment should be responsible for unlinking it
+            _ATTACHED_SEGMENTS[name] = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            _ATTACHED_SEGMENTS[name] = shared_memory.SharedMemory(name=name)
+
+    return _ATTACHED_SEGMENTS[name]
+
+
+def _detach(name: str) -> None:
+    """
+    Release the attachment of this process to the shared memory segment ``name``.
+    """
+    segment = _ATTACHED_SEGMENTS.pop(name, None)
+
+    if segment is not None:
+        _close(segment)
+
+
+class SharedTimeSeries:
+    """
+    A handle to the data and metadata of a ``TimeSeries`` which has been placed in shared memory
+    by :meth:`TimeSeries.to_shared`, and which can be re-attached to with :meth:`TimeSeries.from_shared`.
+
+    The handle is cheap to pickle, and can be sent to worker processes in place of the TimeSeries.
+    The process which created the handle owns the shared memory segment, and should release it
+    with :meth:`close` or by using the handle as a context manager once workers are finished.
+    Workers may also :meth:`close` their copy of the handle to release their attachment to the segment.
+    """
+    def __init__(self, array: np.ndarray, state: dict):
+        """
+        :param np.ndarray array: the data which will be copied into a new shared memory segment
+        :param dict state: the metadata of the TimeSeries, as produced by ``TimeSeries.__getstate__``
+        """
+        array = np.ascontiguousarray(array)
+        _close_released()
+
+        self._segment = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        self._name: str = self._segment.name
+        self._dtype: str = array.dtype.str
+        self._shape: tuple = array.shape
+        self._state: dict = state
+        self._owner: bool = True
+
+        np.ndarray(self._shape, dtype=self._dtype, buffer=self._segment.buf)[...] = array
+
+    @property
+    def name(self) -> str:
+        """
+        The name of the shared memory segment.
+        """
+        return self._name
+
+    @property
+    def state(self) -> dict:
+        """
+        The metadata of the shared TimeSeries.
+        """
+        return self._state
+
+    def array(self) -> np.ndarray:
+        """
+        Attach to the shared memory segment, and view it as an array. No data is copied.
+        """
+        if self._owner and self._segment is None:
+            raise ValueError("The shared memory segment has been closed!")
+
+        segment = self._segment if self._owner else _attach(self._name)
+
+        # Unlike np.ndarray, np.frombuffer holds on to the buffer, so the segment cannot be unmapped beneath the array
+        count = int(np.prod(self._shape))
+
+        return np.frombuffer(segment.buf, dtype=self._dtype, count=count).reshape(self._shape)
+
+    def close(self) -> None:
+        """
+        Release the shared memory segment. In the process which created it, the segment is removed so that no
+        further processes can attach to it. In any other process, only the attachment of that process to the
+        segment is released. Arrays in this process which still view the segment remain valid, and the segment
+        is unmapped once they have been garbage-collected.
+        """
+        if not self._owner:
+            _detach(self._name)
+            return
+
+        if self._segment is None:
+            _close_released()
+            return
+
+        self._segment.unlink()
+        _close(self._segment)
+        self._segment = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __getstate__(self) -> dict:
+        # Only the creator owns the segment, so copies sent to other processes merely attach to it
+        state = self.__dict__.copy()
+        state["_segment"] = None
+        state["_owner"] = False
+
+        return state
+
+    def __repr__(self) -> str:
+        return f"SharedTimeSeries(name={self._name}, shape={self._shape}, dtype={self._dtype})"
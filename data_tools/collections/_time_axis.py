@@ -0,0 +1,150 @@
+import datetime
+import math
+import numpy as np
+import pandas as pd
+
+
+# Tolerance, in fractions of a period, used when deciding how many whole periods fit into a span of time
+_PERIOD_TOLERANCE = 1e-9
+
+
+class TimeAxis:
+    """
+    A compact description of an evenly-spaced temporal axis: ``n`` elements beginning at the UNIX
+    timestamp ``start`` and separated by ``period`` seconds.
+
+    Arrays representing the axis are only materialized when explicitly requested, and questions
+    such as the overlap between two axes are answered from the descriptors alone.
+    """
+    __slots__ = ("_start", "_period", "_n")
+
+    def __init__(self, start: float, period: float, n: int):
+        """
+        :param float start: UNIX timestamp of the first element
+        :param float period: time, in seconds, between subsequent elements
+        :param int n: number of elements
+        """
+        self._start = float(start)
+        self._period = float(period)
+        self._n = int(n)
+
+    @staticmethod
+    def spanning(start: float, stop: float, period: float):
+        """
+        Obtain the axis with ``period`` that begins at ``start`` and includes as many elements as fit before ``stop``.
+
+        :param float start: UNIX timestamp of the first element
+        :param float stop: UNIX timestamp that the last element must not exceed
+        :param float period: time, in seconds, between subsequent elements
+        """
+        n = math.floor((stop - start) / period + _PERIOD_TOLERANCE) + 1
+
+        return TimeAxis(start, period, max(n, 0))
+
+    @property
+    def start(self) -> float:
+        """
+        UNIX timestamp of the first element.
+        """
+        return self._start
+
+    @property
+    def period(self) -> float:
+        """
+        Time, in seconds, between subsequent elements.
+        """
+        return self._period
+
+    @property
+    def stop(self) -> float:
+        """
+        UNIX timestamp of the last element.
+        """
+        return self._start + self.length
+
+    @property
+    def length(self) -> float:
+        """
+        Total time, in seconds, between the first and last element.
+        """
+        return max(self._n - 1, 0) * self._period
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, TimeAxis):
+            return NotImplemented
+
+        return (self._start, self._period, self._n) == (other._start, other._period, other._n)
+
+    def __hash__(self) -> int:
+        return hash((self._start, self._period, self._n))
+
+    def __repr__(self) -> str:
+        return f"TimeAxis(start={self._start}, period={self._period}, n={self._n})"
+
+    def is_aligned_with(self, other) -> bool:
+        """
+        Determine if this axis and ``other`` have the same elements, within a small fraction of a period.
+
+        :param TimeAxis other: the axis to compare against
+        """
+        if self._n != other._n or not math.isclose(self._period, other._period, rel_tol=1e-9):
+            return False
+
+        return math.isclose(self._start, other._start, rel_tol=0, abs_tol=self._period * 1e-6)
+
+    def intersection(self, other):
+        """
+        Obtain the axis covering the time where this axis and ``other`` overlap, at the finer of the two periods.
+
+        :param TimeAxis other: the axis to intersect with
+        :return: the overlapping axis, or ``None`` if the axes do not overlap
+        """
+        start = max(self.start, other.start)
+        stop = min(self.stop, other.stop)
+
+        if stop < start:
+            return None
+
+        return TimeAxis.spanning(start, stop, min(self.period, other.period))
+
+    def union(self, other):
+        """
+        Obtain the axis covering the time of both this axis and ``other``, at the finer of the two periods.
+
+        :param TimeAxis other: the axis to unify with
+        :return: the unified axis
+        """
+        start = min(self.start, other.start)
+        period = min(self.period, other.period)
+        n = math.ceil((max(self.stop, other.stop) - start) / period - _PERIOD_TOLERANCE) + 1
+
+        return TimeAxis(start, period, n)
+
+    def relative(self) -> np.ndarray:
+        """
+        Materialize this axis in relative seconds, such that the first element is ``t=0``.
+        """
+        return np.arange(self._n) * self._period
+
+    def unix(self) -> np.ndarray:
+        """
+        Materialize this axis as UTC UNIX timestamps.
+        """
+        return self.relative() + self._start
+
+    def nanoseconds(self) -> np.ndarray:
+        """
+        Materialize this axis as integer nanoseconds since the UNIX epoch.
+        """
+        return round(self._start * 1e9) + np.rint(self.relative() * 1e9).astype(np.int64)
+
+    def datetimes(self, tz: datetime.tzinfo = datetime.timezone.utc) -> np.ndarray:
+        """
+        Materialize this axis as timezone-aware datetimes.
+
+        :param tz: the timezone that the datetimes will be localized to
+        """
+        return pd.DatetimeIndex(self.nanoseconds(), tz="UTC").tz_convert(tz).to_numpy()
@@ -0,0 +1,117 @@
+"""
+Process-wide memoization of the unit operations that ``TimeSeries`` performs on ``data_tools.unit_registry``.
+
+Pint builds quantities and resolves dimensionality in pure Python, which dominates the cost of
+arithmetic on short series. Since units are immutable and hashable, every result can be cached.
+"""
+from pint.registry import Unit
+import functools
+
+from data_tools import unit_registry
+
+
+@functools.lru_cache(maxsize=None)
+def parse_units(units: str) -> Unit:
+    """
+    Parse a string such as "meter/second**2" or "J" into a Unit.
+    """
+    return unit_registry.parse_units(units)
+
+
+@functools.lru_cache(maxsize=None)
+def conversion_factor(from_units: Unit, to_units: Unit) -> float:
+    """
+    Obtain the factor which converts a magnitude in ``from_units`` to ``to_units``.
+    """
+    return (1 * from_units).to(to_units).magnitude  # 1 * unit turns it into a quantity rather than pure unit
+
+
+@functools.lru_cache(maxsize=None)
+def is_compatible(units: Unit, other_units: Unit) -> bool:
+    """
+    Determine if ``units`` and ``other_units`` have the same dimensionality.
+    """
+    return units.dimensionality == other_units.dimensionality
+
+
+@functools.lru_cache(maxsize=None)
+def base_units(units: Unit) -> Unit:
+    """
+    Obtain the unit registry system base units (SI Units by default) of ``units``.
+    """
+    return (1 * units).to_base_units().units
+
+
+@functools.lru_cache(maxsize=None)
+def multiply_units(units: Unit, other_units: Unit) -> Unit:
+    """
+    Compose the units of a product.
+    """
+    return units * other_units
+
+
+@functools.lru_cache(maxsize=None)
+def divide_units(units: Unit, other_units: Unit) -> Unit:
+    """
+    Compose the units of a quotient.
+    """
+    return units / other_units
+
+
+@functools.lru_cache(maxsize=None)
+def power_units(units: Unit, exponent: float) -> Unit:
+    """
+    Compose the units of ``units`` raised to ``exponent``.
+    """
+    return units ** exponent
+
+
+_CACHED_FUNCTIONS = (
+    parse_units,
+    conversion_factor,
+    is_compatible,
+    base_units,
+    multiply_units,
+    divide_units,
+    power_units,
+)
+
+
+def unit_cache_info() -> dict:
+    """
+    Report the effectiveness of the unit cache, as a dictionary mapping each cached operation
+    (and "total") to its number of hits, misses, and hit rate.
+    """
+    info = {}
+    total_hits = 0
+    total_misses = 0
+
+    for function in _CACHED_FUNCTIONS:
+        cache_info = function.cache_info()
+        lookups = cache_info.hits + cache_info.misses
+
+        info[function.__name__] = {
+            "hits": cache_info.hits,
+            "misses": cache_info.misses,
+            "hit_rate": cache_info.hits / lookups if lookups > 0 else 0.0,
+        }
+
+        total_hits += cache_info.hits
+        total_misses += cache_info.misses
+
+    total_lookups = total_hits + total_misses
+    info["total"] = {
+        "hits": total_hits,
+        "misses": total_misses,
+        "hit_rate": total_hits / total_lookups if total_lookups > 0 else 0.0,
+    }
+
+    return info
+
+
+def clear_unit_cache() -> None:
+    """
+    Empty the unit cache and reset its statistics.
+    """
+    for function in _CACHED_FUNCTIONS:
+        function.cache_clear()
@@ -0,0 +1,422 @@
+import numpy as np
+import datetime
+import pathlib
+import bisect
+import math
+import os
+from typing import Callable
+from pint.registry import Unit
+
+from data_tools.collections.time_series import TimeSeries
+from data_tools.collections._series_stats import SeriesStats
+from data_tools.collections import _binary_format
+from data_tools.collections import _units
+from data_tools import unit_registry
+
+
+class _Chunk:
+    """
+    A chunk of a ``ChunkedTimeSeries``, described by the time that it spans, which may
+    only be loaded into memory when its data is needed.
+    """
+    __slots__ = ("source", "start", "stop")
+
+    def __init__(self, source, start: datetime.datetime, stop: datetime.datetime):
+        self.source = source
+        self.start = start
+        self.stop = stop
+
+    def load(self) -> TimeSeries:
+        if isinstance(self.source, TimeSeries):
+            return self.source
+
+        if isinstance(self.source, (str, os.PathLike)):
+            return TimeSeries.open(self.source)
+
+        return self.source()
+
+
+class ChunkedTimeSeries:
+    """
+    This class encapsulates time-series data which is too large to comfortably hold in memory as one ``TimeSeries``,
+    such as a full season of 10Hz telemetry, as a sequence of ``TimeSeries`` chunks.
+
+    Chunks may be held in memory, memory-mapped from files written by :meth:`TimeSeries.save`, or loaded lazily
+    by any callable. The time spanned by each chunk is known upfront, so only the chunks
+    which are needed by an operation are loaded, one at a time.
+    """
+    UnitRegistry = unit_registry
+
+    # Arrays on the left of an operator defer to the reflected operators, rather than treating this as an element
+    __array_ufunc__ = None
+
+    def __init__(self,
+                 chunks: list[TimeSeries | str | os.PathLike | Callable[[], TimeSeries]],
+                 bounds: list[tuple[datetime.datetime, datetime.datetime]] = None,
+                 units: Unit | str = None,
+                 meta: dict = None):
+        """
+        :param chunks: the chunks, in chronological order, each of which is a TimeSeries, a path to a TimeSeries file,
+            or a zero-argument callable which produces a TimeSeries.
+        :param bounds: the start and stop time of each chunk. Only required for chunks which are loaded by a
+            callable, and can be ``None`` for other chunks.
+        :param str | Unit units: units of the data, which chunks are converted to when loaded. Defaults to
+            the units of the first chunk which is a TimeSeries or a path.
+        :param dict meta: metadata such as the field, measurement, and car
+        :raises ValueError: if the bounds of a lazily-loaded chunk are not provided, chunks are not in
+            chronological order, or if units are not provided and cannot be determined without loading a chunk
+        """
+        if len(chunks) == 0:
+            raise ValueError("At least one chunk is required!")
+
+        if bounds is None:
+            bounds = [None] * len(chunks)
+
+        self._chunks: list[_Chunk] = []
+        inferred_units = None
+
+        for source, chunk_bounds in zip(chunks, bounds):
+            if chunk_bounds is not None:
+                start, stop = chunk_bounds
+
+            elif isinstance(source, TimeSeries):
+                start, stop = source.start, source.stop
+                inferred_units = inferred_units or source.units
+
+            elif isinstance(source, (str, os.PathLike)):
+                header, _ = _binary_format.read_header(source)
+                state = _binary_format.header_to_state(header)
+                start, stop = state["start"], state["stop"]
+                inferred_units = inferred_units or _units.parse_units(state["units"])
+
+            else:
+                raise ValueError("The bounds of chunks that are loaded lazily must be provided!")
+
+            if self._chunks and start < self._chunks[-1].start:
+                raise ValueError("Chunks must be in chronological order!")
+
+            self._chunks.append(_Chunk(source, start, stop))
+
+        if units is None:
+            if inferred_units is None:
+                raise ValueError("Units must be provided when every chunk is loaded lazily!")
+
+            units = inferred_units
+
+        self._units: Unit = _units.parse_units(units) if isinstance(units, str) else units
+        self._meta: dict = meta if meta is not None else {}
+
+    @staticmethod
+    def from_time_series(time_series: TimeSeries, chunk_duration: float | datetime.timedelta):
+        """
+        Split a TimeSeries into chunks spanning ``chunk_duration``. Chunks are views which share memory
+        with ``time_series``.
+
+        :param TimeSeries time_series: the TimeSeries to split
+        :param float | datetime.timedelta chunk_duration: the time, in seconds, spanned by each chunk
+        :return: ChunkedTimeSeries of the data
+        """
+        if isinstance(chunk_duration, datetime.timedelta):
+            chunk_duration = chunk_duration.total_seconds()
+
+        elements_per_chunk = max(round(chunk_duration / time_series.period), 1)
+        chunks = [time_series._view(i, min(i + elements_per_chunk, len(time_series)) - 1)
+                  for i in range(0, len(time_series), elements_per_chunk)]
+
+        return ChunkedTimeSeries(chunks, units=time_series.units, meta=time_series.meta)
+
+    @staticmethod
+    def open(directory: str | os.PathLike):
+        """
+        Open a ChunkedTimeSeries written by :meth:`save`. Only the header of each chunk is read,
+        and each chunk is memory-mapped when it is needed.
+
+        :param directory: the directory containing the chunks
+        :return: ChunkedTimeSeries of the data
+        """
+        paths = sorted(pathlib.Path(directory).glob("chunk_*.ts"))
+
+        if len(paths) == 0:
+            raise ValueError(f"{directory} does not contain any chunks!")
+
+        return ChunkedTimeSeries(paths)
+
+    def save(self, directory: str | os.PathLike) -> None:
+        """
+        Write every chunk into ``directory`` with :meth:`TimeSeries.save`, loading one chunk at a time.
+
+        :param directory: the directory that chunks will be written into, which is created if it does not exist
+        """
+        directory = pathlib.Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        for i, chunk in enumerate(self.chunks()):
+            chunk.save(directory / f"chunk_{i:06d}.ts")
+
+    @property
+    def ureg(self):
+        return ChunkedTimeSeries.UnitRegistry
+
+    @property
+    def units(self) -> Unit:
+        """
+        The units of the data
+        """
+        return self._units
+
+    @property
+    def meta(self) -> dict:
+        """
+        Metadata such as the field, measurement, and car.
+        """
+        return self._meta
+
+    @property
+    def bounds(self) -> list[tuple[datetime.datetime, datetime.datetime]]:
+        """
+        The start and stop time of each chunk.
+        """
+        return [(chunk.start, chunk.stop) for chunk in self._chunks]
+
+    @property
+    def start(self) -> datetime.datetime:
+        """
+        Datetime of the start of the first chunk
+        """
+        return self._chunks[0].start
+
+    @property
+    def stop(self) -> datetime.datetime:
+        """
+        Datetime of the end of the last chunk
+        """
+        return max(chunk.stop for chunk in self._chunks)
+
+    @property
+    def num_chunks(self) -> int:
+        """
+        The number of chunks.
+        """
+        return len(self._chunks)
+
+    def __repr__(self) -> str:
+        return f"ChunkedTimeSeries({len(self._chunks)} chunks, {self._units}, {self.start} – {self.stop})"
+
+    def _load(self, chunk: _Chunk) -> TimeSeries:
+        time_series = chunk.load()
+
+        if time_series.units != self._units:
+            time_series = time_series.convert_to(self._units)
+
+        return time_series
+
+    def chunks(self):
+        """
+        Iterate over the chunks, loading each one only as it is reached.
+
+        :return: generator of each chunk as a TimeSeries, in the units of this ChunkedTimeSeries
+        """
+        for chunk in self._chunks:
+            yield self._load(chunk)
+
+    def _overlapping(self, start: datetime.datetime, stop: datetime.datetime) -> list[_Chunk]:
+        """
+        Find the chunks which overlap the time between ``start`` and ``stop``.
+        """
+        # Chunks are sorted by start time, so only those which start before ``stop`` can overlap
+        last = bisect.bisect_right([chunk.start for chunk in self._chunks], stop)
+
+        return [chunk for chunk in self._chunks[:last] if chunk.stop >= start]
+
+    def slice(self, start_time: datetime.datetime, end_time: datetime.datetime) -> TimeSeries:
+        """
+        Obtain the data between ``start_time`` and ``end_time`` as a single TimeSeries, loading only the chunks
+        which overlap it. Any gaps between chunks are filled with NaN.
+
+        :param datetime.datetime start_time: The start datetime to slice with
+        :param datetime.datetime end_time: The end datetime to slice with
+        :raises ValueError: if no chunk overlaps the slice
+        :return TimeSeries: the data within the slice
+        """
+        pieces = []
+        for chunk in self._overlapping(start_time, end_time):
+            piece = self._load(chunk).slice(start_time, end_time)
+
+            if len(piece) > 0:
+                pieces.append(piece)
+
+        if len(pieces) == 0:
+            raise ValueError("Slice does not overlap any chunk!")
+
+        if len(pieces) == 1:
+            return pieces[0]
+
+        contiguous = all(
+            math.isclose(a.period, b.period) and
+            math.isclose((b.start - a.stop).total_seconds(), a.period, rel_tol=1e-6)
+            for a, b in zip(pieces, pieces[1:])
+        )
+
+        if not contiguous:
+            return TimeSeries.merge(*pieces, fill_value=np.nan)
+
+        return TimeSeries(np.concatenate(pieces),
+                          pieces[0].start,
+                          pieces[-1].stop,
+                          pieces[0].period,
+                          (pieces[-1].stop - pieces[0].start).total_seconds(),
+                          self._units,
+                          self._meta)
+
+    def count(self) -> int:
+        """
+        The number of data elements in every chunk.
+        """
+        return sum(len(chunk) for chunk in self.chunks())
+
+    def sum(self) -> float:
+        """
+        The sum of every data element.
+        """
+        return float(sum(np.sum(chunk, dtype=float) for chunk in self.chunks()))
+
+    def mean(self) -> float:
+        """
+        The mean of every data element, computed in one pass over the chunks, or NaN if every chunk is empty.
+        """
+        total = 0.0
+        count = 0
+        for chunk in self.chunks():
+            total += np.sum(chunk, dtype=float)
+            count += len(chunk)
+
+        return total / count if count > 0 else np.nan
+
+    def min(self) -> float:
+        """
+        The minimum of every data element, or NaN if every chunk is empty.
+        """
+        return float(min((np.min(chunk) for chunk in self.chunks() if len(chunk) > 0), default=np.nan))
+
+    def max(self) -> float:
+        """
+        The maximum of every data element, or NaN if every chunk is empty.
+        """
+        return float(max((np.max(chunk) for chunk in self.chunks() if len(chunk) > 0), default=np.nan))
+
+    def stats(self) -> SeriesStats:
+        """
+        The descriptive statistics of every data element, computed in one pass over the chunks by merging
+        the statistics of each chunk. See :meth:`TimeSeries.stats`.
+        """
+        stats = SeriesStats.of(np.empty(0), 0.0, 1.0, self._units)
+        for chunk in self.chunks():
+            stats = stats.merge(chunk.stats())
+
+        return stats
+
+    def integral(self, units: Unit | str = None) -> float:
+        """
+        The integral of the data with respect to time by the trapezoidal rule, computed in one pass over the chunks.
+        Adjacent chunks are integrated across the period between them, while larger gaps are skipped.
+
+        :param str | Unit units: the units of the result, defaults to the units of this series multiplied by seconds
+        :raises ValueError: if ``units`` is not compatible with the units of this series multiplied by time
+        :return: the integral in ``units``
+        """
+        integral_units = _units.multiply_units(self._units, self.ureg.second)
+        if units is None:
+            units = integral_units
+        elif isinstance(units, str):
+            units = _units.parse_units(units)
+
+        if not _units.is_compatible(integral_units, units):
+            raise ValueError(f"Incompatible units: {integral_units} and {units}")
+
+        total = 0.0
+        previous = None
+        for chunk in self.chunks():
+            if len(chunk) == 0:
+                continue
+
+            values = chunk.view(np.ndarray)
+            total += chunk.period * (np.sum(values, dtype=float) - (values[0] + values[-1]) / 2)
+
+            # Bridge the period between this chunk and the previous one if they are adjacent
+            if previous is not None:
+                previous_stop, previous_value, previous_period = previous
+                gap = (chunk.start - previous_stop).total_seconds()
+
+                if gap <= max(previous_period, chunk.period) * (1 + 1e-6):
+                    total += gap * (previous_value + values[0]) / 2
+
+            previous = (chunk.stop, values[-1], chunk.period)
+
+        return total * _units.conversion_factor(integral_units, units)
+
+    def _apply(self, operation, other):
+        """
+        Lazily apply a binary ``operation`` to every chunk and ``other``, which may be a ChunkedTimeSeries
+        with the same bounds. The units of the result are determined by applying ``operation`` to
+        single-element TimeSeries in the units of each operand, so that they match the unit handling of ``TimeSeries``.
+        """
+        probe_time = datetime.datetime.fromtimestamp(0, datetime.timezone.utc)
+
+        def probe(units: Unit) -> TimeSeries:
+            return TimeSeries(np.ones(1), probe_time, probe_time, 1.0, 0.0, units)
+
+        # TimeSeries operands are probed by their units alone, as they need not overlap the probe in time
+        other_probe = probe(other.units) if isinstance(other, (ChunkedTimeSeries, TimeSeries)) else other
+        units = operation(probe(self._units), other_probe).units
+
+        if isinstance(other, ChunkedTimeSeries):
+            if other.bounds != self.bounds:
+                raise ValueError("ChunkedTimeSeries must have the same chunk bounds!")
+
+            sources = [lambda a=a, b=b: operation(self._load(a), other._load(b))
+                       for a, b in zip(self._chunks, other._chunks)]
+
+        else:
+            sources = [lambda a=a: operation(self._load(a), other) for a in self._chunks]
+
+        return ChunkedTimeSeries(sources, self.bounds, units, self._meta)
+
+    def __add__(self, other):
+        return self._apply(lambda a, b: a + b, other)
+
+    def __sub__(self, other):
+        return self._apply(lambda a, b: a - b, other)
+
+    def __mul__(self, other):
+        return self._apply(lambda a, b: a * b, other)
+
+    def __truediv__(self, other):
+        return self._apply(lambda a, b: a / b, other)
+
+    def __radd__(self, other):
+        return self._apply(lambda a, b: b + a, other)
+
+    def __rsub__(self, other):
+        return self._apply(lambda a, b: b - a, other)
+
+    def __rmul__(self, other):
+        return self._apply(lambda a, b: b * a, other)
+
+    def __rtruediv__(self, other):
+        return self._apply(lambda a, b: b / a, other)
+
+    def convert_to(self, units: Unit | str):
+        """
+        Lazily convert every chunk to ``units``.
+
+        :param str | Unit units: the units to convert to
+        :return: ChunkedTimeSeries in ``units``
+        """
+        units = _units.parse_units(units) if isinstance(units, str) else units
+
+        if not _units.is_compatible(self._units, units):
+            raise ValueError(f"Incompatible units: {self._units} and {units}")
+
+        sources = [lambda chunk=chunk: self._load(chunk).convert_to(units) for chunk in self._chunks]
+
+        return ChunkedTimeSeries(sources, self.bounds, units, self._meta)
@@ -0,0 +1,266 @@
+import numpy as np
+import datetime
+import math
+from pint.registry import Unit
+
+from data_tools.collections.time_series import TimeSeries, _UNIT_MATCHING_UFUNCS
+from data_tools.collections._time_axis import TimeAxis
+from data_tools.collections import _units
+from data_tools import unit_registry
+
+
+# Elements evaluated at a time; small enough that every intermediate of an expression stays in cache
+_CHUNK_SIZE = 2 ** 14
+
+
+class LazyTimeSeries:
+    """
+    This class records element-wise arithmetic on ``TimeSeries`` as an expression tree, without evaluating it.
+
+    Units are resolved as each operation is recorded, with the same rules as ``TimeSeries`` arithmetic, and the
+    common x–axis of every TimeSeries in the expression is found once when it is evaluated. Evaluation then
+    proceeds in chunks of elements, fusing every operation on a chunk before moving on to the next, so that no
+    intermediate result is ever materialized in full.
+
+    Obtain one with :meth:`TimeSeries.lazy`, and evaluate it with :meth:`evaluate`.
+    """
+    UnitRegistry = unit_registry
+
+    def __init__(self, ufunc, operands: tuple, units: Unit, template: TimeSeries):
+        """
+        :param ufunc: the ufunc applied to ``operands``, or ``None`` if ``operands`` is a single TimeSeries
+        :param tuple operands: LazyTimeSeries, or scalars already in the units that ``ufunc`` expects
+        :param Unit units: the units of the result
+        :param TimeSeries template: the TimeSeries whose metadata and timezone the result will carry
+        """
+        self._ufunc = ufunc
+        self._operands: tuple = operands
+        self._units: Unit = units
+        self._template: TimeSeries = template
+
+    @staticmethod
+    def leaf(ts: TimeSeries):
+        """
+        Begin an expression with ``ts``.
+        """
+        return LazyTimeSeries(None, (ts,), ts.units, ts)
+
+    @property
+    def ureg(self):
+        return LazyTimeSeries.UnitRegistry
+
+    @property
+    def units(self) -> Unit:
+        """
+        The units that the expression will evaluate to.
+        """
+        return self._units
+
+    @property
+    def leaves(self) -> list[TimeSeries]:
+        """
+        Every TimeSeries in the expression, in the order they appear.
+        """
+        if self._ufunc is None:
+            return [self._operands[0]]
+
+        return [ts for operand in self._operands if isinstance(operand, LazyTimeSeries) for ts in operand.leaves]
+
+    def __repr__(self) -> str:
+        if self._ufunc is None:
+            field = (self._template.meta or {}).get("field", "TimeSeries")
+            return f"{field}[{self._units}]"
+
+        operands = ", ".join(repr(operand) for operand in self._operands)
+
+        return f"{self._ufunc.__name__}({operands})"
+
+    def _with(self, ufunc, *operands, units: Unit = None):
+        return LazyTimeSeries(ufunc, operands, units if units is not None else self._units, self._template)
+
+    def _operand(self, other):
+        """
+        Unpack ``other`` into an operand of the expression, and its units (``None`` for unitless scalars).
+        """
+        if isinstance(other, LazyTimeSeries):
+            return other, other.units
+
+        if isinstance(other, TimeSeries):
+            return LazyTimeSeries.leaf(other), other.units
+
+        if isinstance(other, self.ureg.Quantity):
+            return other.magnitude, other.units
+
+        return other, None
+
+    def _converted(self, other):
+        """
+        Unpack ``other`` into an operand in the units of this expression, as for addition and subtraction.
+        """
+        operand, units = self._operand(other)
+
+        if units is None or units == self._units:
+            return operand
+
+        if not _units.is_compatible(self._units, units):
+            raise ValueError(f"Incompatible units: {self._units} and {units}")
+
+        factor = _units.conversion_factor(units, self._units)
+
+        if isinstance(operand, LazyTimeSeries):
+            return operand._with(np.multiply, operand, factor, units=self._units)
+
+        return operand * factor
+
+    def __add__(self, other):
+        return self._with(np.add, self, self._converted(other))
+
+    def __sub__(self, other):
+        return self._with(np.subtract, self, self._converted(other))
+
+    def __mul__(self, other):
+        operand, units = self._operand(other)
+
+        return self._with(np.multiply, self, operand,
+                          units=_units.multiply_units(self._units, units) if units is not None else None)
+
+    def __truediv__(self, other):
+        operand, units = self._operand(other)
+
+        return self._with(np.true_divide, self, operand,
+                          units=_units.divide_units(self._units, units) if units is not None else None)
+
+    def __radd__(self, other):
+        return self.__add__(other)
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    def __rsub__(self, other):
+        return self._with(np.subtract, self._converted(other), self)
+
+    def __rtruediv__(self, other):
+        operand, units = self._operand(other)
+        units = units if units is not None else self.ureg.dimensionless
+
+        return self._with(np.true_divide, operand, self, units=_units.divide_units(units, self._units))
+
+    def __neg__(self):
+        return self._with(np.negative, self)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        # Only element-wise calls can be fused; anything else must be evaluated first
+        if method != "__call__" or ufunc.nout != 1 or kwargs:
+            return NotImplemented
+
+        if any(isinstance(x, self.ureg.Quantity) for x in inputs):
+            return NotImplemented
+
+        operands = [self._operand(x) for x in inputs]
+        template = next(x for x in inputs if isinstance(x, (LazyTimeSeries, TimeSeries)))
+        template = template if isinstance(template, LazyTimeSeries) else LazyTimeSeries.leaf(template)
+
+        # Units follow the same rules as applying the ufunc to TimeSeries directly
+        if ufunc in _UNIT_MATCHING_UFUNCS:
+            operands = [(template._converted(operand), units) for operand, units in operands]
+
+        input_units = [units for _, units in operands]
+        units = TimeSeries._ufunc_units(template._template, ufunc, method, inputs, input_units, template)
+
+        return template._with(ufunc, *(operand for operand, _ in operands), units=units)
+
+    def evaluate(self, chunk_size: int = _CHUNK_SIZE) -> TimeSeries:
+        """
+        Evaluate the expression onto the x–axis spanning the time where every TimeSeries in it overlaps, at the
+        finest period amongst them. TimeSeries which do not lie on that axis are re-interpolated one chunk at a time.
+
+        :param int chunk_size: the number of elements evaluated at a time
+        :raises ValueError: if the TimeSeries in the expression do not overlap
+        :return: TimeSeries of the result
+        """
+        leaves = self.leaves
+        axis = TimeSeries.common_axis(*leaves)
+
+        sources = {id(ts): _Source(ts, axis) for ts in leaves}
+        scratch: dict = {}
+
+        result = None
+        for start in range(0, len(axis), chunk_size):
+            stop = min(start + chunk_size, len(axis))
+            out = result[start:stop] if result is not None else None
+
+            chunk = self._evaluate_chunk(sources, scratch, start, stop, out)
+
+            # The dtype of the result is only known once the first chunk is evaluated
+            if result is None:
+                result = np.empty(len(axis), dtype=np.result_type(chunk))
+                result[start:stop] = chunk
+
+        if result is None:
+            result = np.empty(0)
+
+        tz = self._template.start.tzinfo
+
+        return TimeSeries(result,
+                          datetime.datetime.fromtimestamp(axis.start, tz),
+                          datetime.datetime.fromtimestamp(axis.stop, tz),
+                          axis.period,
+                          axis.length,
+                          self._units,
+                          self._template.meta)
+
+    def _evaluate_chunk(self, sources: dict, scratch: dict, start: int, stop: int, out: np.ndarray = None):
+        """
+        Evaluate the elements from ``start`` to ``stop`` (exclusive) of the expression, writing into ``out``
+        if it is given and otherwise into a buffer which is re-used for every chunk.
+        """
+        if self._ufunc is None:
+            values = sources[id(self._operands[0])].values(start, stop)
+            if out is None:
+                return values
+
+            out[...] = values
+            return out
+
+        operands = [operand._evaluate_chunk(sources, scratch, start, stop)
+                    if isinstance(operand, LazyTimeSeries) else operand for operand in self._operands]
+
+        if out is None:
+            buffer = scratch.get(id(self))
+            if buffer is not None and len(buffer) >= stop - start:
+                out = buffer[:stop - start]
+
+        if out is not None:
+            return self._ufunc(*operands, out=out)
+
+        # Buffers are allocated by the first chunk, which is the largest
+        result = self._ufunc(*operands)
+        scratch[id(self)] = result
+
+        return result
+
+
+class _Source:
+    """
+    Reads chunks of a TimeSeries on the x–axis of an expression, as views where the TimeSeries lies on
+    the axis and re-interpolated otherwise.
+    """
+    def __init__(self, ts: TimeSeries, axis: TimeAxis):
+        self._ts: TimeSeries = ts
+        self._axis: TimeAxis = axis
+        self._buffer: np.ndarray = None
+
+        offset = (axis.start - ts.start.timestamp()) / ts.period
+        self._on_grid: bool = math.isclose(axis.period, ts.period, rel_tol=1e-9) and abs(offset - round(offset)) < 1e-6
+        self._offset: int = round(offset)
+
+    def values(self, start: int, stop: int) -> np.ndarray:
+        if self._on_grid:
+            return self._ts.view(np.ndarray)[self._offset + start:self._offset + stop]
+
+        if self._buffer is None or len(self._buffer) < stop - start:
+            self._buffer = np.empty(stop - start, dtype=np.result_type(self._ts.dtype, np.float32))
+
+        chunk_axis = TimeAxis(self._axis.start + start * self._axis.period, self._axis.period, stop - start)
+
+        return self._ts.interpolate_onto(chunk_axis, out=self._buffer[:stop - start])
@@ -0,0 +1,326 @@
+import numpy as np
+import pandas as pd
+import datetime
+from pint.registry import Unit
+
+from data_tools.collections.time_series import TimeSeries, as_nanoseconds, ASOF_DIRECTIONS
+from data_tools.collections import _units
+from data_tools import unit_registry
+
+
+def _to_nanoseconds(times) -> np.ndarray:
+    """
+    Convert a datetime, a sequence of datetimes, or anything accepted by :func:`as_nanoseconds`, into integer
+    nanoseconds since the UNIX epoch.
+    """
+    if isinstance(times, datetime.datetime):
+        return np.asarray(pd.Timestamp(times).value, dtype=np.int64)
+
+    times = np.asarray(times)
+    if times.dtype == object:
+        return pd.to_datetime(times.reshape(-1), utc=True).asi8.reshape(times.shape)
+
+    return as_nanoseconds(times)
+
+
+class RawSeries:
+    """
+    This class encapsulates irregularly-spaced time-series data with units and metadata, keeping the
+    original timestamps of each data point rather than resampling onto an evenly-spaced grid.
+
+    Timestamps are stored as 64-bit nanoseconds since the UNIX epoch, and values in a configurable dtype, so that
+    sparse signals such as ``BrakePressed`` are stored compactly. Conversion into a ``TimeSeries`` only happens when a regular grid is
+    requested with :meth:`to_time_series`.
+
+    As with ``TimeSeries``, wherever times are given as numbers, both integers and floats are UNIX timestamps in
+    seconds. Nanosecond timestamps must be given as ``datetime64``.
+    """
+    UnitRegistry = unit_registry
+
+    def __init__(self,
+                 timestamps: np.ndarray,
+                 values: np.ndarray,
+                 units: Unit | str = "",
+                 meta: dict = None,
+                 dtype: np.dtype | str = None,
+                 timezone: datetime.tzinfo = datetime.timezone.utc):
+        """
+        :param np.ndarray timestamps: sorted times of each data point, as ``datetime64``, or integer or
+            floating-point UNIX timestamps in seconds.
+        :param np.ndarray values: data points
+        :param str | Unit units: units of the data
+        :param dict meta: metadata such as the field, measurement, and car
+        :param np.dtype | str dtype: dtype that values will be stored as, defaults to the dtype of ``values``
+        :param datetime.tzinfo timezone: timezone of datetimes produced by this series
+        :raises ValueError: if ``timestamps`` and ``values`` differ in length, or ``timestamps`` are not sorted
+        """
+        timestamps_ns = np.ascontiguousarray(as_nanoseconds(timestamps).reshape(-1))
+        values = np.ascontiguousarray(np.asarray(values, dtype=dtype).reshape(-1))
+
+        if len(timestamps_ns) != len(values):
+            raise ValueError(f"Got {len(timestamps_ns)} timestamps but {len(values)} values!")
+
+        if np.any(np.diff(timestamps_ns) < 0):
+            raise ValueError("Timestamps must be sorted!")
+
+        self._times: np.ndarray = timestamps_ns
+        self._values: np.ndarray = values
+        self._units: Unit = _units.parse_units(units) if isinstance(units, str) else units
+        self._meta: dict = meta if meta is not None else {}
+        self._timezone: datetime.tzinfo = timezone
+
+        self._time_series_cache: dict = {}
+
+    @staticmethod
+    def from_query_dataframe(query_df: pd.DataFrame, field: str, units: Unit | str, dtype: np.dtype | str = None):
+        """
+        Create a RawSeries from the DataFrame resulting from an InfluxDB query, keeping the original timestamps.
+
+        :param pd.DataFrame query_df: DataFrame with "_time", "car", "_measurement", and ``field`` columns
+        :param str field: the column containing the data
+        :param str | Unit units: units of the data
+        :param np.dtype | str dtype: dtype that values will be stored as, defaults to the dtype of the column
+        :return: RawSeries of the data
+        """
+        timestamps = pd.DatetimeIndex(pd.to_datetime(query_df['_time'], utc=True)).tz_convert(None).to_numpy()
+
+        meta: dict = {
+            "car": query_df["car"].iat[0],
+            "measurement": query_df["_measurement"].iat[0],
+            "field": field
+        }
+
+        return RawSeries(timestamps, query_df[field].to_numpy(), units, meta, dtype)
+
+    def _with(self, timestamps_ns: np.ndarray, values: np.ndarray, units: Unit = None):
+        """
+        Build a RawSeries sharing the metadata of this one, without re-validating ``timestamps_ns``.
+        """
+        result = RawSeries.__new__(RawSeries)
+        result._times = timestamps_ns
+        result._values = values
+        result._units = units if units is not None else self._units
+        result._meta = self._meta
+        result._timezone = self._timezone
+        result._time_series_cache = {}
+
+        return result
+
+    @property
+    def times(self) -> np.ndarray:
+        """
+        Read-only view of the timestamps of each data point, as ``datetime64[ns]``.
+        """
+        times = self._times.view("datetime64[ns]")
+        times.flags.writeable = False
+
+        return times
+
+    @property
+    def values(self) -> np.ndarray:
+        """
+        Read-only view of the data points.
+        """
+        values = self._values.view()
+        values.flags.writeable = False
+
+        return values
+
+    @property
+    def units(self) -> Unit:
+        """
+        The units of the data
+        """
+        return self._units
+
+    @property
+    def meta(self) -> dict:
+        """
+        Metadata such as the field, measurement, and car.
+        """
+        return self._meta
+
+    @property
+    def dtype(self) -> np.dtype:
+        """
+        The dtype that values are stored as.
+        """
+        return self._values.dtype
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The number of bytes occupied by timestamps and values.
+        """
+        return self._times.nbytes + self._values.nbytes
+
+    @property
+    def start(self) -> datetime.datetime:
+        """
+        Datetime of the first data point
+        """
+        return pd.Timestamp(self._times[0], tz="UTC").to_pydatetime().astimezone(self._timezone)
+
+    @property
+    def stop(self) -> datetime.datetime:
+        """
+        Datetime of the last data point
+        """
+        return pd.Timestamp(self._times[-1], tz="UTC").to_pydatetime().astimezone(self._timezone)
+
+    @property
+    def unix_times(self) -> np.ndarray:
+        """
+        The timestamps of each data point as UNIX timestamps in seconds.
+        """
+        return self._times / 1e9
+
+    @property
+    def datetimes(self) -> np.ndarray:
+        """
+        The timestamps of each data point as timezone-aware datetimes.
+        """
+        return pd.DatetimeIndex(self._times, tz="UTC").tz_convert(self._timezone).to_numpy()
+
+    def __getstate__(self) -> dict:
+        # Units are pickled as strings so that they are re-attached to the shared registry when unpickled,
+        # and cached conversions are not pickled at all
+        state = self.__dict__.copy()
+        state["_units"] = str(self._units)
+        state["_time_series_cache"] = {}
+
+        return state
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self._units = _units.parse_units(state["_units"])
+
+    def __len__(self) -> int:
+        return len(self._times)
+
+    def __repr__(self) -> str:
+        return f"RawSeries({len(self)} points, {self._units}, dtype={self.dtype})"
+
+    def slice(self, start: datetime.datetime | float, stop: datetime.datetime | float):
+        """
+        Obtain the data points with timestamps between ``start`` and ``stop``, inclusive, by binary search.
+        The result shares memory with this series.
+
+        :param datetime.datetime | float start: datetime, or UNIX timestamp in seconds, of the beginning of the slice
+        :param datetime.datetime | float stop: datetime, or UNIX timestamp in seconds, of the end of the slice
+        :return: RawSeries of the data points within the slice
+        """
+        start_index = np.searchsorted(self._times, _to_nanoseconds(start), side="left")
+        stop_index = np.searchsorted(self._times, _to_nanoseconds(stop), side="right")
+
+        return self._with(self._times[start_index:stop_index], self._values[start_index:stop_index])
+
+    def asof_indices(self, times, direction: str = "backward", tolerance: float | datetime.timedelta = None) -> np.ndarray:
+        """
+        Find, for each of ``times``, the index of the data point that was current as of that time.
+
+        :param times: the times to look up, as datetimes, ``datetime64``, or UNIX timestamps in seconds
+        :param str direction: "backward" to use the last data point at or before each time, "forward" to use the
+            first data point at or after each time, or "nearest" to use whichever is closer.
+        :param float | datetime.timedelta tolerance: the furthest, in seconds, a data point may be from the time
+            it is matched to, optional.
+        :raises ValueError: if ``direction`` is not recognized
+        :return: the index of the matching data point for each time, or -1 where there is no match
+        """
+        if direction not in ASOF_DIRECTIONS:
+            raise ValueError(f"Direction must be one of {ASOF_DIRECTIONS}, not {direction}!")
+
+        times_ns = _to_nanoseconds(times)
+        n = len(self._times)
+
+        backward = np.searchsorted(self._times, times_ns, side="right") - 1
+        forward = np.searchsorted(self._times, times_ns, side="left")
+
+        if direction == "backward":
+            indices = backward
+        elif direction == "forward":
+            indices = np.where(forward < n, forward, -1)
+        else:
+            never = np.iinfo(np.int64).max
+            backward_distance = np.where(backward >= 0, times_ns - self._times[np.maximum(backward, 0)], never)
+            forward_distance = np.where(forward < n, self._times[np.minimum(forward, n - 1)] - times_ns, never)
+            indices = np.where(backward_distance <= forward_distance, backward, np.where(forward < n, forward, -1))
+
+        if tolerance is not None:
+            if isinstance(tolerance, datetime.timedelta):
+                tolerance = tolerance.total_seconds()
+
+            distance = np.abs(self._times[np.maximum(indices, 0)] - times_ns)
+            indices = np.where(distance <= round(tolerance * 1e9), indices, -1)
+
+        return indices
+
+    def asof(self, times, direction: str = "backward", tolerance: float | datetime.timedelta = None,
+             fill_value=np.nan) -> np.ndarray:
+        """
+        Obtain the value that was current as of each of ``times``. See :meth:`asof_indices`.
+
+        :param fill_value: the value used where there is no matching data point, defaults to NaN
+        :return: the matching value for each time
+        """
+        indices = self.asof_indices(times, direction, tolerance)
+        values = self._values[np.maximum(indices, 0)] if len(self) > 0 else np.empty(indices.shape, self.dtype)
+
+        if np.all(indices >= 0):
+            return values
+
+        return np.where(indices >= 0, values, np.asarray(fill_value, dtype=np.result_type(values, fill_value)))
+
+    def join_asof(self, other, direction: str = "backward", tolerance: float | datetime.timedelta = None,
+                  fill_value=np.nan):
+        """
+        Sample ``other`` at the timestamps of this series. See :meth:`asof_indices`.
+
+        :param RawSeries | TimeSeries other: the series to sample
+        :return: RawSeries with the timestamps of this series and the values, units, and metadata of ``other``
+        """
+        values = other.asof(self.times, direction, tolerance, fill_value)
+
+        if isinstance(other, TimeSeries):
+            return RawSeries(self.times, values, other.units, other.meta, timezone=self._timezone)
+
+        result = other._with(self._times, values)
+        result._timezone = self._timezone
+
+        return result
+
+    def convert_to(self, units: Unit | str):
+        """
+        Convert the values of this series to ``units``.
+
+        :param str | Unit units: the units to convert to
+        :raises ValueError: if ``units`` is not compatible with the units of this series
+        :return: RawSeries in ``units``
+        """
+        if isinstance(units, str):
+            units = _units.parse_units(units)
+
+        if not _units.is_compatible(self._units, units):
+            raise ValueError(f"Incompatible units: {self._units} and {units}")
+
+        factor = _units.conversion_factor(self._units, units)
+
+        return self._with(self._times, self._values * factor, units)
+
+    def to_time_series(self, period: float = None) -> TimeSeries:
+        """
+        Re-interpolate this series onto an evenly-spaced grid. Results are cached per ``period``, and are frozen
+        (see :meth:`TimeSeries.freeze`) so that they cannot be modified through any of the references to them;
+        use ``ts.copy()`` to obtain a TimeSeries which can be modified.
+
+        :param float period: the desired time between elements in seconds, defaults to the median time between data points
+        :return: frozen TimeSeries of the data
+        """
+        if period is None:
+            period = float(np.median(np.diff(self._times))) / 1e9
+
+        if period not in self._time_series_cache:
+            self._time_series_cache[period] = TimeSeries.from_arrays(self.times, self._values, period, self._units,
+                                                                     self._timezone, self._meta).freeze()
+
+        return self._time_series_cache[period]
@@ -0,0 +1,329 @@
+import numpy as np
+import pandas as pd
+import datetime
+import math
+from pint.registry import Unit
+
+from data_tools.collections.time_series import TimeSeries, as_nanoseconds, as_storage_dtype
+from data_tools.collections import _units
+
+
+class SegmentedTimeSeries:
+    """
+    This class encapsulates time-series data with gaps, such as telemetry with dropouts between driving sessions.
+
+    Data is stored as a list of contiguous ``TimeSeries`` segments which lie on a shared, evenly-spaced grid,
+    so that no data is fabricated for, and no memory is spent on, the gaps between them.
+    """
+    # Arrays on the left of an operator defer to the reflected operators, rather than treating this as an element
+    __array_ufunc__ = None
+
+    def __init__(self, segments: list[TimeSeries], units: Unit | str = None, meta: dict = None):
+        """
+        :param list[TimeSeries] segments: non-overlapping segments, which will be sorted by their start time.
+            All segments must be in compatible units, and are converted to ``units``.
+        :param str | Unit units: units of the data, defaults to the units of the first segment
+        :param dict meta: metadata such as the field, measurement, and car; defaults to the metadata of the first segment
+        :raises ValueError: if there are no segments, or if segments overlap
+        """
+        if len(segments) == 0:
+            raise ValueError("At least one segment is required!")
+
+        segments = sorted(segments, key=lambda segment: segment.start)
+
+        for previous, segment in zip(segments, segments[1:]):
+            if segment.start <= previous.stop:
+                raise ValueError(f"Segments overlap at {segment.start}!")
+
+        if units is None:
+            units = segments[0].units
+
+        self._segments: list[TimeSeries] = [
+            segment if segment.units == units else segment.convert_to(units) for segment in segments
+        ]
+        self._units = self._segments[0].units
+        self._meta = meta if meta is not None else (segments[0].meta or {})
+
+    @staticmethod
+    def from_arrays(timestamps: np.ndarray,
+                    values: np.ndarray,
+                    period: float,
+                    units: Unit | str,
+                    max_gap: float,
+                    timezone: datetime.tzinfo = datetime.timezone.utc,
+                    meta: dict = None,
+                    dtype: np.dtype | str = None):
+        """
+        Create a SegmentedTimeSeries from raw arrays of (sorted) timestamps and values. Data is split
+        into segments wherever consecutive timestamps are more than ``max_gap`` seconds apart, and each segment
+        is re-interpolated onto a grid with a temporal granularity of ``period`` which is shared by all segments.
+
+        :param np.ndarray timestamps: times of each data point, as ``datetime64``, or integer or floating-point
+            UNIX timestamps in seconds.
+        :param np.ndarray values: data points
+        :param float period: the desired time between data points in seconds
+        :param str | Unit units: units of the data
+        :param float max_gap: the longest time, in seconds, between data points that will be interpolated across
+        :param datetime.tzinfo timezone: timezone of the start and stop times of each segment
+        :param dict meta: metadata for the data
+        :param np.dtype | str dtype: the dtype that data will be stored as, defaults to float64
+        :return: SegmentedTimeSeries of the data
+        """
+        timestamps_ns = as_nanoseconds(timestamps)
+        values = np.asarray(values, dtype=float).reshape(-1)
+        meta = meta if meta is not None else {}
+
+        # The grid shared by all segments is anchored to the first data point
+        origin_ns = timestamps_ns[0]
+        origin = pd.Timestamp(origin_ns, tz="UTC").to_pydatetime().astimezone(timezone)
+        relative_times = (timestamps_ns - origin_ns) / 1e9
+
+        gap_indices = np.flatnonzero(np.diff(relative_times) > max_gap) + 1
+        run_starts = np.concatenate(([0], gap_indices))
+        run_stops = np.concatenate((gap_indices, [len(relative_times)]))
+
+        segments = []
+        for run_start, run_stop in zip(run_starts, run_stops):
+            run_times = relative_times[run_start:run_stop]
+            run_values = values[run_start:run_stop]
+
+            # Grid elements that lie within this run of data
+            first_index = math.ceil(run_times[0] / period - 1e-9)
+            last_index = math.floor(run_times[-1] / period + 1e-9)
+
+            if last_index < first_index:
+                first_index = last_index = round(run_times[0] / period)
+
+            grid_times = np.arange(first_index, last_index + 1) * period
+            segment_start = origin + datetime.timedelta(seconds=first_index * period)
+            segment_length = (last_index - first_index) * period
+
+            segments.append(TimeSeries(as_storage_dtype(np.interp(grid_times, run_times, run_values), dtype),
+                                       segment_start,
+                                       segment_start + datetime.timedelta(seconds=segment_length),
+                                       period,
+                                       segment_length,
+                                       units,
+                                       meta))
+
+        return SegmentedTimeSeries(segments, meta=meta)
+
+    @staticmethod
+    def from_query_dataframe(query_df: pd.DataFrame, period: float, field: str, units: Unit | str, max_gap: float,
+                             dtype: np.dtype | str = None):
+        """
+        Create a SegmentedTimeSeries from the DataFrame resulting from an InfluxDB query.
+        See :meth:`from_arrays` for how data is segmented.
+
+        :param pd.DataFrame query_df: DataFrame with "_time", "car", "_measurement", and ``field`` columns
+        :param float period: the desired time between data points in seconds
+        :param str field: the column containing the data
+        :param str | Unit units: units of the data
+        :param float max_gap: the longest time, in seconds, between data points that will be interpolated across
+        :param np.dtype | str dtype: the dtype that data will be stored as, defaults to float64
+        :return: SegmentedTimeSeries of the data
+        """
+        timestamps = pd.DatetimeIndex(pd.to_datetime(query_df['_time'], utc=True)).tz_convert(None).to_numpy()
+
+        meta: dict = {
+            "car": query_df["car"].iat[0],
+            "measurement": query_df["_measurement"].iat[0],
+            "field": field
+        }
+
+        return SegmentedTimeSeries.from_arrays(timestamps, query_df[field].to_numpy(), period, units, max_gap,
+                                               meta=meta, dtype=dtype)
+
+    @property
+    def segments(self) -> list[TimeSeries]:
+        """
+        The contiguous segments of data, sorted by start time.
+        """
+        return list(self._segments)
+
+    @property
+    def units(self) -> Unit:
+        """
+        The units of the data
+        """
+        return self._units
+
+    @property
+    def meta(self) -> dict:
+        """
+        Metadata such as the field, measurement, and car.
+        """
+        return self._meta
+
+    @property
+    def period(self) -> float:
+        """
+        Get the (finest) period, in seconds, between data points of the segments.
+        """
+        return min(segment.period for segment in self._segments)
+
+    @property
+    def start(self) -> datetime.datetime:
+        """
+        Datetime of the first data element
+        """
+        return self._segments[0].start
+
+    @property
+    def stop(self) -> datetime.datetime:
+        """
+        Datetime of the last data element
+        """
+        return self._segments[-1].stop
+
+    def __getstate__(self) -> dict:
+        # Units are pickled as strings so that they are re-attached to the shared registry when unpickled
+        state = self.__dict__.copy()
+        state["_units"] = str(self._units)
+
+        return state
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self._units = _units.parse_units(state["_units"])
+
+    def __len__(self) -> int:
+        """
+        The number of data elements that are stored, which excludes gaps.
+        """
+        return sum(len(segment) for segment in self._segments)
+
+    def __iter__(self):
+        return iter(self._segments)
+
+    def __repr__(self) -> str:
+        return f"SegmentedTimeSeries({len(self._segments)} segments, {len(self)} elements, {self.start} – {self.stop})"
+
+    def shift(self, shift: float | datetime.timedelta):
+        """
+        Move every segment backwards or forwards in time without changing any data.
+
+        :param float | datetime.timedelta shift: The amount of seconds the series should be shifted
+        :return SegmentedTimeSeries: Shifted series
+        """
+        return SegmentedTimeSeries([segment.shift(shift) for segment in self._segments], self._units, self._meta)
+
+    def to_timeseries(self, fill_value: float = np.nan) -> tuple[TimeSeries, np.ndarray]:
+        """
+        Densify this data onto a single TimeSeries spanning every segment, filling gaps with ``fill_value``.
+
+        :param float fill_value: the value of elements within gaps, defaults to NaN
+        :return: the dense TimeSeries, and a boolean mask which is ``True`` for elements that are not within a gap
+        """
+        period = self.period
+        start = self.start.timestamp()
+        num_points = round((self.stop.timestamp() - start) / period) + 1
+
+        values = np.full(num_points, fill_value, dtype=float)
+        mask = np.zeros(num_points, dtype=bool)
+
+        for segment in self._segments:
+            offset = round((segment.start.timestamp() - start) / period)
+
+            if math.isclose(segment.period, period):
+                values[offset:offset + len(segment)] = segment
+                mask[offset:offset + len(segment)] = True
+            else:
+                # Segments at a coarser period are spread onto the finest grid
+                indices = offset + np.round(segment.x_axis / period).astype(np.intp)
+                values[indices] = segment
+                mask[indices] = True
+
+        length = (num_points - 1) * period
+        dense = TimeSeries(values, self.start, self.start + datetime.timedelta(seconds=length), period, length,
+                           self._units, self._meta)
+
+        return dense, mask
+
+    def count(self) -> int:
+        """
+        The number of valid (not within a gap) data elements.
+        """
+        return len(self)
+
+    def sum(self) -> float:
+        """
+        The sum of all valid data elements.
+        """
+        return float(sum(np.sum(segment) for segment in self._segments))
+
+    def mean(self) -> float:
+        """
+        The mean of all valid data elements.
+        """
+        return self.sum() / self.count()
+
+    def min(self) -> float:
+        """
+        The minimum of all valid data elements.
+        """
+        return float(min(np.min(segment) for segment in self._segments))
+
+    def max(self) -> float:
+        """
+        The maximum of all valid data elements.
+        """
+        return float(max(np.max(segment) for segment in self._segments))
+
+    def _apply(self, operation, other):
+        """
+        Apply a binary ``operation`` between every segment and ``other``. If ``other`` is a TimeSeries or
+        SegmentedTimeSeries, the result only exists where both have data.
+        """
+        if isinstance(other, TimeSeries):
+            other = SegmentedTimeSeries([other])
+
+        if not isinstance(other, SegmentedTimeSeries):
+            return SegmentedTimeSeries([operation(segment, other) for segment in self._segments])
+
+        # Sweep through both sorted lists of segments to find where they overlap
+        results = []
+        i = j = 0
+        while i < len(self._segments) and j < len(other._segments):
+            segment, other_segment = self._segments[i], other._segments[j]
+
+            overlap_start = max(segment.start, other_segment.start)
+            overlap_stop = min(segment.stop, other_segment.stop)
+
+            if overlap_start <= overlap_stop:
+                results.append(operation(segment.slice(overlap_start, overlap_stop),
+                                         other_segment.slice(overlap_start, overlap_stop)))
+
+            if segment.stop < other_segment.stop:
+                i += 1
+            else:
+                j += 1
+
+        if len(results) == 0:
+            raise ValueError("Segments do not overlap!")
+
+        return SegmentedTimeSeries(results)
+
+    def __add__(self, other):
+        return self._apply(lambda a, b: a + b, other)
+
+    def __sub__(self, other):
+        return self._apply(lambda a, b: a - b, other)
+
+    def __mul__(self, other):
+        return self._apply(lambda a, b: a * b, other)
+
+    def __truediv__(self, other):
+        return self._apply(lambda a, b: a / b, other)
+
+    def __radd__(self, other):
+        return self._apply(lambda a, b: b + a, other)
+
+    def __rsub__(self, other):
+        return self._apply(lambda a, b: b - a, other)
+
+    def __rmul__(self, other):
+        return self._apply(lambda a, b: b * a, other)
+
+    def __rtruediv__(self, other):
+        return self._apply(lambda a, b: b / a, other)
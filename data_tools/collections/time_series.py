@@ -1,21 +1,163 @@
 import numpy as np
+import os
 import datetime
 import matplotlib.pyplot as plt
 import math
 import pandas as pd
 import re
 import copy
+import fractions
+import hashlib
 from pint.registry import Unit
 
 
+from data_tools.collections._time_axis import TimeAxis
+from data_tools.collections._shared_memory import SharedTimeSeries
+from data_tools.collections._pyramid import Pyramid
+from data_tools.collections._series_stats import SeriesStats
+from data_tools.collections import _binary_format
+from data_tools.collections import _units
 from data_tools import unit_registry  # Important so that different TimeSeries don't experience registry errors
 
 
+# Ufuncs whose result has the same units as their (first) operand
+_UNIT_PRESERVING_UFUNCS = frozenset({
+    np.negative, np.positive, np.absolute, np.fabs, np.rint, np.floor, np.ceil, np.trunc, np.conjugate,
+    np.add, np.subtract, np.maximum, np.minimum, np.fmax, np.fmin, np.remainder, np.fmod, np.hypot,
+    np.copysign, np.nextafter, np.spacing,
+})
+
+# Ufuncs whose operands must share dimensionality, and which therefore convert other operands to the first's units
+_UNIT_MATCHING_UFUNCS = frozenset({
+    np.add, np.subtract, np.maximum, np.minimum, np.fmax, np.fmin, np.hypot, np.remainder, np.fmod,
+    np.greater, np.greater_equal, np.less, np.less_equal, np.equal, np.not_equal,
+})
+
+# Ufuncs whose result is a pure number (or truth value) regardless of units
+_DIMENSIONLESS_UFUNCS = frozenset({
+    np.greater, np.greater_equal, np.less, np.less_equal, np.equal, np.not_equal,
+    np.logical_and, np.logical_or, np.logical_xor, np.logical_not,
+    np.isnan, np.isinf, np.isfinite, np.signbit, np.sign,
+    np.exp, np.exp2, np.expm1, np.log, np.log2, np.log10, np.log1p,
+    np.sin, np.cos, np.tan, np.arcsin, np.arccos, np.arctan, np.arctan2,
+    np.sinh, np.cosh, np.tanh, np.arcsinh, np.arccosh, np.arctanh,
+    np.deg2rad, np.rad2deg,
+})
+
+# NumPy functions whose result lies on the same x–axis, and in the same units, as their first argument
+_GRID_PRESERVING_FUNCTIONS = frozenset({
+    np.copy, np.round, np.around, np.clip, np.nan_to_num, np.cumsum, np.nancumsum, np.real, np.fix,
+})
+
+# Time, in seconds, within which a time is considered to lie on an element of the grid; datetimes resolve to microseconds
+_GRID_TOLERANCE = 5e-7
+
+# Directions in which an as-of lookup searches for the data point matching each time
+ASOF_DIRECTIONS = ("backward", "forward", "nearest")
+
+
+def as_nanoseconds(timestamps: np.ndarray) -> np.ndarray:
+    """
+    Convert timestamps given as ``datetime64``, or as integer or floating-point UNIX timestamps in seconds,
+    into integer nanoseconds since the UNIX epoch.
+
+    :param np.ndarray timestamps: the timestamps to convert
+    :return: the timestamps as an array of ``int64``
+    """
+    timestamps = np.asarray(timestamps)
+
+    if np.issubdtype(timestamps.dtype, np.datetime64):
+        return timestamps.astype("datetime64[ns]").view(np.int64)
+    elif np.issubdtype(timestamps.dtype, np.integer):
+        return timestamps.astype(np.int64) * 1_000_000_000
+    else:
+        return np.rint(timestamps.astype(float) * 1e9).astype(np.int64)
+
+
+def as_storage_dtype(values: np.ndarray, dtype: np.dtype | str = None) -> np.ndarray:
+    """
+    Cast ``values`` to the storage ``dtype``, rounding to the nearest integer first when
+    storing floating-point data in an integer or boolean dtype.
+
+    :param np.ndarray values: the values to cast
+    :param np.dtype | str dtype: the storage dtype, such as "float32", "int16", or "bool".
+        If ``None``, ``values`` are returned as-is.
+    :return: ``values`` in ``dtype``
+    """
+    values = np.asarray(values)
+
+    if dtype is None:
+        return values
+
+    dtype = np.dtype(dtype)
+    if not np.issubdtype(dtype, np.inexact) and np.issubdtype(values.dtype, np.inexact):
+        values = np.rint(values)
+
+    return values.astype(dtype, copy=False)
+
+
+class _FrozenMeta(dict):
+    """
+    Read-only metadata of a frozen TimeSeries. Copies of it, and the metadata of TimeSeries derived from a frozen
+    TimeSeries, are ordinary, mutable dictionaries.
+    """
+    def _read_only(self, *args, **kwargs):
+        raise ValueError("The metadata of a frozen TimeSeries cannot be modified!")
+
+    __setitem__ = __delitem__ = __ior__ = clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self) -> dict:
+        return dict(self)
+
+    def __deepcopy__(self, memo) -> dict:
+        return copy.deepcopy(dict(self), memo)
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+
+def _freeze_value(value):
+    """
+    Recursively convert ``value`` into an immutable equivalent, where dictionaries become read-only,
+    lists become tuples, and sets become frozensets.
+    """
+    if isinstance(value, dict):
+        return _FrozenMeta({key: _freeze_value(item) for key, item in value.items()})
+
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_value(item) for item in value)
+
+    if isinstance(value, set):
+        return frozenset(value)
+
+    return value
+
+
+def _thawed(meta):
+    """
+    Obtain mutable metadata for a TimeSeries derived from one with ``meta``, which is copied if it was frozen.
+    """
+    return copy.deepcopy(meta) if isinstance(meta, _FrozenMeta) else meta
+
+
+def _rebuild_time_series(array: np.ndarray, state: dict):
+    """
+    Reconstruct a pickled TimeSeries from its data and metadata. See :meth:`TimeSeries.__reduce_ex__`.
+    """
+    result = array.view(TimeSeries)
+    result.__setstate__(state)
+
+    return result
+
+
 class TimeSeries(np.ndarray):
     """
     This class encapsulates time-series data with units, a temporal x–axis, and metadata.
 
     Data is homogenous and evenly-spaced, such that temporal period between subsequent elements is constant.
+
+    Wherever times are given as numbers, both integers and floats are UNIX timestamps in seconds. Times with
+    a finer resolution than floats can represent must be given as ``datetime64``.
     """
     UnitRegistry = unit_registry
 
@@ -35,6 +177,11 @@ class TimeSeries(np.ndarray):
         obj._period = period
         obj._length = length
         obj._meta = meta
+        obj._axis_cache = None
+        obj._pyramid = None
+        obj._frozen = False
+        obj._content_hash = None
+        obj._stats = None
         return obj
 
     def __array_finalize__(self, obj):
@@ -45,7 +192,12 @@ class TimeSeries(np.ndarray):
         self._units = getattr(obj, '_units', None)
         self._length = getattr(obj, '_length', None)
         self._period = getattr(obj, '_period', None)
-        self._meta = getattr(obj, '_meta', None)
+        self._meta = _thawed(getattr(obj, '_meta', None))
+        self._axis_cache = None
+        self._pyramid = None
+        self._frozen = False
+        self._content_hash = None
+        self._stats = None
 
     def __init__(self, input_array, 
                  start_time: datetime.datetime, 
@@ -72,7 +224,7 @@ class TimeSeries(np.ndarray):
         if units is None:
             self._units = self.ureg.dimensionless
         elif isinstance(units, str): # Eg. "meter/second**2" or "J"
-            self._units = self.ureg.parse_units(units)
+            self._units = _units.parse_units(units)
         elif isinstance(units, Unit):
             self._units = units
 
@@ -91,154 +243,475 @@ class TimeSeries(np.ndarray):
     def ureg(self):
         return TimeSeries.UnitRegistry
 
+    def __reduce_ex__(self, protocol):
+        """
+        Pickle the data as a plain ``ndarray``, which is transferred out-of-band under pickle protocol 5 when possible,
+        alongside the metadata of this TimeSeries. Units are pickled as strings, so that they are re-attached to
+        ``TimeSeries.UnitRegistry`` when unpickled rather than a registry private to the pickle.
+        """
+        return _rebuild_time_series, (self.view(np.ndarray), self.__getstate__())
+
+    def __reduce__(self):
+        return self.__reduce_ex__(2)
+
+    def __getstate__(self) -> dict:
+        return {
+            "start": self._start,
+            "stop": self._stop,
+            "period": self._period,
+            "length": self._length,
+            "units": str(self._units) if self._units is not None else None,
+            "meta": self._meta,
+            "frozen": self._frozen,
+        }
+
+    def __setstate__(self, state):
+        # Pickles of the bare ndarray state are restored by the ndarray itself
+        if not isinstance(state, dict):
+            return super().__setstate__(state)
+
+        self._start = state["start"]
+        self._stop = state["stop"]
+        self._period = state["period"]
+        self._length = state["length"]
+        self._units = _units.parse_units(state["units"]) if state["units"] is not None else None
+        self._meta = state["meta"]
+        self._axis_cache = None
+        self._pyramid = None
+        self._frozen = False
+        self._content_hash = None
+        self._stats = None
+
+        if state.get("frozen", False):
+            self.freeze()
+
+    def freeze(self):
+        """
+        Make this TimeSeries immutable, in place: its data becomes read-only, and its metadata and units can no
+        longer be modified. Frozen TimeSeries can be shared freely without defensive copies (``copy.copy`` and
+        ``copy.deepcopy`` return the TimeSeries itself), and their :attr:`content_hash` is computed only once.
+
+        If this TimeSeries is a view of another array, that array may still be modified through other
+        references to it, so freeze ``ts.copy()`` instead to guarantee that the data never changes.
+
+        :return TimeSeries: this TimeSeries
+        """
+        if self._frozen:
+            return self
+
+        self.setflags(write=False)
+        self._meta = _freeze_value(self._meta if self._meta is not None else {})
+        self._frozen = True
+
+        return self
+
+    @property
+    def frozen(self) -> bool:
+        """
+        Whether this TimeSeries has been made immutable by :meth:`freeze`.
+        """
+        return self._frozen
+
+    @property
+    def content_hash(self) -> str:
+        """
+        A digest of the data, x–axis, and units of this TimeSeries, but not its metadata, such that TimeSeries with
+        equal digests hold identical data on identical grids. Suitable as a key for memoizing derived results.
+
+        The digest is cached once this TimeSeries is frozen, and is re-computed on every access otherwise.
+        """
+        if self._content_hash is not None:
+            return self._content_hash
+
+        start_ns = round(self._start.timestamp() * 1e9) if self._start is not None else None
+        header = f"{self.dtype.str}|{self.shape}|{start_ns}|{self._period!r}|{self._units}"
+
+        digest = hashlib.blake2b(header.encode("utf-8"), digest_size=16)
+        digest.update(np.ascontiguousarray(self.view(np.ndarray)).view(np.uint8))
+
+        if self._frozen:
+            self._content_hash = digest.hexdigest()
+
+        return digest.hexdigest()
+
+    def stats(self) -> SeriesStats:
+        """
+        The count, sum, mean, standard deviation, minimum, maximum, and integral of this TimeSeries, computed in a
+        single pass over the data. The result is cached once this TimeSeries is frozen, so that repeated summaries
+        are O(1), and is re-computed on every call otherwise.
+
+        Statistics of slices or chunks of a series can be combined with :meth:`SeriesStats.merge`
+        and :meth:`SeriesStats.combine`.
+        """
+        if self._stats is not None:
+            return self._stats
+
+        stats = SeriesStats.of(self.view(np.ndarray),
+                               self._start.timestamp() if self._start is not None else 0.0,
+                               self._period,
+                               self._units)
+
+        if self._frozen:
+            self._stats = stats
+
+        return stats
+
+    def __copy__(self):
+        # Frozen TimeSeries cannot change, so they can share their data rather than copy it
+        return self if self._frozen else super().__copy__()
+
+    def __deepcopy__(self, memo):
+        return self if self._frozen else super().__deepcopy__(memo)
+
+    def to_shared(self) -> SharedTimeSeries:
+        """
+        Copy this TimeSeries into shared memory, so that other processes can attach to it without copying.
+
+        The returned handle can be pickled cheaply and sent to workers, which use :meth:`from_shared` to
+        obtain the TimeSeries. Use the handle as a context manager, or call its ``close`` method, to release
+        the shared memory once workers are finished.
+
+        >>> with pack_voltage.to_shared() as handle:
+        ...     results = list(executor.map(analyze_lap, itertools.repeat(handle), laps))
+
+        :return SharedTimeSeries: handle to the shared TimeSeries
+        """
+        return SharedTimeSeries(self.view(np.ndarray), self.__getstate__())
+
+    @staticmethod
+    def from_shared(handle: SharedTimeSeries):
+        """
+        Attach to a TimeSeries which was placed in shared memory by :meth:`to_shared`. No data is copied,
+        so writes to the result are visible to every process attached to it.
+
+        :param SharedTimeSeries handle: handle to the shared TimeSeries
+        :return TimeSeries: the shared TimeSeries, with its metadata intact
+        """
+        return _rebuild_time_series(handle.array(), handle.state)
+
+    def save(self, path: str | os.PathLike) -> None:
+        """
+        Atomically write this TimeSeries to ``path`` in a compact binary format, which can be
+        memory-mapped by :meth:`open`. Metadata must be JSON-serializable.
+
+        :param path: path to the file which will be written
+        :raises ValueError: if the metadata is not JSON-serializable
+        """
+        _binary_format.write(path, self.view(np.ndarray), self.__getstate__())
+
+    @staticmethod
+    def open(path: str | os.PathLike, mode: str = "r"):
+        """
+        Open a TimeSeries written by :meth:`save`. The data is memory-mapped rather than read, so opening
+        is instant regardless of the size of the file, and only the parts of the data which are accessed are read.
+
+        :param path: path to the file
+        :param str mode: "r" for read-only, "r+" to write changes through to the file, or "c" for copy-on-write
+        :raises ValueError: if the file is not a TimeSeries file, or if ``mode`` is not one of "r", "r+", or "c"
+        :return TimeSeries: the memory-mapped TimeSeries
+        """
+        array, state = _binary_format.read(path, mode)
+
+        return _rebuild_time_series(array, state)
+
+    def is_aligned_with(self, other) -> bool:
+        """
+        Determine if this TimeSeries and ``other`` share the same x–axis, such that
+        their elements correspond one-to-one without any re-interpolation.
+
+        :param TimeSeries other: the TimeSeries to compare against
+        """
+        if len(self) != len(other):
+            return False
+
+        if not math.isclose(self._period, other._period, rel_tol=1e-9):
+            return False
+
+        return math.isclose(self.start.timestamp(), other.start.timestamp(), rel_tol=0, abs_tol=self._period * 1e-6)
+
+    def _align_with(self, other) -> tuple:
+        """
+        Align this TimeSeries with ``other`` for an element-wise operation, skipping alignment
+        entirely if they already share the same x–axis.
+        """
+        if self.is_aligned_with(other):
+            return self, other
+
+        return TimeSeries.align(self, other)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, out=None, **kwargs):
+        # Find the TimeSeries whose x–axis and metadata the result will carry
+        template: TimeSeries = next(x for x in inputs + (out or ()) if isinstance(x, TimeSeries))
+
+        # Operands which handle ufuncs themselves, such as Quantity and LazyTimeSeries, produce the result instead
+        if any(not isinstance(x, np.ndarray) and hasattr(type(x), "__array_ufunc__") for x in inputs):
+            return NotImplemented
+
+        input_units = [x.units if isinstance(x, TimeSeries) else None for x in inputs]
+        args = [x.view(np.ndarray) if isinstance(x, TimeSeries) else x for x in inputs]
+
+        # Operands that must share dimensionality are converted to the units of the template
+        if method == "__call__" and ufunc in _UNIT_MATCHING_UFUNCS:
+            for i in range(len(args)):
+                if input_units[i] is None or input_units[i] == template.units:
+                    continue
+
+                if not _units.is_compatible(input_units[i], template.units):
+                    raise ValueError(f"Incompatible units: {template.units} and {input_units[i]}")
+
+                args[i] = args[i] * _units.conversion_factor(input_units[i], template.units)
+
+        if out is not None:
+            kwargs["out"] = tuple(x.view(np.ndarray) if isinstance(x, TimeSeries) else x for x in out)
+
+        results = getattr(ufunc, method)(*args, **kwargs)
+
+        if results is NotImplemented or method == "at":
+            return results
+
+        units = self._ufunc_units(ufunc, method, inputs, input_units, template)
+
+        if ufunc.nout == 1:
+            results = (results,)
+
+        wrapped = []
+        for i, result in enumerate(results):
+            if out is not None and isinstance(out[i], TimeSeries):
+                out[i]._units = units
+                wrapped.append(out[i])
+
+            # Reductions, and results that do not lie on the template's x–axis, lose their metadata
+            elif method in ("__call__", "accumulate") and TimeSeries._on_grid_of(result, template):
+                wrapped.append(template._wrap(result, units))
+
+            else:
+                wrapped.append(result[()] if isinstance(result, np.ndarray) and result.ndim == 0 else result)
+
+        return wrapped[0] if ufunc.nout == 1 else tuple(wrapped)
+
+    def _ufunc_units(self, ufunc, method, inputs, input_units, template) -> Unit:
+        """
+        Determine the units of the result of applying ``ufunc`` to ``inputs``.
+        Where the units are not well defined, the result keeps the units of ``template``.
+        """
+        dimensionless = self.ureg.dimensionless
+        units = [u if u is not None else dimensionless for u in input_units]
+
+        if method == "accumulate":
+            return template.units
+
+        if method != "__call__":
+            return template.units
+
+        if ufunc in _DIMENSIONLESS_UFUNCS:
+            return dimensionless
+
+        if ufunc in _UNIT_PRESERVING_UFUNCS:
+            return template.units
+
+        if ufunc is np.multiply:
+            return _units.multiply_units(units[0], units[1])
+
+        if ufunc in (np.divide, np.floor_divide):
+            return _units.divide_units(units[0], units[1])
+
+        if ufunc is np.reciprocal:
+            return _units.divide_units(dimensionless, units[0])
+
+        if ufunc is np.sqrt:
+            return _units.power_units(units[0], 0.5)
+
+        if ufunc is np.cbrt:
+            return _units.power_units(units[0], 1 / 3)
+
+        if ufunc is np.square:
+            return _units.power_units(units[0], 2)
+
+        if ufunc in (np.power, np.float_power) and input_units[0] is not None and np.ndim(inputs[1]) == 0:
+            return _units.power_units(units[0], float(inputs[1]))
+
+        return template.units
+
+    def __array_function__(self, func, types, args, kwargs):
+        result = super().__array_function__(func, types, args, kwargs)
+
+        if result is NotImplemented:
+            return result
+
+        template = args[0] if args and isinstance(args[0], TimeSeries) else self
+
+        if func in _GRID_PRESERVING_FUNCTIONS and TimeSeries._on_grid_of(result, template):
+            return template._wrap(result, template.units)
+
+        # Results that do not lie on the x–axis would carry misleading metadata
+        if isinstance(result, TimeSeries) and result.shape != template.shape:
+            return result.view(np.ndarray)
+
+        return result
+
+    @staticmethod
+    def _on_grid_of(result, template) -> bool:
+        """
+        Determine if ``result`` is an array with one element for each element of ``template``.
+        """
+        return isinstance(result, np.ndarray) and result.ndim > 0 and result.shape == template.shape
+
+    def _wrap(self, array: np.ndarray, units: Unit):
+        """
+        View ``array`` as a TimeSeries with the same x–axis and metadata as this TimeSeries, and
+        with ``units``. Unlike :meth:`promote`, no validation nor parsing is done.
+        """
+        result = array.view(TimeSeries)
+
+        result._start = self._start
+        result._stop = self._stop
+        result._period = self._period
+        result._length = self._length
+        result._meta = _thawed(self._meta)
+        result._units = units
+
+        return result
+
     def __add__(self, other):
         if isinstance(other, TimeSeries):
-            self_aligned, other_aligned = TimeSeries.align(self, other)
+            self_aligned, other_aligned = self._align_with(other)
 
             # Check dimensionalilty
-            if not self_aligned.units.dimensionality == other_aligned.units.dimensionality:
+            if not _units.is_compatible(self_aligned.units, other_aligned.units):
                 raise ValueError(
                     f"Incompatible units: {self_aligned.units} and {other_aligned.units}"
                 )
 
             # Convert other to self's units
-            factor = (1 * other_aligned.units).to(self_aligned.units).magnitude # 1 * unit turns it into a quanity rather than pure unit
+            factor = _units.conversion_factor(other_aligned.units, self_aligned.units)
             converted_other = np.asarray(other_aligned) * factor
 
-            raw_sum = np.ndarray.__add__(self_aligned, converted_other)
-
-            result: TimeSeries = self_aligned.promote(raw_sum)
+            result: TimeSeries = np.ndarray.__add__(self_aligned, converted_other)
             result._units = self_aligned.units
             return result
         
         elif isinstance(other, self.ureg.Quantity):
              # Check dimensionalilty
-            if not self.units.dimensionality == other.units.dimensionality:
+            if not _units.is_compatible(self.units, other.units):
                 raise ValueError(
                     f"Incompatible units: {self.units} and {other.units}"
                 )
 
             # Convert other to self's units
-            factor = (1 * other.units).to(self.units).magnitude # 1 * unit turns it into a quality rather than pure unit
+            factor = _units.conversion_factor(other.units, self.units)
             converted_other = other.magnitude * factor
 
-            raw_sum = np.ndarray.__add__(self, converted_other)
-
-            result: TimeSeries = self.promote(raw_sum)
+            result: TimeSeries = np.ndarray.__add__(self, converted_other)
             result._units = self.units
             return result
         
         else:
-            raw_sum = np.ndarray.__add__(self, other) # Assumption being that the added value is the same unit as the TimeSeries
-            result = self.promote(raw_sum)
+            result: TimeSeries = np.ndarray.__add__(self, other) # Assumption being that the added value is the same unit as the TimeSeries
+
+            # Operands which handle the operation themselves, such as ChunkedTimeSeries, produce their own result
+            if not isinstance(result, TimeSeries):
+                return result
+
             result._units = self.units
             return result
     
     def __sub__(self, other):
         if isinstance(other, TimeSeries):
             # Align time series
-            self_aligned, other_aligned = TimeSeries.align(self, other)
+            self_aligned, other_aligned = self._align_with(other)
 
             # Check dimensionality
-            if not self_aligned.units.dimensionality == other_aligned.units.dimensionality:
+            if not _units.is_compatible(self_aligned.units, other_aligned.units):
                 raise ValueError(
                     f"Incompatible units: {self_aligned.units} and {other_aligned.units}"
                 )
 
             # Convert other to self's units
-            factor = (1 * other_aligned.units).to(self_aligned.units).magnitude #  1 * unit turns it into a quality rather than pure unit
+            factor = _units.conversion_factor(other_aligned.units, self_aligned.units)
             converted_other = np.asarray(other_aligned) * factor
 
             # Perform subtraction
-            raw_sub = np.ndarray.__sub__(self_aligned, converted_other)
-
-            result = self_aligned.promote(raw_sub)
+            result: TimeSeries = np.ndarray.__sub__(self_aligned, converted_other)
             result._units = self_aligned.units
             return result
         
         elif isinstance(other, self.ureg.Quantity):
             
              # Check dimensionality
-            if not self.units.dimensionality == other.units.dimensionality:
+            if not _units.is_compatible(self.units, other.units):
                 raise ValueError(
                     f"Incompatible units: {self.units} and {other.units}"
                 )
 
             # Convert other to self's units
-            factor = (1 * other.units).to(self.units).magnitude # 1 * unit turns it into a quality rather than pure unit
+            factor = _units.conversion_factor(other.units, self.units)
             converted_other = other.magnitude * factor
 
-            raw_sum = np.ndarray.__sub__(self, converted_other)
-
-            result: TimeSeries = self.promote(raw_sum)
+            result: TimeSeries = np.ndarray.__sub__(self, converted_other)
             result._units = self.units
             return result
         
         else:
             # Scalar subtraction, assuming other is in the same units
-            raw_sub = np.ndarray.__sub__(self, other)
-            result = self.promote(raw_sub)
+            result: TimeSeries = np.ndarray.__sub__(self, other)
+            if not isinstance(result, TimeSeries):
+                return result
+
             result._units = self.units
             return result 
 
     def __mul__(self, other):
 
         if isinstance(other, TimeSeries): # If TimeSeries
-            self_aligned, other_aligned = TimeSeries.align(self, other)
+            self_aligned, other_aligned = self._align_with(other)
 
-            raw_product = np.ndarray.__mul__(self_aligned, other_aligned)
-
-            result = self_aligned.promote(raw_product)
+            result: TimeSeries = np.ndarray.__mul__(self_aligned, other_aligned)
 
             # Compose units
-            result._units = self_aligned.units * other_aligned.units
+            result._units = _units.multiply_units(self_aligned.units, other_aligned.units)
 
             return result
         
         elif isinstance(other, self.ureg.Quantity): # If Pint Quantity
-            raw_product = np.ndarray.__mul__(self, other.magnitude)
-
-            result = self.promote(raw_product)
+            result: TimeSeries = np.ndarray.__mul__(self, other.magnitude)
 
-            result._units = self.units * other.units
+            result._units = _units.multiply_units(self.units, other.units)
 
             return result
 
         else:
-            raw_product = np.ndarray.__mul__(self, other)
+            result: TimeSeries = np.ndarray.__mul__(self, other)
+            if not isinstance(result, TimeSeries):
+                return result
 
-            result = self.promote(raw_product)
             result._units = self.units
             return result
 
     def __truediv__(self, other):
         if isinstance(other, TimeSeries):
-            self_aligned, other_aligned = TimeSeries.align(self, other)
+            self_aligned, other_aligned = self._align_with(other)
 
-            raw_product = np.ndarray.__truediv__(self_aligned, other_aligned)
-
-            result = self_aligned.promote(raw_product)
+            result: TimeSeries = np.ndarray.__truediv__(self_aligned, other_aligned)
 
             # Compose units
-            result._units = self_aligned.units / other_aligned.units
+            result._units = _units.divide_units(self_aligned.units, other_aligned.units)
 
             return result
         
         elif isinstance(other, self.ureg.Quantity):
 
-            raw_product = np.ndarray.__truediv__(self, other.magnitude)
-
-            result = self.promote(raw_product)
+            result: TimeSeries = np.ndarray.__truediv__(self, other.magnitude)
 
             # Compose units
-            result._units = self.units/other.units
+            result._units = _units.divide_units(self.units, other.units)
 
             return result
 
         else:
-            raw_product = np.ndarray.__truediv__(self, other)
+            result: TimeSeries = np.ndarray.__truediv__(self, other)
+            if not isinstance(result, TimeSeries):
+                return result
 
-            result = self.promote(raw_product)
             result._units = self.units
             return result
         
@@ -250,8 +723,7 @@ class TimeSeries(np.ndarray):
     
     def __rsub__(self, other):
         # This might not be the wanted implementation, but its also really unintuitive to subtract a time series from an integer so I dont know what the desired output is
-        raw_sub =  np.ndarray.__sub__(self, other) # other - self = -(self - other)
-        result = -1 * self.promote(raw_sub)
+        result: TimeSeries = np.ndarray.__rsub__(self, other)  # other - self
         
         # Units for scalar - TimeSeries are typically -self.units
         result._units = self.units # Magnitude is negative, units remain same
@@ -263,35 +735,95 @@ class TimeSeries(np.ndarray):
         # This logic only triggers when the numerator is not a TimeSeries, meaning in this case it is only ever a unitless other (float or integer). 
         # Currently there is no implementation of multiplying or dividing by pint quantities    
 
-        raw_product = np.ndarray.__rtruediv__(self, other)
-        result = self.promote(raw_product)
-        result._units = 1 / self.units 
+        result: TimeSeries = np.ndarray.__rtruediv__(self, other)
+        result._units = _units.divide_units(self.ureg.dimensionless, self.units)
 
         return result
             
+    def lazy(self):
+        """
+        Begin a lazy expression with this TimeSeries. Arithmetic on the result is recorded rather than evaluated,
+        and evaluating it with :meth:`LazyTimeSeries.evaluate` aligns every operand once and fuses the operations
+        chunk by chunk, so that compound expressions do not allocate a full-size array for every intermediate.
+
+        Operations between two TimeSeries are evaluated immediately, as usual, unless one of them is lazy:
+        in ``v_a.lazy() * i_a + v_b * i_b``, the product ``v_b * i_b`` is computed eagerly.
+
+        :return LazyTimeSeries: the expression
+        """
+        from data_tools.collections.lazy_time_series import LazyTimeSeries
+
+        return LazyTimeSeries.leaf(self)
+
+    @property
+    def axis(self) -> TimeAxis:
+        """
+        Compact description of this wave's x–axis, which does not materialize any arrays.
+        """
+        return TimeAxis(self.start.timestamp(), self._period, len(self))
+
+    def _cached_axis(self, kind: str, key: tuple, materialize) -> np.ndarray:
+        """
+        Obtain a materialized x–axis of ``kind``, re-using the cached array if it was
+        materialized for the same ``key``.
+        """
+        if self._axis_cache is None:
+            self._axis_cache = {}
+
+        cached = self._axis_cache.get(kind)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        array = materialize()
+        array.setflags(write=False)
+        self._axis_cache[kind] = (key, array)
+
+        return array
+
+    def memory_usage(self, deep: bool = False) -> int:
+        """
+        Report the memory, in bytes, used by the data of this TimeSeries.
+
+        :param bool deep: also include any materialized x–axes and summary pyramid that are cached by this TimeSeries
+        :return: the number of bytes used
+        """
+        usage = self.nbytes
+
+        if deep and self._axis_cache is not None:
+            usage += sum(array.nbytes for _, array in self._axis_cache.values())
+
+        if deep and self._pyramid is not None:
+            usage += self._pyramid.nbytes
+
+        return usage
+
     @property
     def x_axis(self) -> np.ndarray:
         """
         This wave's x–axis in relative seconds, such that the first element is ``t=0``.
         """
-        relative_x_axis = np.linspace(0.0, self._length, len(self))
+        axis = TimeAxis(0.0, self._period, len(self))
 
-        return relative_x_axis
+        return self._cached_axis("relative", (self._period, len(self)), axis.relative)
 
     @property
     def unix_x_axis(self) -> np.ndarray:
         """
         This wave's x–axis as UTC UNIX timestamps.
         """
-        return self.x_axis + self.start.timestamp()
+        axis = self.axis
+
+        return self._cached_axis("unix", (axis.start, axis.period, len(axis)), axis.unix)
 
     @property
     def datetime_x_axis(self) -> np.ndarray:
         """
         This wave's x–axis as timezone-aware datetimes.
         """
+        axis = self.axis
         tz = self.start.tzinfo
-        return pd.to_datetime(self.unix_x_axis, unit='s', utc=True).tz_convert(tz).to_numpy()
+
+        return self._cached_axis("datetime", (axis.start, tz, axis.period, len(axis)), lambda: axis.datetimes(tz))
 
     @property
     def length(self) -> float:
@@ -323,11 +855,15 @@ class TimeSeries(np.ndarray):
 
             :param str new_unit: The unit the entire series will be translated to
             :raises ValueError: Cannot convert TimeSeries without units
+            :raises ValueError: if this TimeSeries is frozen
         """
+        if self._frozen:
+            raise ValueError("The units of a frozen TimeSeries cannot be modified!")
+
         if new_unit is None:
             self._units = self.ureg.dimensionless
         elif isinstance(new_unit, str): # Eg. "meter/second**2" or "J"
-            self._units = self.ureg.parse_units(new_unit)
+            self._units = _units.parse_units(new_unit)
         elif isinstance(new_unit, self.ureg.Unit):
             self._units = new_unit
         else:
@@ -357,30 +893,10 @@ class TimeSeries(np.ndarray):
             return super(TimeSeries, data_to_slice).__getitem__(index)
 
         elif isinstance(item, datetime.datetime):
-            unix_x_axis = data_to_slice.unix_x_axis
-            item_ts = item.timestamp()
-
-            start_timestamp: float = unix_x_axis[0]
-            stop_timestamp: float = unix_x_axis[-1]
-
-            if item_ts > stop_timestamp or item_ts < start_timestamp:
-                raise IndexError(
-                    f"Datetime {item} is out of bounds! "
-                    f"Range: [{datetime.datetime.fromtimestamp(start_timestamp)}, "
-                    f"{datetime.datetime.fromtimestamp(stop_timestamp)}]"
-                )
-            
             if item.tzinfo is None:
                 raise ValueError("The index does not have an assigned timezone!")
 
-            dt = stop_timestamp - start_timestamp
-
-            if dt == 0:
-                return data_to_slice[0]
-
-            interpolation_index = (item_ts - start_timestamp) * (len(data_to_slice) - 1)/dt
-
-            return data_to_slice.interpolate_indices(interpolation_index)
+            return data_to_slice.at(item)
 
         return super(TimeSeries, data_to_slice).__getitem__(item)
 
@@ -394,12 +910,21 @@ class TimeSeries(np.ndarray):
     @meta.setter
     def meta(self, new_meta: dict):
         assert isinstance(new_meta, dict), f"New metadata should be a dictionary, not {type(new_meta)}!"
+
+        if self._frozen:
+            raise ValueError("The metadata of a frozen TimeSeries cannot be modified!")
+
         self._meta = new_meta
 
-    def plot(self, show=True) -> None:
+    def plot(self, show=True, max_points: int = None) -> None:
         """
         Make a simple plot this data.
+
+        Long series are decimated through the summary pyramid (see :meth:`build_pyramid`) into the minimum and maximum
+        of blocks of elements, drawn as an envelope around the mean, so that peaks remain visible at any zoom.
+
         :param bool show: Show plots (disable if you want to stack multiple plots, for example).
+        :param int max_points: The most elements that will be drawn before decimating, defaults to the width of the axes in pixels.
         """
 
         fig, ax = plt.subplots()
@@ -407,133 +932,415 @@ class TimeSeries(np.ndarray):
         ax.set_title(f"{self.meta['measurement']}: {self.meta['field']}")
         ax.set_ylabel(self.units if self.units != "" else "Arbitrary Units")
         ax.set_xlabel("Time (s)")
-        ax.plot(self.datetime_x_axis, self, label=self.meta['field'])
+
+        if max_points is None:
+            max_points = int(ax.get_window_extent().width)
+
+        if len(self) <= max_points:
+            ax.plot(self.datetime_x_axis, self, label=self.meta['field'])
+
+        else:
+            pyramid = self.build_pyramid()
+            level = pyramid.level_within(max_points)
+            minimums, maximums, sums, counts = pyramid.level(level)
+
+            # Each block is drawn at the centre of the elements that it spans
+            block_size = pyramid.block_size(level)
+            block_starts = np.arange(len(counts)) * block_size
+            centres = (block_starts + np.minimum(block_starts + block_size, len(self)) - 1) / 2
+            times = pd.DatetimeIndex(np.rint((self.start.timestamp() + centres * self.period) * 1e9).astype(np.int64),
+                                     tz="UTC").tz_convert(self.start.tzinfo).to_numpy()
+
+            with np.errstate(invalid="ignore", divide="ignore"):
+                means = np.where(counts > 0, sums / counts, np.nan)
+
+            ax.fill_between(times, np.where(counts > 0, minimums, np.nan), np.where(counts > 0, maximums, np.nan),
+                            alpha=0.3, linewidth=0)
+            ax.plot(times, means, label=self.meta['field'])
 
         if show:
             plt.show()
 
-    def index_of(self, time: float) -> int:
+    def build_pyramid(self) -> Pyramid:
         """
-        Return the index of the data element that represents the time closest to ``time``.
+        Build, or obtain the cached, summary pyramid of this TimeSeries: the minimum, maximum, sum, and count
+        of every block of ``2**k`` elements. Requires about a quarter of the memory of float64 data.
 
-        :param float time: time (in seconds) that will be evaluated against
-        :raises: ValueError if ``time`` falls outside of x–axis
+        The pyramid is not updated if this TimeSeries is modified in place, so call :meth:`clear_pyramid` afterward.
+
+        :return: the summary pyramid
         """
-        if not (0.0 <= time <= self.length):
-            raise ValueError(f"Relative time {time} falls outside of x–axis!")
+        if self._pyramid is None:
+            self._pyramid = Pyramid(self.view(np.ndarray))
 
-        return np.argmin(np.abs(self.x_axis - time))
+        return self._pyramid
 
-    def relative_time(self, unix_time: float) -> float:
+    def clear_pyramid(self) -> None:
         """
-        Return the relative time of the UNIX timestamp ``time``.
-        :param float unix_time: UNIX timestamp that will be converted
+        Discard the cached summary pyramid of this TimeSeries, such as after modifying it in place.
         """
-        if not (self.start.timestamp() <= unix_time <= self.stop.timestamp()):
-            raise ValueError(f"UNIX time {unix_time} falls outside of x–axis, which is {self.start.timestamp()}–{self.stop.timestamp()}!")
+        self._pyramid = None
 
-        return unix_time - self.start.timestamp()
-
-    def promote(self, array: np.ndarray):
+    def range_stats(self, start_time: datetime.datetime, end_time: datetime.datetime) -> dict[str, float]:
         """
-        Promote a plain ndarray, ``array``, to a TimeSeries with the same properties
-        as this TimeSeries (start_time, stop_time, period, length, units, meta)
-
-        This method is particularly useful for interfacing
-        with libraries such as SciPy and NumPy, which will return an ndarray even when
-        given a TimeSeries.
+        Compute the minimum, maximum, mean, and count of the elements between two times, such as the peak
+        current during a lap, ignoring NaN. Answered from the summary pyramid in O(log n), which is built on first use.
 
-        :param array: plain ndarray to be promoted
-        :return: new, promoted TimeSeries with the same properties as this TimeSeries
+        :param datetime.datetime start_time: The start datetime of the range
+        :param datetime.datetime end_time: The end datetime of the range
+        :raises ValueError: if the range is invalid, with the same rules as :meth:`slice`
+        :return: dict with "min", "max", "mean", and "count", in the units of this TimeSeries
         """
-        meta: dict = self.meta
+        start_index, stop_index = self._window_indices([start_time], [end_time])
 
-        return TimeSeries(array, 
-                          self.start, 
-                          self.stop,  
-                          self.period, 
-                          self.length, 
-                          self.units,
-                          meta)
-    
-    def interpolate_indices(self, i: float) -> float:
-        """ Function which interpolates between the two nearest indices
+        minimum, maximum, total, count = self.build_pyramid().query(int(start_index[0]), int(stop_index[0]) + 1)
 
-        :param float i: floating index
+        return {
+            "min": minimum,
+            "max": maximum,
+            "mean": total / count if count > 0 else np.nan,
+            "count": count,
+        }
 
-        :return float: interpolated value
+    def at(self, times, method: str = "linear", fill_value=None):
         """
-        i1 = math.floor(i)
-        i2 = math.ceil(i)
+        Sample this TimeSeries at arbitrary times, such as GPS fix times or lap boundaries. Every time is
+        located on the evenly-spaced grid in closed form, so sampling ``m`` times is a single O(m) operation.
+
+        :param times: a datetime, or an array of datetimes, ``datetime64``, or UNIX timestamps in seconds
+        :param str method: "linear" to interpolate between the neighbouring elements, "nearest" to use the closest
+            element, or "previous" to use the last element at or before each time.
+        :param fill_value: the value used for times outside of the x–axis. If ``None``, such times raise an error.
+        :raises ValueError: if ``method`` is not recognized, or any datetime does not have an assigned timezone
+        :raises IndexError: if any time falls outside of the x–axis and ``fill_value`` is ``None``
+        :return: the value at each time, in the units of this TimeSeries, as a scalar if ``times`` is a single datetime
+        """
+        if method not in ("linear", "nearest", "previous"):
+            raise ValueError(f"Unknown interpolation method {method}! Must be one of 'linear', 'nearest', or 'previous'.")
 
-        inter = i - i1
+        positions = self._grid_positions(times)
+        values = self.view(np.ndarray)
+        last = len(self) - 1
 
-        value1 = self[i1]
-        value2 = self[i2]
+        # Times within a negligible fraction of a period of the ends of the x–axis are treated as lying on them
+        tolerance = 1e-6
+        outside = (positions < -tolerance) | (positions > last + tolerance)
+        if fill_value is None and np.any(outside):
+            raise IndexError(f"One or more times are out of bounds! Range: [{self.start}, {self.stop}]")
 
-        return value1*(1-inter) + value2*inter
-    
-    def slice(self, start_time: datetime.datetime, end_time: datetime.datetime):
-        """ This function returns all values between two given points, useful for filtering out data for specific dates or times. 
-        The returned series will not have the argument start_time and end_time, instead the returned series will align the start and end time to existing points
+        positions = np.clip(positions, 0, last)
 
-        :param datetime.datetime start_time: The start datetime to slice with
-        :param datetime.datetime end_time: The end datetime to slice with
+        if method == "linear" and last > 0:
+            lower = np.minimum(np.floor(positions).astype(np.intp), last - 1)
+            fraction = positions - lower
+            result = values[lower] * (1 - fraction) + values[lower + 1] * fraction
 
-        :raises ValueError: Naive inputs (Inputs do not have assigned timezones)
-        :raises ValueError: start_time is after stop_time
-        :raises ValueError: stop_time is before TimeSeries start time
-        :raises ValueError: start_time is after TimeSeries stop time
+        elif method == "previous":
+            result = values[np.floor(positions + tolerance).astype(np.intp)]
+
+        else:
+            result = values[np.ceil(positions - 0.5).astype(np.intp)]
+
+        if fill_value is not None and np.any(outside):
+            result = np.where(outside, np.asarray(fill_value, dtype=np.result_type(result, fill_value)), result)
+
+        return result[()] if np.ndim(result) == 0 else result
+
+    def asof_indices(self, times, direction: str = "backward", tolerance: float | datetime.timedelta = None) -> np.ndarray:
+        """
+        Find, for each of ``times``, the index of the element that was current as of that time. Like
+        :meth:`RawSeries.asof_indices`, but resolved in closed form from the evenly-spaced grid in O(m) for ``m`` times,
+        without materializing the x–axis.
+
+        :param times: a datetime, or an array of datetimes, ``datetime64``, or UNIX timestamps in seconds
+        :param str direction: "backward" to use the last element at or before each time, "forward" to use the
+            first element at or after each time, or "nearest" to use whichever is closer.
+        :param float | datetime.timedelta tolerance: the furthest, in seconds, an element may be from the time
+            it is matched to, optional.
+        :raises ValueError: if ``direction`` is not recognized
+        :return: the index of the matching element for each time, or -1 where there is no match
+        """
+        if direction not in ASOF_DIRECTIONS:
+            raise ValueError(f"Direction must be one of {ASOF_DIRECTIONS}, not {direction}!")
+
+        positions = self._grid_positions(times)
+        last = len(self) - 1
+
+        # Times within a negligible fraction of a period of an element are treated as lying on it
+        epsilon = 1e-6
+
+        if direction == "backward":
+            indices = np.floor(positions + epsilon).astype(np.intp)
+            indices = np.where(indices < 0, -1, np.minimum(indices, last))
+        elif direction == "forward":
+            indices = np.ceil(positions - epsilon).astype(np.intp)
+            indices = np.where(indices > last, -1, np.maximum(indices, 0))
+        else:
+            indices = np.clip(np.ceil(positions - 0.5).astype(np.intp), 0, last)
+
+        if tolerance is not None:
+            if isinstance(tolerance, datetime.timedelta):
+                tolerance = tolerance.total_seconds()
+
+            distance = np.abs(positions - indices) * self._period
+            indices = np.where((indices >= 0) & (distance <= tolerance + epsilon * self._period), indices, -1)
+
+        return indices
+
+    def asof(self, times, direction: str = "backward", tolerance: float | datetime.timedelta = None,
+             fill_value=np.nan) -> np.ndarray:
+        """
+        Obtain the value that was current as of each of ``times``. See :meth:`asof_indices`.
+
+        :param fill_value: the value used where there is no matching element, defaults to NaN
+        :return: the matching value for each time, in the units of this TimeSeries
+        """
+        indices = self.asof_indices(times, direction, tolerance)
+        values = self.view(np.ndarray)[np.maximum(indices, 0)]
+
+        if np.all(indices >= 0):
+            return values[()] if np.ndim(values) == 0 else values
+
+        result = np.where(indices >= 0, values, np.asarray(fill_value, dtype=np.result_type(values, fill_value)))
+
+        return result[()] if np.ndim(result) == 0 else result
+
+    def join_asof(self, other, direction: str = "backward", tolerance: float | datetime.timedelta = None,
+                  fill_value=np.nan):
+        """
+        Sample ``other`` at the times of the elements of this TimeSeries, such as pairing sparse brake presses
+        with telemetry, without re-interpolating either onto a common grid. See :meth:`asof_indices`.
+
+        :param TimeSeries | RawSeries other: the series to sample
+        :return: TimeSeries on the x–axis of this TimeSeries, with the values, units, and metadata of ``other``
+        """
+        values = other.asof(self.axis.nanoseconds().view("datetime64[ns]"), direction, tolerance, fill_value)
+
+        return TimeSeries(values,
+                          self.start,
+                          self.stop,
+                          self._period,
+                          self._length,
+                          other.units,
+                          copy.copy(other.meta))
+
+    def _grid_positions(self, times) -> np.ndarray:
+        """
+        Locate ``times`` on the x–axis as fractional indices, such that integral positions lie exactly on elements.
+        """
+        times = np.asarray(times, dtype=object if isinstance(times, datetime.datetime) else None)
+
+        if times.dtype == object:
+            if any(t.tzinfo is None for t in times.flat):
+                raise ValueError("One or more times do not have an assigned timezone!")
+
+            times = np.fromiter((t.timestamp() for t in times.flat), dtype=float, count=times.size).reshape(times.shape)
+
+        # Offsets are computed in integer nanoseconds, when possible, so that no precision is lost
+        if np.issubdtype(times.dtype, np.datetime64) or np.issubdtype(times.dtype, np.integer):
+            start_ns = round(self.start.timestamp() * 1e9)
+
+            return (as_nanoseconds(times) - start_ns) / (self._period * 1e9)
+
+        return (times.astype(float) - self.start.timestamp()) / self._period
+
+    def index_of(self, time: float) -> int:
+        """
+        Return the index of the data element that represents the time closest to ``time``.
+
+        The index is computed in closed form from this TimeSeries' period, so this is O(1).
+
+        :param float time: time (in seconds) that will be evaluated against
+        :raises: ValueError if ``time`` falls outside of x–axis
+        """
+        if not (0.0 <= time <= self.length):
+            raise ValueError(f"Relative time {time} falls outside of x–axis!")
+
+        return int(self._grid_index(time))
+
+    def indices_of(self, times: np.ndarray) -> np.ndarray:
+        """
+        Vectorized form of :meth:`index_of`. Return the indices of the data elements that represent
+        the times closest to each element of ``times``.
+
+        :param np.ndarray times: times (in seconds) that will be evaluated against
+        :raises: ValueError if any of ``times`` fall outside of x–axis
+        :return: array of integer indices with the same shape as ``times``
+        """
+        times = np.asarray(times, dtype=float)
+
+        if np.any((times < 0.0) | (times > self.length)):
+            raise ValueError("One or more relative times fall outside of x–axis!")
+
+        return self._grid_index(times)
+
+    def _grid_index(self, time, rounding: str = "nearest"):
+        """
+        Map relative time(s) onto element(s) of the evenly-spaced grid in closed form, such that
+        ``index = time / period`` rounded according to ``rounding``, one of "nearest", "floor" or "ceil".
+        Ties are resolved towards the earlier element when ``rounding`` is "nearest".
+
+        Times within half a microsecond (the resolution of datetimes) of an element are snapped onto it,
+        so that floating-point error such as ``2.3 / 0.1 = 22.999...`` does not drop elements on the edges.
+
+        No bounds checking is performed beyond clamping to valid indices.
+        """
+        fractional_index = np.asarray(time, dtype=float) / self._period
+
+        nearest_index = np.rint(fractional_index)
+        on_grid = np.abs(fractional_index - nearest_index) * self._period <= _GRID_TOLERANCE
+        fractional_index = np.where(on_grid, nearest_index, fractional_index)
+
+        if rounding == "nearest":
+            index = np.ceil(fractional_index - 0.5)
+        elif rounding == "floor":
+            index = np.floor(fractional_index)
+        elif rounding == "ceil":
+            index = np.ceil(fractional_index)
+        else:
+            raise ValueError(f"Unknown rounding mode {rounding}!")
+
+        return np.clip(index.astype(np.intp), 0, len(self) - 1)
+
+    def relative_time(self, unix_time: float | np.ndarray) -> float | np.ndarray:
+        """
+        Return the relative time of the UNIX timestamp ``time``.
+        :param float | np.ndarray unix_time: UNIX timestamp(s) that will be converted
+        """
+        start_timestamp = self.start.timestamp()
+        stop_timestamp = self.stop.timestamp()
+
+        if np.any((np.asarray(unix_time) < start_timestamp) | (np.asarray(unix_time) > stop_timestamp)):
+            raise ValueError(f"UNIX time {unix_time} falls outside of x–axis, which is {start_timestamp}–{stop_timestamp}!")
+
+        return unix_time - start_timestamp
+
+    def promote(self, array: np.ndarray):
+        """
+        Promote a plain ndarray, ``array``, to a TimeSeries with the same properties
+        as this TimeSeries (start_time, stop_time, period, length, units, meta)
+
+        This method is particularly useful for interfacing
+        with libraries such as SciPy and NumPy, which will return an ndarray even when
+        given a TimeSeries.
+
+        :param array: plain ndarray to be promoted
+        :return: new, promoted TimeSeries with the same properties as this TimeSeries
+        """
+        return self._wrap(np.asarray(array), self.units)
+    
+    def interpolate_indices(self, i: float) -> float:
+        """ Function which interpolates between the two nearest indices
+
+        :param float i: floating index
+
+        :return float: interpolated value
+        """
+        i1 = math.floor(i)
+        i2 = math.ceil(i)
+
+        inter = i - i1
+
+        value1 = self[i1]
+        value2 = self[i2]
+
+        return value1*(1-inter) + value2*inter
+    
+    def slice(self, start_time: datetime.datetime, end_time: datetime.datetime):
+        """ This function returns all values between two given points, useful for filtering out data for specific dates or times. 
+        The returned series will not have the argument start_time and end_time, instead the returned series will align the start and end time to existing points
+
+        The returned series is a view which shares memory with this TimeSeries, so no data is copied.
+
+        :param datetime.datetime start_time: The start datetime to slice with
+        :param datetime.datetime end_time: The end datetime to slice with
+
+        :raises ValueError: Naive inputs (Inputs do not have assigned timezones)
+        :raises ValueError: start_time is after stop_time
+        :raises ValueError: stop_time is before TimeSeries start time
+        :raises ValueError: start_time is after TimeSeries stop time
 
         :return TimeSeries: Returns a series with all values between start and stop time
         """
+        start_index, stop_index = self._window_indices([start_time], [end_time])
+
+        return self._view(int(start_index[0]), int(stop_index[0]))
+
+    def slice_many(self, windows) -> list:
+        """
+        Slice many windows out of this TimeSeries at once, such as every lap of a race day or a list of ``Event``.
+        The indices of every window are resolved together in one vectorized pass, and each returned
+        series is a view which shares memory with this TimeSeries.
+
+        :param windows: iterable of objects with ``start`` and ``stop`` datetimes (such as ``Event``),
+            or of ``(start_time, end_time)`` tuples.
+
+        :raises ValueError: if any window is invalid, with the same rules as :meth:`slice`
+
+        :return list[TimeSeries]: the sliced series, in the same order as ``windows``
+        """
+        start_times = []
+        end_times = []
+        for window in windows:
+            if isinstance(window, tuple):
+                window_start, window_end = window
+            else:
+                window_start, window_end = window.start, window.stop
+
+            start_times.append(window_start)
+            end_times.append(window_end)
 
-        if (start_time.tzinfo is None) or (end_time.tzinfo is None): # Throw error if start or stop time is naive
+        start_indices, stop_indices = self._window_indices(start_times, end_times)
+
+        return [self._view(int(i), int(j)) for i, j in zip(start_indices, stop_indices)]
+
+    def _window_indices(self, start_times: list, end_times: list) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Validate time windows and resolve them to the (inclusive) indices of the first and last
+        elements that lie within each window.
+        """
+        if any(t.tzinfo is None for t in start_times) or any(t.tzinfo is None for t in end_times):
             raise ValueError("The start or end time does not have an assigned timezone!")
 
-        if end_time < start_time: # Throw error if the end time is before stop time
-            raise ValueError(f"Start time {start_time} is after stop time {end_time}!")
-        
-        if end_time < self.start:
+        # Offsets are taken in whole microseconds, like datetimes themselves, so that they are exact
+        microsecond = datetime.timedelta(microseconds=1)
+        relative_starts = np.fromiter(((t - self.start) // microsecond for t in start_times), dtype=float,
+                                      count=len(start_times)) / 1e6
+        relative_stops = np.fromiter(((t - self.start) // microsecond for t in end_times), dtype=float,
+                                     count=len(end_times)) / 1e6
+
+        dt = (self.stop - self.start).total_seconds()
+
+        if np.any(relative_stops < relative_starts):  # Throw error if the end time is before stop time
+            raise ValueError("Slice start time is after slice stop time!")
+
+        if np.any(relative_stops < 0):
             raise ValueError("Slice ends before TimeSeries starts!")
-        
-        if start_time > self.stop:
+
+        if np.any(relative_starts > dt):
             raise ValueError("Slice starts after TimeSeries ends!")
 
-        dt = self.stop - self.start
+        relative_starts = np.clip(relative_starts, 0, dt)
+        relative_stops = np.clip(relative_stops, 0, dt)
 
-        # Values used for indexing
-        relative_start = start_time - self.start
-        relative_stop = end_time - self.start
+        start_indices = self._grid_index(relative_starts, rounding="ceil")
+        stop_indices = self._grid_index(relative_stops, rounding="floor")
 
-        if relative_start < datetime.timedelta(0):
-            relative_start = datetime.timedelta(0)
+        return start_indices, stop_indices
 
-        if relative_stop > dt:
-            relative_stop = dt
+    def _view(self, start_index: int, stop_index: int):
+        """
+        Obtain a view of the elements from ``start_index`` to ``stop_index`` (inclusive) with
+        a corrected start, stop, and length.
+        """
+        view: TimeSeries = super().__getitem__(slice(start_index, stop_index + 1))
 
-        # Finding indexes to slice with
-        start_index = math.ceil((relative_start/self.period).total_seconds()) 
-        stop_index = math.floor((relative_stop/self.period).total_seconds())
+        view._start = self.start + datetime.timedelta(seconds=start_index * self.period)
+        view._stop = self.start + datetime.timedelta(seconds=stop_index * self.period)
+        view._length = (view._stop - view._start).total_seconds()
+        view._meta = copy.copy(self.meta)
 
-        # Find new start and end time
-        new_start_time = datetime.timedelta(seconds = start_index * self.period) + self.start
-        new_stop_time = datetime.timedelta(seconds = stop_index * self.period) + self.start
-        y_data = []
-        for i in range(start_index, stop_index + 1):
-            y_data.append(self[i])
-        
-        if self.start.tzinfo is not None:
-            new_start_time = new_start_time.replace(tzinfo = self.start.tzinfo)
-            new_stop_time = new_stop_time.replace(tzinfo = self.stop.tzinfo)
-
-        new_series = TimeSeries(y_data, 
-                                new_start_time,
-                                new_stop_time,
-                                self._period,
-                                length = (new_stop_time - new_start_time).total_seconds(),
-                                units = self.units)
-        return new_series
+        return view
     
     def shift(self, shift: float | datetime.timedelta):
         """A function which moves a TimeSeries backwards or forwards in time without changing any data inside it. Can have timedelta or a float as an input
@@ -555,6 +1362,323 @@ class TimeSeries(np.ndarray):
 
         return timeseries_copy
 
+    def resample(self, period: float, method: str = "mean"):
+        """
+        Change the granularity of this TimeSeries to ``period``, returning a new TimeSeries with the same start.
+
+        Decimating methods aggregate each block of elements spanning ``period`` seconds into a single element,
+        labelled by the time at the start of the block, and so do not alias like point-wise interpolation:
+
+        - "mean": the average of each block
+        - "min": the minimum of each block
+        - "max": the maximum of each block
+        - "last": the last element of each block
+        - "fir": polyphase FIR anti-aliasing filter followed by decimation
+
+        Additionally, "linear" performs first-order hold (linear interpolation) onto the new x–axis,
+        which may also be used to up-sample.
+
+        All methods run in O(n) time, and only allocate memory proportional to the result.
+
+        :param float period: the desired time between data points in seconds
+        :param str method: one of "mean", "min", "max", "last", "fir", or "linear"
+        :raises ValueError: if ``method`` is not recognized, or a decimating method is asked to up-sample
+        :return TimeSeries: the resampled TimeSeries
+        """
+        if period <= 0:
+            raise ValueError(f"Period must be positive, not {period}!")
+
+        values = self.view(np.ndarray)
+
+        if method == "linear":
+            axis = TimeAxis.spanning(0.0, self.length, period)
+            resampled = np.interp(axis.relative(), self.x_axis, values)
+
+            return self._with_axis(resampled, axis)
+
+        if period < self._period * (1 - 1e-9):
+            raise ValueError(f"Cannot up-sample with {method}, use \"linear\" instead!")
+
+        if method == "fir":
+            from scipy import signal
+
+            ratio = fractions.Fraction(self._period / period).limit_denominator(1000)
+            resampled = signal.resample_poly(values, ratio.numerator, ratio.denominator)
+            axis = TimeAxis(0.0, self._period / ratio, len(resampled))
+
+            return self._with_axis(resampled, axis)
+
+        # Elements that begin each block, computed in closed form from the ratio of the periods
+        num_blocks = math.floor((len(self) - 1) * self._period / period + 1e-9) + 1
+        block_starts = np.ceil(np.arange(num_blocks) * (period / self._period) - 1e-9).astype(np.intp)
+
+        if method == "mean":
+            block_ends = np.append(block_starts[1:], len(self))
+            resampled = np.add.reduceat(values, block_starts) / (block_ends - block_starts)
+        elif method == "min":
+            resampled = np.minimum.reduceat(values, block_starts)
+        elif method == "max":
+            resampled = np.maximum.reduceat(values, block_starts)
+        elif method == "last":
+            block_ends = np.append(block_starts[1:], len(self))
+            resampled = values[block_ends - 1]
+        else:
+            raise ValueError(f"Unknown resampling method {method}!")
+
+        return self._with_axis(resampled, TimeAxis(0.0, period, num_blocks))
+
+    def integrate(self, units: Unit | str = None, initial=None):
+        """
+        Compute the cumulative integral of this TimeSeries over time with the trapezoidal rule,
+        such that the first element of the result is zero.
+
+        The integral is in the units of this TimeSeries multiplied by seconds, unless ``units`` are given.
+        For example, integrating power in W with ``units="Wh"`` results in energy in Wh.
+        A TimeSeries of a single element integrates to zero, and an empty one to an empty TimeSeries.
+
+        If ``initial`` is the integral of an earlier, shorter version of this TimeSeries (such as before
+        new data was appended), only the new elements are integrated and the result extends ``initial``.
+
+        :param str | Unit units: the units of the integral, optional
+        :param TimeSeries initial: a previously computed integral of the beginning of this TimeSeries, optional
+        :raises ValueError: if ``units`` are incompatible, or ``initial`` is not an integral of the beginning of this TimeSeries
+        :return TimeSeries: the cumulative integral
+        """
+        integral_units = _units.multiply_units(self.units, self.ureg.second)
+        target_units = integral_units if units is None else self._parse_units(units)
+
+        if not _units.is_compatible(integral_units, target_units):
+            raise ValueError(f"Cannot convert {integral_units} to {target_units} (incompatible dimensions)")
+
+        factor = _units.conversion_factor(integral_units, target_units)
+        values = self.view(np.ndarray)
+        result = np.empty(len(self))
+
+        # An empty TimeSeries has an empty integral
+        if len(self) == 0:
+            return self._wrap(result, target_units)
+
+        # Resume integrating from the last element of ``initial``, if given
+        first_index = 0
+        if initial is not None and len(initial) > 0:
+            if not (len(initial) <= len(self) and self[:len(initial)].is_aligned_with(initial)):
+                raise ValueError("initial must be an integral of the beginning of this TimeSeries!")
+
+            first_index = len(initial) - 1
+            result[:first_index + 1] = initial.view(np.ndarray) * _units.conversion_factor(initial.units, target_units)
+        else:
+            result[0] = 0.0
+
+        tail = values[first_index:]
+        result[first_index + 1:] = result[first_index] + np.cumsum((tail[1:] + tail[:-1]) * (self._period * factor / 2))
+
+        return self._wrap(result, target_units)
+
+    def derivative(self, units: Unit | str = None):
+        """
+        Compute the derivative of this TimeSeries with respect to time, using second-order central differences
+        in the interior and first-order differences at the boundaries.
+
+        The derivative is in the units of this TimeSeries divided by seconds, unless ``units`` are given.
+        For example, differentiating speed in m/s results in acceleration in m/s².
+        A TimeSeries of a single element is treated as constant, so its derivative is zero.
+
+        :param str | Unit units: the units of the derivative, optional
+        :raises ValueError: if ``units`` are incompatible
+        :return TimeSeries: the derivative
+        """
+        derivative_units = _units.divide_units(self.units, self.ureg.second)
+        target_units = derivative_units if units is None else self._parse_units(units)
+
+        if not _units.is_compatible(derivative_units, target_units):
+            raise ValueError(f"Cannot convert {derivative_units} to {target_units} (incompatible dimensions)")
+
+        factor = _units.conversion_factor(derivative_units, target_units)
+        values = self.view(np.ndarray).astype(float)
+
+        # np.gradient requires at least two elements
+        if len(values) < 2:
+            return self._wrap(np.zeros(len(values)), target_units)
+
+        result = np.gradient(values, self._period) * factor
+
+        return self._wrap(result, target_units)
+
+    def _parse_units(self, units: Unit | str) -> Unit:
+        """
+        Parse ``units`` into a Unit if it is a string.
+        """
+        return _units.parse_units(units) if isinstance(units, str) else units
+
+    def rolling_mean(self, window: float | datetime.timedelta):
+        """
+        Compute the mean over a trailing window of ``window`` seconds ending at each element.
+        Elements without a complete window behind them are NaN.
+
+        Runs in O(n) regardless of the length of the window.
+
+        :param float | datetime.timedelta window: duration of the window, in seconds if a float
+        :return TimeSeries: the rolling mean, in the units of this TimeSeries
+        """
+        num_elements = self._window_size(window)
+
+        (sums,), offset = self._rolling_sums(num_elements, 1)
+
+        return self._rolling_result(sums / num_elements + offset, num_elements)
+
+    def rolling_sum(self, window: float | datetime.timedelta):
+        """
+        Compute the sum over a trailing window of ``window`` seconds ending at each element.
+        Elements without a complete window behind them are NaN.
+
+        Runs in O(n) regardless of the length of the window.
+
+        :param float | datetime.timedelta window: duration of the window, in seconds if a float
+        :return TimeSeries: the rolling sum, in the units of this TimeSeries
+        """
+        num_elements = self._window_size(window)
+
+        (sums,), offset = self._rolling_sums(num_elements, 1)
+
+        return self._rolling_result(sums + num_elements * offset, num_elements)
+
+    def rolling_std(self, window: float | datetime.timedelta, ddof: int = 0):
+        """
+        Compute the standard deviation over a trailing window of ``window`` seconds ending at each element.
+        Elements without a complete window behind them are NaN.
+
+        Runs in O(n) regardless of the length of the window.
+
+        :param float | datetime.timedelta window: duration of the window, in seconds if a float
+        :param int ddof: delta degrees of freedom, such that the divisor is ``N - ddof`` for ``N`` elements in the window
+        :return TimeSeries: the rolling standard deviation, in the units of this TimeSeries
+        """
+        num_elements = self._window_size(window)
+
+        if num_elements - ddof <= 0:
+            raise ValueError(f"Window of {num_elements} elements is too short for ddof={ddof}!")
+
+        (sums, sums_of_squares), _ = self._rolling_sums(num_elements, 2)
+        variance = (sums_of_squares - sums ** 2 / num_elements) / (num_elements - ddof)
+
+        return self._rolling_result(np.sqrt(np.clip(variance, 0, None)), num_elements)
+
+    def rolling_min(self, window: float | datetime.timedelta):
+        """
+        Compute the minimum over a trailing window of ``window`` seconds ending at each element.
+        Elements without a complete window behind them are NaN.
+
+        Runs in O(n) regardless of the length of the window.
+
+        :param float | datetime.timedelta window: duration of the window, in seconds if a float
+        :return TimeSeries: the rolling minimum, in the units of this TimeSeries
+        """
+        num_elements = self._window_size(window)
+
+        return self._rolling_result(self._rolling_extremes(num_elements, np.minimum), num_elements)
+
+    def rolling_max(self, window: float | datetime.timedelta):
+        """
+        Compute the maximum over a trailing window of ``window`` seconds ending at each element.
+        Elements without a complete window behind them are NaN.
+
+        Runs in O(n) regardless of the length of the window.
+
+        :param float | datetime.timedelta window: duration of the window, in seconds if a float
+        :return TimeSeries: the rolling maximum, in the units of this TimeSeries
+        """
+        num_elements = self._window_size(window)
+
+        return self._rolling_result(self._rolling_extremes(num_elements, np.maximum), num_elements)
+
+    def _window_size(self, window: float | datetime.timedelta) -> int:
+        """
+        Convert a duration into the number of elements that it spans.
+        """
+        if isinstance(window, datetime.timedelta):
+            window = window.total_seconds()
+
+        num_elements = max(int(round(window / self._period)), 1)
+
+        if num_elements > len(self):
+            raise ValueError(f"Window of {window}s is longer than this TimeSeries!")
+
+        return num_elements
+
+    def _rolling_sums(self, num_elements: int, num_powers: int) -> tuple[list, float]:
+        """
+        Compute the sums of each complete window of ``num_elements`` elements, of the data raised
+        to each power up to ``num_powers``, from differences of cumulative sums.
+
+        The data is centred on its mean first so that the cumulative sums do not lose precision, so
+        the sums are of the centred data; the mean is returned alongside them. NaN elements only make
+        the sums of the windows containing them NaN.
+        """
+        values = self.view(np.ndarray).astype(float)
+
+        missing = np.isnan(values)
+        offset = float(np.nanmean(values)) if not np.all(missing) else 0.0
+        centred = np.where(missing, 0.0, values - offset)
+
+        # Windows containing any NaN are NaN, rather than every window after the first NaN
+        missing_counts = np.concatenate(([0], np.cumsum(missing)))
+        incomplete = (missing_counts[num_elements:] - missing_counts[:-num_elements]) > 0
+
+        sums = []
+        for power in range(1, num_powers + 1):
+            cumulative = np.concatenate(([0.0], np.cumsum(centred ** power)))
+            window_sums = cumulative[num_elements:] - cumulative[:-num_elements]
+            window_sums[incomplete] = np.nan
+            sums.append(window_sums)
+
+        return sums, offset
+
+    def _rolling_extremes(self, num_elements: int, extreme) -> np.ndarray:
+        """
+        Compute ``extreme`` (``np.minimum`` or ``np.maximum``) of each complete window of ``num_elements``
+        elements with the van Herk/Gil-Werman algorithm: every window spans the end of one block of
+        ``num_elements`` elements and the start of the next, so it is the extreme of a suffix-accumulation
+        of the first block and a prefix-accumulation of the second.
+        """
+        values = self.view(np.ndarray).astype(float)
+
+        num_blocks = math.ceil(len(values) / num_elements)
+        padded = np.full(num_blocks * num_elements, np.nan)
+        padded[:len(values)] = values
+        blocks = padded.reshape(num_blocks, num_elements)
+
+        prefix = extreme.accumulate(blocks, axis=1).reshape(-1)
+        suffix = extreme.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].reshape(-1)
+
+        window_ends = np.arange(num_elements - 1, len(values))
+
+        return extreme(suffix[window_ends - num_elements + 1], prefix[window_ends])
+
+    def _rolling_result(self, window_values: np.ndarray, num_elements: int):
+        """
+        Pad the results of each complete window with NaN for the elements without a complete window.
+        """
+        result = np.empty(len(self))
+        result[:num_elements - 1] = np.nan
+        result[num_elements - 1:] = window_values
+
+        return self._wrap(result, self.units)
+
+    def _with_axis(self, values: np.ndarray, axis: TimeAxis):
+        """
+        Create a new TimeSeries from ``values`` with the same units and metadata as this TimeSeries,
+        on ``axis``, where ``axis.start`` is relative to the start of this TimeSeries.
+        """
+        start = self.start + datetime.timedelta(seconds=axis.start)
+
+        return TimeSeries(values,
+                          start,
+                          start + datetime.timedelta(seconds=axis.length),
+                          axis.period,
+                          axis.length,
+                          self.units,
+                          copy.copy(self.meta))
+
     def convert_to(self, new_unit: Unit | str):
         """ Returns a new TimeSeries after being converted to a new unit, appropriately scales TimeSeries
 
@@ -566,14 +1690,14 @@ class TimeSeries(np.ndarray):
             :return: TimeSeries with converted units
         """
 
-        new_unit_parsed = self.ureg.parse_units(new_unit)
+        new_unit_parsed = self._parse_units(new_unit)
         # Check dimensionality
-        if self.units.dimensionality != new_unit_parsed.dimensionality:
+        if not _units.is_compatible(self.units, new_unit_parsed):
             raise ValueError(
                 f"Cannot convert {self.units} to {new_unit_parsed} (incompatible dimensions)"
             )
 
-        factor = (1 * self.units).to(new_unit_parsed).magnitude # 1 * unit turns it into a quality rather than pure unit
+        factor = _units.conversion_factor(self.units, new_unit_parsed)
 
         converted_values = np.asarray(self) * factor
 
@@ -589,10 +1713,10 @@ class TimeSeries(np.ndarray):
         :return TimeSeries: Timeseries with converted units
         """
         # Find base units
-        new_unit = (1 * self.units).to_base_units().units
+        new_unit = _units.base_units(self.units)
 
         # Multiply by a factor
-        factor = (1 * self.units).to(new_unit).magnitude # 1 * unit turns it into a quality rather than pure unit
+        factor = _units.conversion_factor(self.units, new_unit)
         converted_values = np.asarray(self) * factor
 
         # Construct new TimeSeries
@@ -602,148 +1726,370 @@ class TimeSeries(np.ndarray):
 
         return result
 
+    @staticmethod
+    def common_axis(*args) -> TimeAxis:
+        """
+        Obtain the axis spanning the time where every TimeSeries overlaps, at the finest period amongst them.
+
+        :raises ValueError: if the TimeSeries do not overlap
+        :return TimeAxis: the common axis
+        """
+        common_axis: TimeAxis = args[0].axis
+        for arg in args[1:]:
+            common_axis = common_axis.intersection(arg.axis)
+
+            if common_axis is None:
+                raise ValueError("TimeSeries do not overlap, and cannot be aligned!")
+
+        return common_axis
+
+    def interpolate_onto(self, axis: TimeAxis, out: np.ndarray = None) -> np.ndarray:
+        """
+        Obtain the values of this TimeSeries at each element of ``axis``, which must lie within this TimeSeries.
+
+        If ``axis`` is a subset of the x–axis of this TimeSeries, values are copied rather than interpolated.
+
+        :param TimeAxis axis: the axis to interpolate onto
+        :param np.ndarray out: an array of ``len(axis)`` elements to write the values into, optional
+        :return: the values, as float32 if this TimeSeries can be represented by it and float64 otherwise
+        """
+        values = self.view(np.ndarray)
+        dtype = np.result_type(self.dtype, np.float32)
+
+        if out is None:
+            out = np.empty(len(axis), dtype=dtype)
+
+        offset = (axis.start - self.start.timestamp()) / self._period
+        if math.isclose(axis.period, self._period, rel_tol=1e-9) and abs(offset - round(offset)) < 1e-6:
+            start_index = round(offset)
+            out[...] = values[start_index:start_index + len(axis)]
+
+            return out
+
+        # Only the elements which bracket the axis are needed for interpolation
+        relative_start = axis.start - self.start.timestamp()
+        relative_stop = axis.stop - self.start.timestamp()
+        start_index = int(self._grid_index(relative_start, rounding="floor"))
+        stop_index = int(self._grid_index(relative_stop, rounding="ceil"))
+
+        source_x_axis = self.unix_x_axis[start_index:stop_index + 1]
+        source_values = values[start_index:stop_index + 1]
+
+        out[...] = np.interp(axis.unix(), source_x_axis, source_values)
+
+        return out
+
     @staticmethod
     def align(*args) -> list:
-        start_time = max(arg.start.timestamp() for arg in args)
-        end_time = min(arg.stop.timestamp() for arg in args)
-        period = min(arg.period for arg in args)
+        """
+        Re-interpolate each TimeSeries onto a common x–axis spanning the time where all of them overlap,
+        at the finest period amongst them.
 
-        new_length = end_time - start_time
-        num_points = math.ceil(new_length / period) + 1
-        new_x_axis = np.linspace(start_time, end_time, num_points)
+        :raises ValueError: if the TimeSeries do not overlap
+        :return list[TimeSeries]: the aligned series, in the same order as ``args``
+        """
+        common_axis = TimeSeries.common_axis(*args)
 
         new_args = []
         for array in args:
-            start_index = array.index_of(array.relative_time(start_time))
-            stop_index = array.index_of(array.relative_time(end_time))
-
-            new_array = array[start_index:stop_index + 1]
-            if array.start.tzinfo is not None:
-                tz = array.start.tzinfo
-                new_array._start = datetime.datetime.fromtimestamp(start_time, tz)
-                new_array._stop = datetime.datetime.fromtimestamp(end_time, tz)
-            else:
-                new_array._start = datetime.datetime.fromtimestamp(start_time)
-                new_array._stop = datetime.datetime.fromtimestamp(end_time)
+            interpolated_values = array.interpolate_onto(common_axis)
 
-            new_array._period = period
-            new_array._length = new_length
-
-            interpolated_values = np.interp(new_x_axis, new_array.unix_x_axis, new_array)
-            new_array_interpolated = new_array.promote(interpolated_values)
+            tz = array.start.tzinfo
+            new_array_interpolated = TimeSeries(interpolated_values,
+                                                datetime.datetime.fromtimestamp(common_axis.start, tz),
+                                                datetime.datetime.fromtimestamp(common_axis.stop, tz),
+                                                common_axis.period,
+                                                common_axis.length,
+                                                array.units,
+                                                array.meta)
 
             new_args.append(new_array_interpolated)
 
         return new_args
 
     @staticmethod
-    def merge(*args, fill_value: float = 0):
-        """The merge function combines several TimeSeries into one contiguous series. Any spaces in time is filled by the 'fill_value'. 
-        It assumes that the datapoints pull from the same source, as overlapping point are overridden.
+    def merge(*args, fill_value: float = 0, policy: str = "last", return_mask: bool = False,
+              segmented: bool = False):
+        """The merge function combines several TimeSeries into one contiguous series, on the x–axis beginning at the earliest
+        start and with the finest period amongst them. Any spaces in time is filled by the 'fill_value'.
+        It assumes that the datapoints pull from the same source, and resolves overlapping points with ``policy``.
+
+        Each input is written into the result as a single (strided) slice of the merged x–axis, so merging hundreds
+        of series (such as chunks of a long query) never builds per-element index arrays.
 
         :param float fill_value: The value for filling between gaps of time. Defaults to 0.
+        :param str policy: How overlapping points are resolved: "last" for the last input to win (default),
+            "first" for the first input to win, or "mean" to average them.
+        :param bool return_mask: Also return a boolean mask which is ``True`` where the merged series has data,
+            so that gaps can be told apart from real data equal to 'fill_value'.
+        :param bool segmented: Return a SegmentedTimeSeries of the contiguous runs of data instead, so that no memory
+            is allocated for gaps.
 
         :raises ValueError: If no TimeSeries are input
+        :raises ValueError: If ``policy`` is not recognized
 
-        :return TimeSeries: The merged series
+        :return TimeSeries: The merged series, and its mask if ``return_mask``, or the SegmentedTimeSeries if ``segmented``
         """        
-        
+        from data_tools.collections.segmented_time_series import SegmentedTimeSeries
+
+        # Segmented series contribute only their segments, so their gaps are filled with 'fill_value'
+        args = [segment for ts in args for segment in (ts.segments if isinstance(ts, SegmentedTimeSeries) else (ts,))]
+
         if len(args) == 0:
             raise ValueError("At least one TimeSeries is required")
 
-        # Series properties
+        if policy not in ("last", "first", "mean"):
+            raise ValueError(f"Unknown merge policy {policy}! Must be one of 'last', 'first', or 'mean'.")
+
+        # Series properties; each series spans its elements, which may end before its nominal stop time
         start_time = min(ts.start.timestamp() for ts in args)
-        end_time = max(ts.stop.timestamp() for ts in args)
+        end_time = max(ts.axis.stop for ts in args)
         period = min(ts.period for ts in args)  # highest resolution
 
         new_length = end_time - start_time
         num_points = math.ceil(new_length / period) + 1
-        
-        merged_values = np.full(num_points, fill_value, dtype=float)
 
         # Use metadata from the first series
         base = args[0]
         units = base.units
         meta = copy.deepcopy(base.meta)
 
-        # Merge TimeSeries loop
+        # Convert to common units and check dimensionality
+        converted_args = []
         for ts in args:
-
-            # Convert to common units and check dimensionality
-            if ts.units != units:
-                if ts.units.dimensionality == units.dimensionality:
+            if ts.units is not units and ts.units != units:
+                if _units.is_compatible(ts.units, units):
                     ts = ts.convert_to(str(units))
                 else:
                     raise ValueError("One of the TimeSeries is not in the same units of dimensionality")
 
-            ts_times = ts.unix_x_axis
-            ts_values = np.asarray(ts)
+            converted_args.append(ts)
 
-            # Map ts indices into the whole space
-            indices = np.round((ts_times - start_time) / period).astype(int)
+        # The narrowest dtype that can hold every series (and their mean, if needed)
+        dtype = np.result_type(*(ts.dtype for ts in converted_args), *((float,) if policy == "mean" else ()))
 
-            # Clamp indices (safety)
-            valid = (indices >= 0) & (indices < num_points)
-            indices = indices[valid]
-            ts_values = ts_values[valid]
+        # Each series covers a (usually contiguous) range of the merged x–axis
+        targets = [TimeSeries._merge_target(ts, start_time, period, num_points) for ts in converted_args]
 
-            # Overwrite values in the merged series
-            merged_values[indices] = ts_values
-
-        # Create final series
         tz = base.start.tzinfo
         new_start_dt = datetime.datetime.fromtimestamp(start_time, tz)
-        new_stop_dt = datetime.datetime.fromtimestamp(end_time, tz)
-
-        merged_series = TimeSeries(
-            merged_values,
-            start_time=new_start_dt,
-            stop_time=new_stop_dt,
-            period=period,
-            length=new_length,
-            units=units,
-            meta=meta
-        )
-
-        return merged_series
-    
+
+        if not segmented:
+            merged_values, mask = TimeSeries._merge_range(converted_args, targets, 0, num_points,
+                                                          policy, fill_value, dtype)
+
+            merged_series = TimeSeries(
+                merged_values,
+                start_time=new_start_dt,
+                stop_time=datetime.datetime.fromtimestamp(end_time, tz),
+                period=period,
+                length=new_length,
+                units=units,
+                meta=meta
+            )
+
+            return (merged_series, mask) if return_mask else merged_series
+
+        # Group series whose ranges overlap or abut into clusters, so that no memory is allocated for the gaps
+        order = sorted(range(len(targets)), key=lambda i: targets[i][0])
+        clusters = []
+        for i in order:
+            first_index, last_index = targets[i][0], targets[i][1]
+            if clusters and first_index <= clusters[-1][1] + 1:
+                clusters[-1][1] = max(clusters[-1][1], last_index)
+                clusters[-1][2].append(i)
+            else:
+                clusters.append([first_index, last_index, [i]])
+
+        segments = []
+        for first_index, last_index, members in clusters:
+            members.sort()  # Overlaps are resolved in the order that series were given
+            cluster_values, cluster_mask = TimeSeries._merge_range([converted_args[i] for i in members],
+                                                                   [targets[i] for i in members],
+                                                                   first_index, last_index - first_index + 1,
+                                                                   policy, fill_value, dtype)
+
+            # Series with a coarser period may leave holes within a cluster
+            breaks = np.flatnonzero(np.diff(cluster_mask.view(np.int8)) != 0) + 1
+            for run_start, run in zip(np.concatenate(([0], breaks)), np.split(np.arange(len(cluster_mask)), breaks)):
+                if not cluster_mask[run_start]:
+                    continue
+
+                segment_start = new_start_dt + datetime.timedelta(seconds=int(first_index + run_start) * period)
+                segment_length = (len(run) - 1) * period
+                segments.append(TimeSeries(cluster_values[run_start:run_start + len(run)],
+                                           start_time=segment_start,
+                                           stop_time=segment_start + datetime.timedelta(seconds=segment_length),
+                                           period=period,
+                                           length=segment_length,
+                                           units=units,
+                                           meta=meta))
+
+        return SegmentedTimeSeries(segments, units, meta)
+
     @staticmethod
-    def from_query_dataframe(query_df: pd.DataFrame, period: float, field: str, units: Unit | str):
-        # Transform the DataFrame into a nicer format where we have our time-series data indexed by time
-        query_df['_time'] = pd.to_datetime(query_df['_time'])
-        query_df.set_index('_time', inplace=True)
+    def _merge_target(ts, start_time: float, period: float, num_points: int) -> tuple:
+        """
+        Locate the elements of ``ts`` on the merged x–axis beginning at ``start_time`` with ``period``.
 
-        # Get the x-axis in relative seconds (first element is t=0)
-        x_axis = query_df.index.map(lambda x: x.timestamp()).to_numpy()
-        x_axis -= x_axis[0]  # Subtract off first time, so the x_axis starts at 0 with units of seconds
+        :return: the first and last index covered, and either a slice selecting every element of ``ts``
+            or, if ``ts`` does not lie on the merged x–axis, an array of rounded indices.
+        """
+        offset = (ts.start.timestamp() - start_time) / period
+        step = ts.period / period
 
-        # Reshape the x-axis to have the right number of elements for our needed period
-        temporal_length: float = x_axis[-1]  # Total time of the query in seconds
-        desired_num_elements: int = math.ceil(temporal_length / period)
-        desired_x_axis = np.linspace(0, temporal_length, desired_num_elements+1, endpoint=True)
+        if abs(offset - round(offset)) < 1e-6 and abs(step - round(step)) < 1e-6:
+            first_index = round(offset)
+            step = round(step)
+            last_index = first_index + (len(ts) - 1) * step
 
-        # Re-interpolate our data on desired x-axis
-        wave = query_df[[field]].to_numpy().reshape(-1)
-        wave_interpolated = np.interp(desired_x_axis, x_axis, wave)
+            return first_index, last_index, slice(first_index, last_index + 1, step)
 
-        actual_granularity = np.mean(np.diff(desired_x_axis))
+        indices = np.rint(offset + np.arange(len(ts)) * step).astype(np.int64)
+        indices = np.clip(indices, 0, num_points - 1)
+
+        return int(indices[0]), int(indices[-1]), indices
+
+    @staticmethod
+    def _merge_range(series: list, targets: list, base: int, size: int, policy: str, fill_value, dtype):
+        """
+        Merge ``series`` into a new array covering ``size`` elements of the merged x–axis from index ``base``.
+
+        :return: the merged values, and a mask which is ``True`` where any series has data
+        """
+        mask = np.zeros(size, dtype=bool)
+
+        if policy == "mean":
+            sums = np.zeros(size, dtype=dtype)
+            counts = np.zeros(size, dtype=np.int64)
+
+            for ts, (_, _, target) in zip(series, targets):
+                target = TimeSeries._shift_target(target, base)
+                values = ts.view(np.ndarray)
+
+                if isinstance(target, slice):
+                    sums[target] += values
+                    counts[target] += 1
+                else:
+                    np.add.at(sums, target, values)
+                    np.add.at(counts, target, 1)
+
+            mask = counts > 0
+            merged_values = np.full(size, fill_value, dtype=np.result_type(dtype, fill_value))
+            merged_values[mask] = sums[mask] / counts[mask]
+
+            return merged_values, mask
+
+        merged_values = np.full(size, fill_value, dtype=np.result_type(dtype, fill_value))
+
+        # Later series overwrite earlier ones, so the first series wins when they are written in reverse
+        ordered = list(zip(series, targets))
+        if policy == "first":
+            ordered.reverse()
+
+        for ts, (_, _, target) in ordered:
+            target = TimeSeries._shift_target(target, base)
+            values = ts.view(np.ndarray)
+
+            if policy == "first" and not isinstance(target, slice):
+                # Within a series, duplicate indices must also keep their first element
+                target, unique = np.unique(target, return_index=True)
+                values = values[unique]
+
+            merged_values[target] = values
+            mask[target] = True
+
+        return merged_values, mask
+
+    @staticmethod
+    def _shift_target(target, base: int):
+        """
+        Offset a target produced by :meth:`_merge_target` to be relative to index ``base``.
+        """
+        if isinstance(target, slice):
+            return slice(target.start - base, target.stop - base, target.step)
+
+        return target - base
+    
+    @staticmethod
+    def from_query_dataframe(query_df: pd.DataFrame, period: float, field: str, units: Unit | str,
+                             dtype: np.dtype | str = None):
+        """
+        Create a TimeSeries from the DataFrame resulting from an InfluxDB query, re-interpolating the data
+        to have a temporal granularity of ``period``.
+
+        ``query_df`` is not modified, and no copy of it is made.
+
+        :param pd.DataFrame query_df: DataFrame with "_time", "car", "_measurement", and ``field`` columns
+        :param float period: the desired time between data points in seconds
+        :param str field: the column containing the data
+        :param str | Unit units: units of the TimeSeries
+        :param np.dtype | str dtype: the dtype that data will be stored as, defaults to float64
+        :return: Homogenized TimeSeries
+        """
+        # Timestamps as datetime64, without a per-row conversion
+        timestamps = pd.DatetimeIndex(pd.to_datetime(query_df['_time'], utc=True)).tz_convert(None).to_numpy()
 
         # Compile metadata
         meta: dict = {
-            "car": query_df["car"].to_numpy()[0],
-            "measurement": query_df["_measurement"].to_numpy()[0],
+            "car": query_df["car"].iat[0],
+            "measurement": query_df["_measurement"].iat[0],
             "field": field
         }
 
-        new_wave = TimeSeries(wave_interpolated, 
-                              start_time = query_df.index.to_numpy()[0].to_pydatetime(),
-                              stop_time = query_df.index.to_numpy()[-1].to_pydatetime(),
-                              period = actual_granularity,
-                              length = temporal_length,
-                              units = units,
-                              meta = meta)
+        return TimeSeries.from_arrays(timestamps, query_df[field].to_numpy(), period, units, meta=meta, dtype=dtype)
 
-        return new_wave
+    @staticmethod
+    def from_arrays(timestamps: np.ndarray,
+                    values: np.ndarray,
+                    period: float,
+                    units: Unit | str,
+                    timezone: datetime.tzinfo = datetime.timezone.utc,
+                    meta: dict = None,
+                    dtype: np.dtype | str = None):
+        """
+        Create a TimeSeries from raw arrays of (sorted) timestamps and values, re-interpolating the data
+        to have a temporal granularity of ``period``.
+
+        :param np.ndarray timestamps: times of each data point, as ``datetime64``, or integer or floating-point
+            UNIX timestamps in seconds.
+        :param np.ndarray values: data points
+        :param float period: the desired time between data points in seconds
+        :param str | Unit units: units of the TimeSeries
+        :param datetime.tzinfo timezone: timezone of the start and stop times of the TimeSeries
+        :param dict meta: metadata for the TimeSeries
+        :param np.dtype | str dtype: the dtype that data will be stored as, defaults to float64
+        :return: Homogenized TimeSeries
+        """
+        timestamps_ns = as_nanoseconds(timestamps)
+
+        # Datetimes resolve to microseconds, so the grid is anchored at the first and last times rounded to them
+        start_timestamp = pd.Timestamp(timestamps_ns[0], tz="UTC").round("us")
+        stop_timestamp = pd.Timestamp(timestamps_ns[-1], tz="UTC").round("us")
+
+        # Get the x-axis in relative seconds (anchor is t=0), subtracting in integers to retain precision
+        x_axis = (timestamps_ns - start_timestamp.value) / 1e9
+
+        # Reshape the x-axis to have the right number of elements for our needed period
+        temporal_length: float = (stop_timestamp.value - start_timestamp.value) / 1e9  # Total time of the query in seconds
+        desired_num_elements: int = math.ceil(temporal_length / period)
+        desired_x_axis = np.linspace(0, temporal_length, desired_num_elements + 1, endpoint=True)
+
+        # Re-interpolate our data on desired x-axis
+        wave_interpolated = np.interp(desired_x_axis, x_axis, np.asarray(values, dtype=float).reshape(-1))
+
+        actual_granularity = temporal_length / desired_num_elements if desired_num_elements > 0 else period
+
+        start_time = start_timestamp.to_pydatetime().astimezone(timezone)
+        stop_time = stop_timestamp.to_pydatetime().astimezone(timezone)
+
+        return TimeSeries(as_storage_dtype(wave_interpolated, dtype),
+                          start_time=start_time,
+                          stop_time=stop_time,
+                          period=actual_granularity,
+                          length=temporal_length,
+                          units=units,
+                          meta=meta if meta is not None else {})
 
     @staticmethod
     def generate_timeseries(x_axis: list, 
@@ -751,7 +2097,8 @@ class TimeSeries(np.ndarray):
                             period: float, 
                             units: Unit | str, 
                             timezone: datetime.timezone = datetime.timezone.utc, 
-                            meta: dict = None):
+                            meta: dict = None,
+                            dtype: np.dtype | str = None):
         """
         Creates a TimeSeries from a non-homogeneous / not evenly spaces set of data with a specified period. Useful for converting weirder data into a neat TimeSeries.
 
@@ -761,6 +2108,7 @@ class TimeSeries(np.ndarray):
         :param str | Unit units: Units of the TimeSeries
         :param datetime.timezone timezone: Timezone
         :param dict meta: Metadata for the TimeSeries
+        :param np.dtype | str dtype: The dtype that data will be stored as, defaults to float64
 
         :return: Homogenized TimeSeries
 
@@ -783,7 +2131,7 @@ class TimeSeries(np.ndarray):
 
         actual_granularity = np.mean(np.diff(desired_x_axis))
 
-        new_wave = TimeSeries(wave_interpolated, 
+        new_wave = TimeSeries(as_storage_dtype(wave_interpolated, dtype), 
                               start_time = datetime.datetime.fromtimestamp(x_axis[0], tz = timezone),
                               stop_time = datetime.datetime.fromtimestamp(x_axis[0], tz = timezone),
                               period = actual_granularity,
@@ -0,0 +1,356 @@
+import numpy as np
+import datetime
+from pint.registry import Unit
+
+from data_tools.collections.time_series import TimeSeries
+from data_tools.collections._time_axis import TimeAxis
+from data_tools.collections import _units
+from data_tools import unit_registry
+
+
+class TimeSeriesFrame:
+    """
+    This class encapsulates several channels of time-series data which share one temporal x–axis.
+
+    Data is stored as a single C-contiguous 2D array with one row per channel, so that every channel is
+    contiguous in memory and can be viewed as a ``TimeSeries`` without copying. Each channel has its own
+    units and metadata, while the axis is described once by a ``TimeAxis``.
+    """
+    UnitRegistry = unit_registry
+
+    # Arrays on the left of an operator defer to the reflected operators, rather than treating this as an element
+    __array_ufunc__ = None
+
+    def __init__(self,
+                 data: np.ndarray,
+                 axis: TimeAxis,
+                 names: list[str],
+                 units: list[Unit | str] = None,
+                 meta: list[dict] = None,
+                 timezone: datetime.tzinfo = datetime.timezone.utc):
+        """
+        :param np.ndarray data: array of shape ``(len(names), len(axis))``, with one row per channel
+        :param TimeAxis axis: the x–axis shared by every channel
+        :param list[str] names: the unique name of each channel
+        :param list[str | Unit] units: units of each channel, defaults to dimensionless
+        :param list[dict] meta: metadata of each channel, defaults to empty
+        :param datetime.tzinfo timezone: timezone of the start and stop times of the channels
+        :raises ValueError: if ``data`` does not have a row for each channel and a column for each element of ``axis``,
+            or if ``names`` are not unique
+        """
+        data = np.ascontiguousarray(data)
+
+        if data.shape != (len(names), len(axis)):
+            raise ValueError(f"Expected data of shape {(len(names), len(axis))}, not {data.shape}!")
+
+        if len(set(names)) != len(names):
+            raise ValueError("Channel names must be unique!")
+
+        if units is None:
+            units = [self.ureg.dimensionless] * len(names)
+
+        if meta is None:
+            meta = [{} for _ in names]
+
+        self._data: np.ndarray = data
+        self._axis: TimeAxis = axis
+        self._names: list[str] = list(names)
+        self._units: list[Unit] = [_units.parse_units(u) if isinstance(u, str) else u for u in units]
+        self._meta: list[dict] = list(meta)
+        self._timezone: datetime.tzinfo = timezone
+        self._index: dict[str, int] = {name: i for i, name in enumerate(self._names)}
+
+    @staticmethod
+    def from_series(*series: TimeSeries, names: list[str] = None):
+        """
+        Create a TimeSeriesFrame from several TimeSeries, re-interpolating each of them onto the axis
+        spanning the time where all of them overlap, at the finest period amongst them. Like
+        :meth:`TimeSeries.align`, but the aligned data is written directly into one allocation.
+
+        :param TimeSeries series: the TimeSeries that will become channels of the frame
+        :param list[str] names: the name of each channel, defaults to the "field" of each TimeSeries' metadata
+        :raises ValueError: if the TimeSeries do not overlap
+        :return: TimeSeriesFrame of the aligned channels
+        """
+        if len(series) == 0:
+            raise ValueError("At least one TimeSeries is required!")
+
+        if names is None:
+            names = [(ts.meta or {}).get("field", f"channel_{i}") for i, ts in enumerate(series)]
+
+        axis = TimeSeries.common_axis(*series)
+
+        dtype = np.result_type(*(ts.dtype for ts in series), np.float32)
+        data = np.empty((len(series), len(axis)), dtype=dtype)
+
+        for i, ts in enumerate(series):
+            ts.interpolate_onto(axis, out=data[i])
+
+        return TimeSeriesFrame(data,
+                               axis,
+                               names,
+                               [ts.units for ts in series],
+                               [ts.meta for ts in series],
+                               series[0].start.tzinfo)
+
+    @property
+    def ureg(self):
+        return TimeSeriesFrame.UnitRegistry
+
+    @property
+    def values(self) -> np.ndarray:
+        """
+        The data of every channel, as an array of shape ``(channels, elements)``.
+        """
+        return self._data
+
+    @property
+    def axis(self) -> TimeAxis:
+        """
+        The x–axis shared by every channel.
+        """
+        return self._axis
+
+    @property
+    def names(self) -> list[str]:
+        """
+        The name of each channel.
+        """
+        return list(self._names)
+
+    @property
+    def units(self) -> dict[str, Unit]:
+        """
+        The units of each channel, by name.
+        """
+        return dict(zip(self._names, self._units))
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """
+        The number of channels and the number of elements in each channel.
+        """
+        return self._data.shape
+
+    @property
+    def period(self) -> float:
+        """
+        Time, in seconds, between subsequent elements.
+        """
+        return self._axis.period
+
+    @property
+    def start(self) -> datetime.datetime:
+        """
+        Datetime of the first element
+        """
+        return datetime.datetime.fromtimestamp(self._axis.start, self._timezone)
+
+    @property
+    def stop(self) -> datetime.datetime:
+        """
+        Datetime of the last element
+        """
+        return datetime.datetime.fromtimestamp(self._axis.stop, self._timezone)
+
+    def __getstate__(self) -> dict:
+        # Units are pickled as strings so that they are re-attached to the shared registry when unpickled
+        state = self.__dict__.copy()
+        state["_units"] = [str(units) for units in self._units]
+
+        return state
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self._units = [_units.parse_units(units) for units in state["_units"]]
+
+    def __len__(self) -> int:
+        """
+        The number of elements in each channel.
+        """
+        return len(self._axis)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._index
+
+    def __iter__(self):
+        return (self[name] for name in self._names)
+
+    def __repr__(self) -> str:
+        return f"TimeSeriesFrame({len(self._names)} channels, {len(self)} elements, {self.start} – {self.stop})"
+
+    def _position(self, key: str | int) -> int:
+        if isinstance(key, str):
+            if key not in self._index:
+                raise KeyError(f"No channel named '{key}'!")
+
+            return self._index[key]
+
+        return range(len(self._names))[key]
+
+    def __getitem__(self, key: str | int) -> TimeSeries:
+        """
+        View a channel, by name or position, as a TimeSeries. The result shares memory with this frame.
+        """
+        i = self._position(key)
+
+        return TimeSeries(self._data[i],
+                          self.start,
+                          self.stop,
+                          self._axis.period,
+                          self._axis.length,
+                          self._units[i],
+                          self._meta[i])
+
+    def select(self, *names: str):
+        """
+        Obtain a new TimeSeriesFrame with only the channels in ``names``.
+        """
+        positions = [self._position(name) for name in names]
+
+        return TimeSeriesFrame(self._data[positions],
+                               self._axis,
+                               list(names),
+                               [self._units[i] for i in positions],
+                               [self._meta[i] for i in positions],
+                               self._timezone)
+
+    def _with(self, data: np.ndarray, units: list[Unit]):
+        """
+        Build a TimeSeriesFrame with the same axis, names, and metadata as this one, without validation.
+        """
+        result = TimeSeriesFrame.__new__(TimeSeriesFrame)
+        result._data = data
+        result._axis = self._axis
+        result._names = self._names
+        result._units = units
+        result._meta = self._meta
+        result._timezone = self._timezone
+        result._index = self._index
+
+        return result
+
+    def _operand(self, other):
+        """
+        Unpack ``other`` into an array which broadcasts against the data of this frame, and the units of each row.
+        Per-channel sequences become columns, and TimeSeries become a single row shared by every channel.
+        """
+        if isinstance(other, TimeSeriesFrame):
+            if not self._axis.is_aligned_with(other._axis) or len(other._names) != len(self._names):
+                raise ValueError("TimeSeriesFrames must share the same axis and number of channels!")
+
+            return other._data, other._units
+
+        if isinstance(other, TimeSeries):
+            if not self._axis.is_aligned_with(other.axis):
+                raise ValueError("TimeSeries must share the same axis as the TimeSeriesFrame!")
+
+            return other.view(np.ndarray)[np.newaxis, :], [other.units] * len(self._names)
+
+        if isinstance(other, self.ureg.Quantity):
+            return other.magnitude, [other.units] * len(self._names)
+
+        # Like scalars, per-channel sequences are assumed to be in the units of each channel
+        if np.ndim(other) == 1:
+            return np.asarray(other)[:, np.newaxis], None
+
+        return other, None
+
+    def _conversion_factors(self, other_units: list[Unit]) -> np.ndarray:
+        """
+        Obtain the factor which converts each channel in ``other_units`` into the units of this frame.
+        """
+        factors = np.empty((len(self._units), 1))
+
+        for i, (units, other) in enumerate(zip(self._units, other_units)):
+            if not _units.is_compatible(units, other):
+                raise ValueError(f"Incompatible units: {units} and {other}")
+
+            factors[i] = _units.conversion_factor(other, units)
+
+        return factors
+
+    def __add__(self, other):
+        data, other_units = self._operand(other)
+
+        if other_units is not None:
+            data = data * self._conversion_factors(other_units)
+
+        return self._with(self._data + data, self._units)
+
+    def __sub__(self, other):
+        data, other_units = self._operand(other)
+
+        if other_units is not None:
+            data = data * self._conversion_factors(other_units)
+
+        return self._with(self._data - data, self._units)
+
+    def __mul__(self, other):
+        data, other_units = self._operand(other)
+
+        if other_units is None:
+            return self._with(self._data * data, self._units)
+
+        return self._with(self._data * data, [_units.multiply_units(a, b) for a, b in zip(self._units, other_units)])
+
+    def __truediv__(self, other):
+        data, other_units = self._operand(other)
+
+        if other_units is None:
+            return self._with(self._data / data, self._units)
+
+        return self._with(self._data / data, [_units.divide_units(a, b) for a, b in zip(self._units, other_units)])
+
+    def __radd__(self, other):
+        return self.__add__(other)
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    def __rsub__(self, other):
+        return (-1 * self).__add__(other)
+
+    def __rtruediv__(self, other):
+        data, other_units = self._operand(other)
+
+        if other_units is None:
+            other_units = [self.ureg.dimensionless] * len(self._names)
+
+        return self._with(data / self._data, [_units.divide_units(a, b) for a, b in zip(other_units, self._units)])
+
+    def convert_to(self, units: dict[str, Unit | str]):
+        """
+        Convert some channels to new units.
+
+        :param dict[str, str | Unit] units: the new units of each channel that will be converted, by name
+        :return: TimeSeriesFrame with converted channels
+        """
+        new_units = list(self._units)
+        for name, channel_units in units.items():
+            new_units[self._position(name)] = _units.parse_units(channel_units) if isinstance(channel_units, str) \
+                else channel_units
+
+        factors = np.empty((len(self._units), 1))
+        for i, (old, new) in enumerate(zip(self._units, new_units)):
+            factors[i] = _units.conversion_factor(old, new)
+
+        return self._with(self._data * factors, new_units)
+
+    def mean(self) -> dict[str, float]:
+        """
+        The mean of each channel, by name.
+        """
+        return dict(zip(self._names, self._data.mean(axis=1).tolist()))
+
+    def min(self) -> dict[str, float]:
+        """
+        The minimum of each channel, by name.
+        """
+        return dict(zip(self._names, self._data.min(axis=1).tolist()))
+
+    def max(self) -> dict[str, float]:
+        """
+        The maximum of each channel, by name.
+        """
+        return dict(zip(self._names, self._data.max(axis=1).tolist()))
@@ -8,9 +8,17 @@ class LanguageLocalization(Localization):
         """
         Return the (field, board, units, frequency)
         """
-        name, board, units, frequency = self._localization_table.lookup(canonical_name, current_date)
+        name, board, units, frequency = self._localization_table.lookup(canonical_name, current_date)[:4]
         return name, board, units, frequency
 
+    def storage_dtype(self, canonical_name: str, current_date: date | str) -> str | None:
+        """
+        Return the dtype that data should be stored as, such as "float32" or "bool", which is the optional fifth
+        element of an entry. Returns ``None`` if the entry does not specify one.
+        """
+        entry = self._localization_table.lookup(canonical_name, current_date)
+        return entry[4] if len(entry) > 4 else None
+
 
 class CanonicalName(StrEnum):
     VehicleSpeed = "VehicleSpeed"
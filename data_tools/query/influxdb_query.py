@@ -1,13 +1,17 @@
 from data_tools.localization import InfluxDBLanguageLocalization, CanonicalName, TemporalLocalization
 from influxdb_client import InfluxDBClient as _InfluxDBClient
 from data_tools.collections.time_series import TimeSeries
-from datetime import datetime, timezone
+from data_tools.collections.segmented_time_series import SegmentedTimeSeries
+from data_tools.collections.raw_series import RawSeries
+from data_tools.collections.chunked_time_series import ChunkedTimeSeries
+from datetime import datetime, timezone, timedelta
 from data_tools.utils.times import ensure_utc
 from data_tools.query.flux import FluxQuery
 from pydantic import BaseModel, Field
 from typing import Optional, Type
 from dotenv import load_dotenv
 import pandas as pd
+import numpy as np
 import os
 
 
@@ -142,7 +146,7 @@ class InfluxDBClient:
         return self._client.query_api().query_data_frame(compiled_query)
 
     def query_series(self, start: datetime, stop: datetime, field: str, bucket: str = "CAN_log",
-                     car: str = "Brightside", measurement: str = None):
+                     car: str = "Brightside", measurement: str = None, allow_empty: bool = False):
         """
         Query the database for a specific field, over a certain time range.
         The data will be returned as a DataFrame.
@@ -152,6 +156,7 @@ class InfluxDBClient:
         :param field: the field which is to be queried.
         :param str bucket: the bucket which will be queried
         :param car: the car which data is being queried for, default is "Brightside".
+        :param allow_empty: if True, an empty DataFrame is returned when there is no data, rather than raising.
         :return: a TimeSeries of the resulting time-series data
         """
         utc_start = ensure_utc(start)
@@ -171,14 +176,15 @@ class InfluxDBClient:
         if isinstance(query_df, list):
             raise ValueError("Query returned multiple fields! Please refine your query.")
 
-        if len(query_df) == 0:
+        if len(query_df) == 0 and not allow_empty:
             raise ValueError("Query is empty! Verify that the data is visible on InfluxDB for the queried bucket.")
 
         return query_df
 
     def query_time_series(self, start: datetime, stop: datetime, field: str | CanonicalName, bucket: str = "CAN_log",
                           car: str = "Brightside", granularity: float = 0.1, units: str = "",
-                          measurement: str = None) -> TimeSeries:
+                          measurement: str = None, max_gap: float = None,
+                          dtype: str = None, allow_empty: bool = False) -> TimeSeries | SegmentedTimeSeries:
         """
         Query the database for a specific field, over a certain time range.
         The data will be processed into a TimeSeries, which has homogenous and evenly-spaced (temporally) elements.
@@ -191,11 +197,20 @@ class InfluxDBClient:
         :param car: the car which data is being queried for, default is "Brightside".
         :param granularity: the temporal granularity of the resulting TimeSeries in seconds, default is 0.1s.
         :param units: the units of the returned data, optional.
+        :param max_gap: if provided, data will not be interpolated across gaps longer than ``max_gap`` seconds, and
+            a SegmentedTimeSeries will be returned instead.
+        :param dtype: the dtype that data will be stored as, such as "float32", optional. Defaults to the dtype
+            in the localization table for a CanonicalName, or float64.
+        :param allow_empty: if True, an empty TimeSeries is returned when there is no data between ``start`` and
+            ``stop``, rather than raising.
         :return: a TimeSeries of the resulting time-series data
         """
         if isinstance(field, CanonicalName):
             field_str, measurement, units, frequency = self._language_localization.localize(field, start.date())
             granularity = 1 / frequency
+
+            if dtype is None:
+                dtype = self._language_localization.storage_dtype(field, start.date())
         else:
             field_str = field
 
@@ -203,14 +218,90 @@ class InfluxDBClient:
         start = start - timezone_fix
         stop = stop - timezone_fix
 
-        query_df = self.query_series(start, stop, field_str, bucket, car, measurement)
-        time_series = TimeSeries.from_query_dataframe(query_df, granularity, field_str, units)
+        query_df = self.query_series(start, stop, field_str, bucket, car, measurement, allow_empty)
+
+        if len(query_df) == 0:
+            empty_start = start + timezone_fix
+            return TimeSeries(np.empty(0, dtype=dtype if dtype is not None else float), empty_start, empty_start,
+                              granularity, 0.0, units, {"car": car, "field": field_str})
+
+        if max_gap is not None:
+            segmented_time_series = SegmentedTimeSeries.from_query_dataframe(query_df, granularity, field_str, units,
+                                                                             max_gap, dtype)
+            return segmented_time_series.shift(timezone_fix)
+
+        time_series = TimeSeries.from_query_dataframe(query_df, granularity, field_str, units, dtype)
 
         time_series._start = time_series._start + timezone_fix
         time_series._stop = time_series._stop + timezone_fix
 
         return time_series
 
+    def query_chunked_time_series(self, start: datetime, stop: datetime, field: str | CanonicalName,
+                                  chunk_duration: timedelta = timedelta(days=1), bucket: str = "CAN_log",
+                                  car: str = "Brightside", granularity: float = 0.1, units: str = "",
+                                  measurement: str = None, dtype: str = None) -> ChunkedTimeSeries:
+        """
+        Lazily query the database for a specific field over a long time range, such as a full season.
+        The range is split into chunks spanning ``chunk_duration``, and each chunk is only queried when
+        its data is needed. Chunks without any data, such as days on which the car did not run, are empty.
+        See :meth:`query_time_series` for the remaining parameters.
+
+        :param chunk_duration: the time spanned by each chunk, default is one day.
+        :return: a ChunkedTimeSeries of the resulting time-series data
+        """
+        if isinstance(field, CanonicalName):
+            units = self._language_localization.localize(field, start.date())[2]
+
+        chunk_starts = []
+        while start + chunk_duration * len(chunk_starts) < stop:
+            chunk_starts.append(start + chunk_duration * len(chunk_starts))
+
+        bounds = [(chunk_start, min(chunk_start + chunk_duration, stop)) for chunk_start in chunk_starts]
+        loaders = [
+            lambda chunk_start=chunk_start, chunk_stop=chunk_stop: self.query_time_series(
+                chunk_start, chunk_stop, field, bucket, car, granularity, units, measurement, dtype=dtype,
+                allow_empty=True
+            )
+            for chunk_start, chunk_stop in bounds
+        ]
+
+        return ChunkedTimeSeries(loaders, bounds, units, {"car": car, "field": str(field)})
+
+    def query_raw_series(self, start: datetime, stop: datetime, field: str | CanonicalName, bucket: str = "CAN_log",
+                         car: str = "Brightside", units: str = "", measurement: str = None,
+                         dtype: str = None) -> RawSeries:
+        """
+        Query the database for a specific field, over a certain time range.
+        Unlike :meth:`query_time_series`, the data keeps its original timestamps and is not re-interpolated.
+
+        :param start: the start time of the query as an ISO 8601-compliant string, such as "2024-06-30T23:00:00Z".
+        :param stop: the end time of the query as an ISO 8601-compliant string, such as "2024-06-30T23:00:00Z".
+        :param field: the field which is to be queried.
+        :param str bucket: the bucket which will be queried
+        :param car: the car which data is being queried for, default is "Brightside".
+        :param units: the units of the returned data, optional.
+        :param dtype: the dtype that values will be stored as, optional. Defaults to the dtype in the localization
+            table for a CanonicalName, or the dtype of the queried data.
+        :return: a RawSeries of the resulting time-series data
+        """
+        if isinstance(field, CanonicalName):
+            field_str, measurement, units, _ = self._language_localization.localize(field, start.date())
+
+            if dtype is None:
+                dtype = self._language_localization.storage_dtype(field, start.date())
+        else:
+            field_str = field
+
+        timezone_fix = self._temporal_localization.localize(start)
+
+        query_df = self.query_series(start - timezone_fix, stop - timezone_fix, field_str, bucket, car, measurement)
+        raw_series = RawSeries.from_query_dataframe(query_df, field_str, units, dtype)
+
+        raw_series._times = raw_series._times + round(timezone_fix.total_seconds() * 1e9)
+
+        return raw_series
+
     def close(self):
         self._client.close()
 
@@ -1,5 +1,5 @@
 from data_tools.query.data_schema import init_schema, CANLog, get_sensor_id, get_data_units
-from data_tools.collections.time_series import TimeSeries
+from data_tools.collections.time_series import TimeSeries, as_storage_dtype
 from sqlalchemy.orm import sessionmaker, Session
 from data_tools.utils.times import ensure_utc
 from sqlalchemy import create_engine, Engine
@@ -68,7 +68,8 @@ class PostgresClient:
         self._session_builder = sessionmaker(bind=self._engine)
         self._session: Session = self._session_builder()
 
-    def query(self, field: str, start_time: datetime, end_time: datetime, granularity: float = 1.0) -> TimeSeries:
+    def query(self, field: str, start_time: datetime, end_time: datetime, granularity: float = 1.0,
+              dtype: str = None) -> TimeSeries:
         """
         Query the database for time-series data matching ``field``, between ``start_time`` and ``end_time``.
 
@@ -82,6 +83,7 @@ class PostgresClient:
         :param datetime.datetime start_time: the UTC datetime of the beginning of the data to be queried
         :param datetime.datetime end_time: the UTC datetime of the end of the data to be queried
         :param float granularity: the desired temporal granularity (time between measurements) of the returned data
+        :param str dtype: the dtype that data will be stored as, such as "float32", defaults to float64
         :return: successfully queried data formatted as a TimeSeries
         :raises IndexError: if no data could be queried
         :raises RuntimeError: if the query failed for any reason
@@ -125,18 +127,19 @@ class PostgresClient:
         # Interpolate the data array onto this new x-axis
         wave = np.interp(x_axis, timestamps, values)
 
-        time_series_dict = {
-            "start": actual_start_time,
-            "stop": actual_end_time,
+        meta = {
             "car": "N/A",
             "measurement": "N/A",
             "field": field,
-            "granularity": granularity,
-            "length": len(x_axis),
-            "units": get_data_units(get_sensor_id(field)),
         }
 
-        return TimeSeries(wave, time_series_dict)
+        return TimeSeries(as_storage_dtype(wave, dtype),
+                          start_time=actual_start_time,
+                          stop_time=actual_end_time,
+                          period=granularity,
+                          length=(len(x_axis) - 1) * granularity,
+                          units=get_data_units(get_sensor_id(field)),
+                          meta=meta)
 
     def init_schema(self):
         """
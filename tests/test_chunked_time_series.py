@@ -0,0 +1,76 @@
+from data_tools.collections import TimeSeries, ChunkedTimeSeries
+import numpy as np
+import math
+import pytest
+import datetime
+
+# Helper Function for testing
+def quick_gen_timeseries(x_data, y_data, units = "m"):
+    time_series = TimeSeries(y_data, 
+                             datetime.datetime.fromtimestamp(x_data[0], tz = datetime.timezone.utc),
+                             datetime.datetime.fromtimestamp(x_data[-1], tz = datetime.timezone.utc),
+                             period = 1.0,
+                             length = x_data[-1] - x_data[0],
+                             units=units)
+    
+    return time_series
+
+def test_chunked_time_series(tmp_path):
+    x = np.array([0, 999]) + 946684800.0
+    power = quick_gen_timeseries(x, np.sin(np.arange(1000) / 50) * 1000, units="W")
+
+    chunked = ChunkedTimeSeries.from_time_series(power, 100)
+    assert chunked.num_chunks == 10
+    assert chunked.units == power.units
+    assert chunked.start == power.start and chunked.stop == power.stop
+
+    # Streaming reductions match the reductions of the whole series
+    assert chunked.count() == len(power)
+    assert math.isclose(chunked.mean(), np.mean(power))
+    assert chunked.min() == np.min(power) and chunked.max() == np.max(power)
+    assert math.isclose(chunked.integral(), power.integrate()[-1])
+    assert math.isclose(chunked.integral(units="Wh"), power.integrate(units="Wh")[-1])
+
+    # Slices only load overlapping chunks
+    loaded = []
+    def loader(chunk):
+        return lambda: loaded.append(chunk) or chunk
+
+    lazy = ChunkedTimeSeries([loader(chunk) for chunk in chunked.chunks()], chunked.bounds, units="W")
+    start = power.start + datetime.timedelta(seconds=250)
+    stop = power.start + datetime.timedelta(seconds=420)
+    sliced = lazy.slice(start, stop)
+    assert len(loaded) == 3
+    assert np.array_equal(sliced, power.slice(start, stop))
+    assert sliced.start == start and sliced.stop == stop
+
+    # Chunk-wise arithmetic composes with TimeSeries units, and is lazy
+    loaded.clear()
+    energy_rate = (lazy * 2) / (1 * TimeSeries.UnitRegistry.second)
+    assert len(loaded) == 0
+    assert energy_rate.units == power.units / TimeSeries.UnitRegistry.second
+    assert math.isclose(energy_rate.mean(), 2 * np.mean(power))
+    assert math.isclose((lazy - chunked).max(), 0)
+    assert math.isclose(lazy.convert_to("kW").max(), np.max(power) / 1000)
+
+    # TimeSeries operands are applied to each chunk over the time they share
+    voltage = quick_gen_timeseries(x, np.full(1000, 2.0), units="V")
+    assert (chunked * voltage).units == power.units * voltage.units
+    assert math.isclose((chunked * voltage).mean(), 2 * np.mean(power))
+    assert math.isclose((chunked + power).max(), 2 * np.max(power))
+    assert (voltage * chunked).units == voltage.units * power.units
+
+    with pytest.raises(ValueError):
+        _ = ChunkedTimeSeries([lambda: power])
+
+    # Reductions over chunks without any data are NaN, as with the statistics of an empty series
+    empty = ChunkedTimeSeries([power[:0], power[:0]])
+    assert empty.count() == 0
+    assert np.isnan(empty.mean()) and np.isnan(empty.min()) and np.isnan(empty.max())
+    assert np.isnan(empty.stats().mean)
+
+    # Chunks written to disk are memory-mapped only when needed
+    chunked.save(tmp_path)
+    opened = ChunkedTimeSeries.open(tmp_path)
+    assert opened.bounds == chunked.bounds
+    assert math.isclose(opened.integral(), chunked.integral())
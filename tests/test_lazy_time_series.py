@@ -0,0 +1,66 @@
+from data_tools.collections import TimeSeries, LazyTimeSeries
+import numpy as np
+import pytest
+import datetime
+
+# Helper Function for testing
+def quick_gen_timeseries(x_data, y_data, units = "m"):
+    time_series = TimeSeries(y_data, 
+                             datetime.datetime.fromtimestamp(x_data[0], tz = datetime.timezone.utc),
+                             datetime.datetime.fromtimestamp(x_data[-1], tz = datetime.timezone.utc),
+                             period = 1.0,
+                             length = x_data[-1] - x_data[0],
+                             units=units)
+    
+    return time_series
+
+def test_lazy_expression():
+    rng = np.random.default_rng(0)
+    x = np.array([0, 999]) + 946684800.0
+    voltages = [quick_gen_timeseries(x, rng.normal(100, 1, 1000), "V") for _ in range(3)]
+    currents = [quick_gen_timeseries(x, rng.normal(5, 1, 1000), "mA") for _ in range(3)]
+    pack_power = quick_gen_timeseries(x, rng.normal(1.5, 0.1, 1000), "W")
+
+    eager = (voltages[0] * currents[0] + voltages[1] * currents[1] + voltages[2] * currents[2]) / pack_power
+
+    v_a, v_b, v_c = (v.lazy() for v in voltages)
+    expression = (v_a * currents[0] + v_b * currents[1] + v_c * currents[2]) / pack_power
+    assert isinstance(expression, LazyTimeSeries)
+    assert expression.units == eager.units
+
+    # Chunks which do not divide the series evenly give the same result
+    lazy = expression.evaluate(chunk_size=64)
+    assert np.allclose(lazy, eager)
+    assert lazy.axis == eager.axis
+
+    # Units are converted as they are for TimeSeries, and ufuncs are fused too
+    in_amps = (currents[0].lazy() + 1 * TimeSeries.UnitRegistry.A - 2).evaluate()
+    assert np.allclose(in_amps, currents[0] + 1 * TimeSeries.UnitRegistry.A - 2)
+    rms = np.sqrt(currents[0].lazy() * currents[0]).evaluate()
+    assert rms.units == np.sqrt(currents[0] * currents[0]).units
+
+    # Misaligned series are re-interpolated onto their common axis, as with TimeSeries.align
+    shifted_start = voltages[0].start + datetime.timedelta(seconds=10.25)
+    shifted = TimeSeries(rng.normal(size=1977), shifted_start, shifted_start + datetime.timedelta(seconds=988),
+                         0.5, 988.0, "A")
+    assert np.allclose((voltages[0].lazy() * shifted).evaluate(chunk_size=100), voltages[0] * shifted)
+
+    # TimeSeries on the left of a lazy operand join the expression, keeping their units and place
+    power_left = currents[0] * voltages[0].lazy()
+    assert isinstance(power_left, LazyTimeSeries)
+    assert power_left.units == (currents[0] * voltages[0]).units
+    assert np.allclose(power_left.evaluate(chunk_size=64), currents[0] * voltages[0])
+    assert np.allclose((currents[0] + currents[1].lazy()).evaluate(chunk_size=64), currents[0] + currents[1])
+    resistance = (voltages[0] / currents[0].lazy()).evaluate(chunk_size=64)
+    assert resistance.units == (voltages[0] / currents[0]).units
+    assert np.allclose(resistance, voltages[0] / currents[0])
+
+    # Bare series, and series combined only with a converted constant, fill every chunk
+    assert np.array_equal(voltages[0].lazy().evaluate(chunk_size=16), voltages[0])
+    assert np.allclose(shifted.lazy().evaluate(chunk_size=16), shifted)
+    offset = (shifted.lazy() + 0 * TimeSeries.UnitRegistry.mA).evaluate(chunk_size=16)
+    assert offset.units == shifted.units
+    assert np.allclose(offset, shifted)
+
+    with pytest.raises(ValueError):
+        _ = voltages[0].lazy() + currents[0]
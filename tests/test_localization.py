@@ -1,7 +1,8 @@
 from data_tools.localization import INFLUXDB_LANGUAGE_LOCALIZATION_TABLE_PATH, SUNBEAMDB_LANGUAGE_LOCALIZATION_TABLE_PATH
-from data_tools.localization import VersionedTable, SpatialLocalization
+from data_tools.localization import VersionedTable, SpatialLocalization, InfluxDBLanguageLocalization
 from datetime import datetime, timezone, timedelta
 from data_tools.localization import CanonicalName
+from data_tools.localization.language_localization import LanguageLocalization
 from data_tools.query import InfluxDBClient
 from datetime import date
 import tomllib
@@ -114,3 +115,24 @@ def test_spatial_localization():
     coords, name = SpatialLocalization.localize(datetime(2025, 1, 16, 13, 59, 0, tzinfo=timezone.utc))
     assert len(coords) == 0
     assert name == "UBC"
+
+
+def test_storage_dtype(tmp_path):
+    # The shipped tables keep every field at the default float64 storage
+    assert InfluxDBLanguageLocalization.storage_dtype(CanonicalName.BrakePressed, date(2025, 7, 1)) is None
+    assert InfluxDBLanguageLocalization.storage_dtype(CanonicalName.PackVoltage, date(2025, 7, 1)) is None
+
+    # A storage dtype is opted into per entry with an optional fifth element
+    table_path = tmp_path / "language_localization.toml"
+    table_path.write_text('[2024-01-01]\n'
+                          'BrakePressed = ["BrakePressed", "DRD", "", 10, "int8"]\n'
+                          'PackVoltage = ["TotalPackVoltage", "BMS", "V", 10]\n')
+    localization = LanguageLocalization(table_path)
+
+    assert localization.storage_dtype(CanonicalName.BrakePressed, date(2025, 7, 1)) == "int8"
+    assert localization.storage_dtype(CanonicalName.PackVoltage, date(2025, 7, 1)) is None
+
+    # The storage dtype does not change the shape of the localized entry
+    field, board, units, frequency = localization.localize(CanonicalName.BrakePressed, date(2025, 7, 1))
+    assert field == "BrakePressed"
+    assert frequency == 10
@@ -1,8 +1,11 @@
 from data_tools.query import InfluxDBClient
 from data_tools.localization import CanonicalName
 from data_tools.collections import TimeSeries
-from datetime import datetime, timezone
+from datetime import datetime, timezone, timedelta
+import pandas as pd
+import numpy as np
 import pytest
+import re
 
 @pytest.mark.ci_skip
 def test_query():
@@ -19,3 +22,35 @@ def test_query():
 
     pack_voltage: TimeSeries = client.query_time_series(start_time, end_time, CanonicalName.VehicleSpeed)
     assert str(pack_voltage.units) == "kilometer / hour"
+
+
+def test_query_chunked_time_series_with_gap_day(monkeypatch):
+    client = InfluxDBClient(influxdb_org="org", influxdb_token="token")
+    start_time = datetime(2024, 7, 12, 0, 0, 0, tzinfo=timezone.utc)
+    gap_day = (start_time + timedelta(days=1)).date()
+
+    # Data every ten minutes, except on the middle day when the car did not run
+    def query_dataframe(query):
+        range_start, range_stop = re.search(r"range\(start: (\S+), stop: (\S+)\)", query.compile_query()).groups()
+        times = pd.date_range(range_start, range_stop, freq="10min", inclusive="left")
+
+        if times[len(times) // 2].date() == gap_day:
+            times = times[:0]
+
+        return pd.DataFrame({"_time": times, "car": "Brightside", "_measurement": "MC",
+                             "BatteryCurrent": np.ones(len(times))})
+
+    monkeypatch.setattr(client, "query_dataframe", query_dataframe)
+
+    chunked = client.query_chunked_time_series(start_time, start_time + timedelta(days=3), "BatteryCurrent",
+                                               granularity=60.0, units="A")
+    chunks = list(chunked.chunks())
+
+    assert chunked.num_chunks == 3
+    assert len(chunks[1]) == 0 and len(chunks[0]) > 0 and len(chunks[2]) > 0
+    assert chunked.count() == len(chunks[0]) + len(chunks[2])
+    assert chunked.mean() == 1.0
+
+    with pytest.raises(ValueError):
+        _ = client.query_time_series(datetime.combine(gap_day, datetime.min.time(), timezone.utc),
+                                     datetime.combine(gap_day, datetime.max.time(), timezone.utc), "BatteryCurrent")
@@ -0,0 +1,60 @@
+from data_tools.collections import TimeSeries, RawSeries
+import numpy as np
+import pytest
+import datetime
+
+def test_raw_series():
+    t = np.array([0.0, 0.5, 3.0, 3.1, 10.0]) + 946684800.0
+    raw = RawSeries(t, [0, 1, 1, 0, 1], "", dtype=np.int8)
+
+    assert raw.dtype == np.int8
+    assert raw.times.dtype == np.dtype("datetime64[ns]")
+    assert raw.nbytes == 5 * 8 + 5
+    assert raw.start == datetime.datetime.fromtimestamp(t[0], tz=datetime.timezone.utc)
+
+    sliced = raw.slice(t[1], datetime.datetime.fromtimestamp(t[3], tz=datetime.timezone.utc))
+    assert np.array_equal(sliced.values, [1, 1, 0])
+    assert np.shares_memory(sliced.values, raw.values)
+
+    queries = np.array([-1.0, 0.6, 3.08, 20.0]) + 946684800.0
+    assert np.array_equal(raw.asof_indices(queries), [-1, 1, 2, 4])
+    assert np.array_equal(raw.asof_indices(queries, direction="forward"), [0, 2, 3, -1])
+    assert np.array_equal(raw.asof_indices(queries, direction="nearest"), [0, 1, 3, 4])
+    assert np.array_equal(raw.asof_indices(queries, direction="nearest", tolerance=0.5), [-1, 1, 3, -1])
+
+    values = raw.asof(queries)
+    assert np.isnan(values[0])
+    assert np.array_equal(values[1:], [1, 1, 1])
+
+    other = RawSeries(np.array([0.0, 5.0]) + 946684800.0, [10.0, 20.0], "m")
+    joined = raw.join_asof(other)
+    assert np.array_equal(joined.times, raw.times)
+    assert np.array_equal(joined.values, [10, 10, 10, 10, 20])
+    assert joined.units == other.units
+    assert np.allclose(other.convert_to("cm").values, [1000, 2000])
+    with pytest.raises(ValueError):
+        _ = other.convert_to("s")
+
+    # Sequences of datetimes are accepted wherever times are
+    query_datetimes = [datetime.datetime.fromtimestamp(t, tz=datetime.timezone.utc) for t in queries]
+    assert np.array_equal(raw.asof_indices(query_datetimes), raw.asof_indices(queries))
+    assert np.array_equal(raw.asof(query_datetimes[1:]), [1, 1, 1])
+
+    ts = raw.to_time_series(period=0.5)
+    assert isinstance(ts, TimeSeries)
+    assert len(ts) == 21
+    assert ts is raw.to_time_series(period=0.5)
+
+    # The cached TimeSeries is shared, so it cannot be modified in place
+    assert ts.frozen
+    with pytest.raises(ValueError):
+        ts[0] = 100.0
+
+    # Integers are UNIX timestamps in seconds, as with TimeSeries, while nanoseconds are given as datetime64
+    whole_seconds = RawSeries(np.array([946684800, 946684803]), [0, 1])
+    assert whole_seconds.start == datetime.datetime(2000, 1, 1, tzinfo=datetime.timezone.utc)
+    assert np.array_equal(whole_seconds.asof([946684802, 946684803]), [0, 1])
+    assert np.array_equal(RawSeries(whole_seconds.times, [0, 1]).times, whole_seconds.times)
+
+    with pytest.raises(ValueError):
+        _ = RawSeries(t[::-1], [0, 1, 1, 0, 1])
@@ -0,0 +1,73 @@
+from data_tools.collections import TimeSeries, SegmentedTimeSeries
+import numpy as np
+import math
+import pytest
+import datetime
+
+# Helper Function for testing
+def quick_gen_timeseries(x_data, y_data, units = "m"):
+    time_series = TimeSeries(y_data, 
+                             datetime.datetime.fromtimestamp(x_data[0], tz = datetime.timezone.utc),
+                             datetime.datetime.fromtimestamp(x_data[-1], tz = datetime.timezone.utc),
+                             period = 1.0,
+                             length = x_data[-1] - x_data[0],
+                             units=units)
+    
+    return time_series
+
+def test_segmented_from_arrays():
+    # Two sessions at 1Hz separated by an hour-long outage
+    t = np.concatenate((np.arange(0, 5), np.arange(3605, 3610))) + 946684800.0
+    y = np.concatenate((np.arange(0, 5), np.arange(10, 15))).astype(float)
+
+    segmented = SegmentedTimeSeries.from_arrays(t, y, 1.0, "m", max_gap=10.0)
+
+    assert len(segmented.segments) == 2
+    assert len(segmented) == 10
+    assert segmented.start == datetime.datetime.fromtimestamp(t[0], tz=datetime.timezone.utc)
+    assert segmented.stop == datetime.datetime.fromtimestamp(t[-1], tz=datetime.timezone.utc)
+    assert np.allclose(segmented.segments[1], [10, 11, 12, 13, 14])
+
+    assert segmented.count() == 10
+    assert math.isclose(segmented.mean(), np.mean(y))
+    assert segmented.min() == 0 and segmented.max() == 14
+
+    dense, mask = segmented.to_timeseries()
+    assert len(dense) == 3610
+    assert mask.sum() == 10
+    assert np.all(np.isnan(dense[~mask]))
+    assert np.allclose(dense[mask], y)
+
+    merged = TimeSeries.merge(segmented, fill_value=-1)
+    assert np.allclose(merged[mask], y)
+    assert np.all(merged[~mask] == -1)
+
+def test_segmented_arithmetic():
+    t = np.concatenate((np.arange(0, 5), np.arange(20, 25))) + 946684800.0
+    segmented = SegmentedTimeSeries.from_arrays(t, np.ones(10), 1.0, "m", max_gap=5.0)
+
+    doubled = 2 * segmented
+    assert doubled.sum() == 20
+    assert doubled.units == segmented.units
+
+    # Only where both operands have data is the result defined
+    ts = quick_gen_timeseries(np.array([3, 21]) + 946684800.0, np.arange(19.0))
+    total = segmented + ts
+    assert [len(segment) for segment in total.segments] == [2, 2]
+    assert np.allclose(total.segments[0], [1, 2])
+    assert np.allclose(total.segments[1], [18, 19])
+
+    # TimeSeries on the left defer to the segmented operators
+    reflected = ts + segmented
+    assert isinstance(reflected, SegmentedTimeSeries)
+    assert np.allclose(reflected.segments[1], [18, 19])
+    product = ts * segmented
+    assert isinstance(product, SegmentedTimeSeries)
+    assert product.units == ts.units * segmented.units
+    assert np.allclose(product.segments[0], [0, 1])
+
+    kilometres = SegmentedTimeSeries(segmented.segments, units="km")
+    assert np.allclose((segmented - kilometres).sum(), 0)
+
+    with pytest.raises(ValueError):
+        _ = SegmentedTimeSeries([ts, ts])
@@ -0,0 +1,58 @@
+from data_tools.collections import TimeSeries, ChunkedTimeSeries, SeriesStats
+import numpy as np
+import math
+import pytest
+import datetime
+
+# Helper Function for testing
+def quick_gen_timeseries(x_data, y_data, units = "m"):
+    time_series = TimeSeries(y_data, 
+                             datetime.datetime.fromtimestamp(x_data[0], tz = datetime.timezone.utc),
+                             datetime.datetime.fromtimestamp(x_data[-1], tz = datetime.timezone.utc),
+                             period = 1.0,
+                             length = x_data[-1] - x_data[0],
+                             units=units)
+    
+    return time_series
+
+def test_stats():
+    rng = np.random.default_rng(0)
+    values = rng.normal(100, 5, 200000)
+    ts = quick_gen_timeseries(np.array([0, 199999]) + 946684800.0, values, "W")
+
+    stats = ts.stats()
+    assert isinstance(stats, SeriesStats)
+    assert stats.count == len(values)
+    assert math.isclose(stats.mean, np.mean(values))
+    assert math.isclose(stats.std(), np.std(values))
+    assert math.isclose(stats.std(ddof=1), np.std(values, ddof=1))
+    assert (stats.min, stats.max) == (np.min(values), np.max(values))
+    assert math.isclose(stats.integral(), ts.integrate()[-1])
+    assert math.isclose(stats.integral("kWh"), ts.integrate("kWh")[-1])
+
+    # Statistics of adjacent pieces merge into the statistics of the whole
+    chunked = ChunkedTimeSeries.from_time_series(ts, 30000)
+    merged = chunked.stats()
+    assert merged.count == stats.count
+    assert math.isclose(merged.std(), stats.std())
+    assert math.isclose(merged.integral(), stats.integral())
+    pieces = [chunk.stats() for chunk in chunked.chunks()]
+    assert math.isclose(pieces[2].merge(pieces[1]).merge(pieces[0]).integral(), ts[:90000].stats().integral())
+
+    # Pieces are combined in any order, while merging a piece between already-merged pieces is rejected
+    combined = SeriesStats.combine([pieces[0], pieces[2], pieces[1]])
+    assert combined.count == 90000
+    assert math.isclose(combined.std(), ts[:90000].stats().std())
+    assert math.isclose(combined.integral(), ts[:90000].stats().integral())
+    with pytest.raises(ValueError):
+        _ = pieces[0].merge(pieces[2]).merge(pieces[1])
+
+    # Pieces with a gap between them are not integrated across it, and overlapping pieces cannot be merged
+    assert math.isclose(pieces[0].merge(pieces[2]).integral(), pieces[0].integral() + pieces[2].integral())
+    with pytest.raises(ValueError):
+        _ = pieces[0].merge(pieces[0])
+
+    # Only frozen series cache their statistics
+    assert ts.stats() is not ts.stats()
+    ts.freeze()
+    assert ts.stats() is ts.stats()
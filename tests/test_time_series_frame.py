@@ -0,0 +1,71 @@
+from data_tools.collections import TimeSeries, TimeSeriesFrame
+import numpy as np
+import pytest
+import datetime
+
+# Helper Function for testing
+def quick_gen_timeseries(x_data, y_data, units = "m"):
+    time_series = TimeSeries(y_data, 
+                             datetime.datetime.fromtimestamp(x_data[0], tz = datetime.timezone.utc),
+                             datetime.datetime.fromtimestamp(x_data[-1], tz = datetime.timezone.utc),
+                             period = 1.0,
+                             length = x_data[-1] - x_data[0],
+                             units=units)
+    
+    return time_series
+
+def test_time_series_frame():
+    voltage = quick_gen_timeseries(np.array([0, 9]) + 946684800.0, np.linspace(100, 109, 10), units="V")
+    current = quick_gen_timeseries(np.array([2, 11]) + 946684800.0, np.arange(10.0), units="A")
+
+    frame = TimeSeriesFrame.from_series(voltage, current, names=["PackVoltage", "PackCurrent"])
+    aligned_voltage, aligned_current = TimeSeries.align(voltage, current)
+
+    assert frame.shape == (2, 8)
+    assert frame.values.flags.c_contiguous
+    assert frame.start == aligned_voltage.start
+    assert np.allclose(frame["PackVoltage"], aligned_voltage)
+    assert np.allclose(frame[1], aligned_current)
+    assert frame["PackCurrent"].units == current.units
+
+    # Columns are views into the frame
+    column = frame["PackCurrent"]
+    assert np.shares_memory(column, frame.values)
+    column[0] = -1
+    assert frame.values[1, 0] == -1
+    column[0] = 0
+
+    # Column-wise math with per-channel units
+    power = frame * frame["PackCurrent"]
+    assert np.allclose(power["PackVoltage"], aligned_voltage * aligned_current)
+    assert power.units["PackVoltage"] == voltage.units * current.units
+
+    offset = frame + [1000, 1]
+    assert np.allclose(offset["PackVoltage"], aligned_voltage + 1000)
+    assert np.allclose(offset["PackCurrent"], aligned_current + 1)
+
+    converted = frame.convert_to({"PackVoltage": "kV"})
+    assert np.allclose((frame - converted).values, 0)
+    assert frame.max()["PackCurrent"] == 7
+
+    # TimeSeries and numpy scalars on the left defer to the frame
+    reflected = aligned_current + frame.select("PackCurrent")
+    assert isinstance(reflected, TimeSeriesFrame)
+    assert np.allclose(reflected["PackCurrent"], 2 * aligned_current)
+    assert isinstance(aligned_current * frame, TimeSeriesFrame)
+    assert (aligned_current * frame).units["PackVoltage"] == current.units * voltage.units
+    doubled = np.float64(2) * frame
+    assert isinstance(doubled, TimeSeriesFrame)
+    assert np.allclose(doubled.values, 2 * frame.values)
+
+    inverse = 1 / frame.select("PackVoltage")
+    assert np.allclose(inverse["PackVoltage"], 1 / aligned_voltage)
+    assert inverse.units["PackVoltage"] == 1 / voltage.units
+    conductance = aligned_current / frame.select("PackVoltage")
+    assert np.allclose(conductance["PackVoltage"], aligned_current / aligned_voltage)
+    assert conductance.units["PackVoltage"] == current.units / voltage.units
+
+    with pytest.raises(ValueError):
+        _ = frame + quick_gen_timeseries(np.array([0, 4]) + 946684800.0, np.arange(5.0))
+    with pytest.raises(KeyError):
+        _ = frame["MotorCurrent"]
@@ -1,8 +1,19 @@
-from data_tools.collections import TimeSeries
+from data_tools.collections import TimeSeries, SegmentedTimeSeries, RawSeries
+from data_tools.collections import TimeSeriesFrame, ChunkedTimeSeries
+from data_tools.collections import _shared_memory
 import numpy as np
+import pickle
+import copy
+from concurrent.futures import ProcessPoolExecutor
 import math
 import pytest
 import datetime
+import warnings
+import stat
+import os
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
 
 # Helper Function for testing
 def quick_gen_timeseries(x_data, y_data, units = "m"):
@@ -588,4 +599,735 @@ def test_convert_to():
     assert ts2.units == ts2.ureg.foot/ts2.ureg.minute
 
     with pytest.raises(ValueError): 
-        _ = ts1.convert_to("ft")
\ No newline at end of file
+        _ = ts1.convert_to("ft")
+
+def test_index_of():
+    y = np.arange(100, dtype=float)
+    x = np.array([0, 9.9]) + 946684800.0
+
+    ts = TimeSeries(y,
+                    datetime.datetime.fromtimestamp(x[0], tz=datetime.timezone.utc),
+                    datetime.datetime.fromtimestamp(x[-1], tz=datetime.timezone.utc),
+                    period=0.1,
+                    length=9.9)
+
+    assert ts.index_of(0.0) == 0
+    assert ts.index_of(0.26) == 3
+    assert ts.index_of(9.9) == 99
+    assert ts[4.04] == 40
+
+    assert np.array_equal(ts.indices_of([0.0, 0.26, 5.0, 9.9]), [0, 3, 50, 99])
+
+    with pytest.raises(ValueError):
+        _ = ts.index_of(10.5)
+
+    with pytest.raises(ValueError):
+        _ = ts.indices_of([1.0, -0.5])
+
+    # Grid points on the edges of a slice are kept despite floating-point error (2.3 / 0.1 = 22.999...)
+    def after(seconds):
+        return ts.start + datetime.timedelta(seconds=seconds)
+
+    assert np.array_equal(ts.slice(after(0.7), after(2.3)), np.arange(7, 24))
+    assert np.array_equal(ts.slice(after(5.1), after(5.3)), [51, 52, 53])
+    assert np.array_equal(ts.slice(after(0.75), after(2.25)), np.arange(8, 23))
+
+def test_slice_is_view():
+    y_data = np.arange(16, dtype=float)
+    x_data = np.array([4, 19]) + 946684800.0
+
+    time_series = quick_gen_timeseries(x_data, y_data)
+    time_series.meta = {"field": "VehicleSpeed"}
+
+    t1 = datetime.datetime.fromtimestamp(946684800.0 + 5, tz=datetime.timezone.utc)
+    t2 = datetime.datetime.fromtimestamp(946684800.0 + 8.5, tz=datetime.timezone.utc)
+
+    sliced = time_series.slice(t1, t2)
+
+    assert np.shares_memory(sliced, time_series)
+    assert np.allclose(sliced, [1, 2, 3, 4])
+    assert sliced.start == t1
+    assert sliced.stop.timestamp() == 946684800.0 + 8
+    assert sliced.length == 3
+    assert sliced.meta == {"field": "VehicleSpeed"}
+    assert sliced.units == time_series.units
+
+def test_slice_many():
+    from data_tools.schema import Event
+
+    y_data = np.arange(16, dtype=float)
+    x_data = np.array([4, 19]) + 946684800.0
+
+    time_series = quick_gen_timeseries(x_data, y_data)
+
+    def utc(seconds):
+        return datetime.datetime.fromtimestamp(946684800.0 + seconds, tz=datetime.timezone.utc)
+
+    windows = [Event(utc(5), utc(7)), (utc(2), utc(5.5)), (utc(17.2), utc(30))]
+    sliced = time_series.slice_many(windows)
+
+    assert len(sliced) == 3
+    assert np.allclose(sliced[0], [1, 2, 3])
+    assert np.allclose(sliced[1], [0, 1])
+    assert np.allclose(sliced[2], [14, 15])
+    assert all(np.shares_memory(s, time_series) for s in sliced)
+
+    with pytest.raises(ValueError):
+        _ = time_series.slice_many([(utc(5), utc(7)), (utc(20), utc(30))])
+
+    # Windows on the grid of a non-integer period keep their edge elements
+    for period in [0.1, 0.2, 1 / 3]:
+        fine = TimeSeries(np.arange(300, dtype=float), utc(0), utc(299 * period), period, 299 * period)
+        windows = [(utc(7 * period), utc(23 * period)), (utc(51 * period), utc(53 * period))]
+
+        first, second = fine.slice_many(windows)
+        assert np.array_equal(first, np.arange(7, 24))
+        assert np.array_equal(second, [51, 52, 53])
+        assert fine.range_stats(*windows[0])["count"] == 17
+
+def test_cached_x_axis():
+    y = [1, 2, 3, 4]
+    x = np.array([0, 3]) + 946684800.0
+
+    ts = quick_gen_timeseries(x, y)
+
+    assert np.allclose(ts.x_axis, [0, 1, 2, 3])
+    assert np.allclose(ts.unix_x_axis, x[0] + np.array([0, 1, 2, 3]))
+    assert ts.datetime_x_axis[1] == ts.start + datetime.timedelta(seconds=1)
+
+    # Materialized axes are cached and read-only
+    assert ts.unix_x_axis is ts.unix_x_axis
+    assert not ts.unix_x_axis.flags.writeable
+
+    # Changing the start invalidates the cached axes
+    ts._start = ts.start + datetime.timedelta(seconds=10)
+    assert np.allclose(ts.unix_x_axis, x[0] + 10 + np.array([0, 1, 2, 3]))
+    assert ts.datetime_x_axis[0] == ts.start
+
+def test_time_axis_arithmetic():
+    from data_tools.collections import TimeAxis
+
+    axis_1 = TimeAxis(100.0, 1.0, 10)
+    axis_2 = TimeAxis(104.0, 0.5, 21)
+
+    intersection = axis_1.intersection(axis_2)
+    assert intersection == TimeAxis(104.0, 0.5, 11)
+    assert intersection.stop == 109.0
+
+    union = axis_1.union(axis_2)
+    assert union == TimeAxis(100.0, 0.5, 29)
+    assert union.stop == 114.0
+
+    assert axis_1.intersection(TimeAxis(200.0, 1.0, 5)) is None
+
+def test_aligned_arithmetic_fast_path(monkeypatch):
+    x = np.array([0, 1, 2]) + 946684800.0
+
+    ts1 = quick_gen_timeseries(x, [1, 2, 3], units="V")
+    ts2 = quick_gen_timeseries(x, [4, 5, 6], units="A")
+    ts3 = quick_gen_timeseries(x + 1, [4, 5, 6], units="A")
+
+    assert ts1.is_aligned_with(ts2)
+    assert not ts1.is_aligned_with(ts3)
+
+    def fail_align(*args):
+        raise AssertionError("align should not be called for aligned operands")
+
+    monkeypatch.setattr(TimeSeries, "align", staticmethod(fail_align))
+
+    power = ts1 * ts2
+    assert np.allclose(power, [4, 10, 18])
+    assert power.units == ts1.units * ts2.units
+    assert np.allclose(power - power / 2, [2, 5, 9])
+
+def test_unit_cache():
+    from data_tools.collections import unit_cache_info, clear_unit_cache
+
+    clear_unit_cache()
+
+    x = [0, 1, 2]
+    ts1 = quick_gen_timeseries(x, [1, 2, 3], units="km")
+    ts2 = quick_gen_timeseries(x, [4, 5, 6], units="m")
+
+    for _ in range(10):
+        result = ts1 + ts2
+
+    assert np.allclose(result, [1.004, 2.005, 3.006])
+
+    info = unit_cache_info()
+    assert info["conversion_factor"]["misses"] == 1
+    assert info["conversion_factor"]["hits"] == 9
+    assert info["is_compatible"]["hit_rate"] == 0.9
+    assert 0 < info["total"]["hit_rate"] < 1
+
+def test_ufunc_metadata_propagation():
+    x = np.array([0, 1, 2]) + 946684800.0
+
+    ts = quick_gen_timeseries(x, [1, 4, 9], units="V**2")
+    ts.meta = {"field": "PackVoltageSquared"}
+
+    root = np.sqrt(ts)
+    assert isinstance(root, TimeSeries)
+    assert np.allclose(root, [1, 2, 3])
+    assert root.units == ts.ureg.volt
+    assert root.start == ts.start and root.period == ts.period
+    assert root.meta == ts.meta
+
+    cumulative = np.cumsum(ts)
+    assert isinstance(cumulative, TimeSeries)
+    assert np.allclose(cumulative, [1, 5, 14])
+    assert cumulative.units == ts.units
+
+    assert np.abs(-ts).units == ts.units
+    assert np.square(root).units == ts.units
+    assert (ts > 2).units == ts.ureg.dimensionless
+
+    # Reductions and results which do not lie on the x-axis are plain NumPy objects
+    assert not isinstance(np.max(ts), TimeSeries)
+    assert np.isclose(np.mean(ts), 14 / 3)
+    assert not isinstance(np.diff(ts), TimeSeries)
+
+def test_ufunc_unit_conversion():
+    x = [0, 1, 2]
+
+    metres = quick_gen_timeseries(x, [1, 2, 3], units="m")
+    kilometres = quick_gen_timeseries(x, [1, 2, 3], units="km")
+    seconds = quick_gen_timeseries(x, [1, 2, 3], units="s")
+
+    assert np.allclose(np.maximum(metres, kilometres), [1000, 2000, 3000])
+    assert np.maximum(metres, kilometres).units == metres.units
+
+    with pytest.raises(ValueError):
+        _ = np.add(metres, seconds)
+
+    in_place = metres.copy()
+    in_place *= seconds
+    assert in_place.units == metres.units * seconds.units
+
+def test_from_query_dataframe():
+    import pandas as pd
+
+    times = pd.to_datetime(946684800.0 + np.array([0.0, 0.4, 1.1, 1.5, 2.0]), unit="s", utc=True)
+    query_df = pd.DataFrame({
+        "_time": times,
+        "car": "Brightside",
+        "_measurement": "BMS",
+        "TotalPackVoltage": [100.0, 101.0, 102.0, 103.0, 104.0],
+    })
+    original_df = query_df.copy()
+
+    ts = TimeSeries.from_query_dataframe(query_df, 0.5, "TotalPackVoltage", "V")
+
+    # The caller's DataFrame is left untouched
+    pd.testing.assert_frame_equal(query_df, original_df)
+
+    assert len(ts) == 5
+    assert ts.period == 0.5
+    assert ts.length == 2.0
+    assert ts.start == times[0].to_pydatetime()
+    assert ts.stop == times[-1].to_pydatetime()
+    assert np.allclose(ts, np.interp([0, 0.5, 1.0, 1.5, 2.0], [0.0, 0.4, 1.1, 1.5, 2.0], query_df["TotalPackVoltage"]))
+    assert ts.meta == {"car": "Brightside", "measurement": "BMS", "field": "TotalPackVoltage"}
+    assert ts.units == ts.ureg.volt
+
+def test_from_arrays():
+    values = [1.0, 2.0, 3.0]
+    seconds = np.array([0.0, 1.0, 2.0]) + 946684800.0
+
+    from_seconds = TimeSeries.from_arrays(seconds, values, 1.0, "m")
+    from_datetime64 = TimeSeries.from_arrays((seconds * 1e9).astype("datetime64[ns]"), values, 1.0, "m")
+    from_integers = TimeSeries.from_arrays(seconds.astype(np.int64), values, 1.0, "m")
+
+    for ts in (from_seconds, from_datetime64, from_integers):
+        assert np.allclose(ts, values)
+        assert ts.start.timestamp() == 946684800.0
+        assert ts.length == 2.0
+
+    # Timestamps are anchored to the nearest microsecond, which datetimes can represent
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        offset = TimeSeries.from_arrays(np.array([946684800_000_000_700, 946684801_000_000_700], dtype="datetime64[ns]"),
+                                        [0.0, 1.0], 0.5, "m")
+
+    assert offset.start == datetime.datetime(2000, 1, 1, 0, 0, 0, 1, tzinfo=datetime.timezone.utc)
+    assert offset.length == 1.0
+    assert np.allclose(offset, [0, 0.5, 1], atol=1e-6)
+
+def test_resample_block_methods():
+    y = [1, 5, 2, 8, 3, 3, 4, 0, 9, 1]
+    x = np.array([0, 0.9]) + 946684800.0
+
+    ts = TimeSeries(y,
+                    datetime.datetime.fromtimestamp(x[0], tz=datetime.timezone.utc),
+                    datetime.datetime.fromtimestamp(x[-1], tz=datetime.timezone.utc),
+                    period=0.1,
+                    length=0.9,
+                    units="A")
+
+    mean = ts.resample(0.2, method="mean")
+    assert np.allclose(mean, [3, 5, 3, 2, 5])
+    assert mean.period == 0.2
+    assert np.isclose(mean.length, 0.8)
+    assert mean.start == ts.start
+    assert mean.units == ts.units
+
+    assert np.allclose(ts.resample(0.2, method="min"), [1, 2, 3, 0, 1])
+    assert np.allclose(ts.resample(0.2, method="max"), [5, 8, 3, 4, 9])
+    assert np.allclose(ts.resample(0.2, method="last"), [5, 8, 3, 0, 1])
+
+    # Blocks which do not evenly divide the data
+    assert np.allclose(ts.resample(0.3, method="max"), [5, 8, 9, 1])
+    assert np.allclose(ts.resample(0.3, method="mean"), [8 / 3, 14 / 3, 13 / 3, 1])
+
+    with pytest.raises(ValueError):
+        _ = ts.resample(0.05, method="mean")
+
+    with pytest.raises(ValueError):
+        _ = ts.resample(0.2, method="median")
+
+def test_resample_linear_and_fir():
+    x = np.array([0, 4]) + 946684800.0
+    ts = quick_gen_timeseries(x, [0, 2, 4, 6, 8])
+
+    upsampled = ts.resample(0.5, method="linear")
+    assert np.allclose(upsampled, np.arange(9))
+    assert upsampled.period == 0.5
+
+    # An FIR decimation of a tone above the new Nyquist frequency should be strongly attenuated
+    n = 1000
+    tone = np.sin(2 * np.pi * 0.45 * np.arange(n) * 1.0)
+    tone_ts = quick_gen_timeseries(np.array([0, n - 1]), tone)
+    decimated = tone_ts.resample(4.0, method="fir")
+
+    assert decimated.period == 4.0
+    assert len(decimated) == n // 4
+    assert np.max(np.abs(decimated[10:-10])) < 0.1
+
+def test_rolling_statistics():
+    rng = np.random.default_rng(0)
+    y = rng.normal(100, 5, 50)
+    x = np.array([0, 4.9]) + 946684800.0
+
+    ts = TimeSeries(y,
+                    datetime.datetime.fromtimestamp(x[0], tz=datetime.timezone.utc),
+                    datetime.datetime.fromtimestamp(x[-1], tz=datetime.timezone.utc),
+                    period=0.1,
+                    length=4.9,
+                    units="A")
+
+    windows = np.lib.stride_tricks.sliding_window_view(y, 7)
+
+    for window in (0.7, datetime.timedelta(milliseconds=700)):
+        mean = ts.rolling_mean(window)
+
+        assert isinstance(mean, TimeSeries)
+        assert mean.units == ts.units
+        assert mean.start == ts.start
+        assert np.all(np.isnan(mean[:6]))
+        assert np.allclose(mean[6:], windows.mean(axis=1))
+
+    assert np.allclose(ts.rolling_sum(0.7)[6:], windows.sum(axis=1))
+    assert np.allclose(ts.rolling_std(0.7)[6:], windows.std(axis=1))
+    assert np.allclose(ts.rolling_std(0.7, ddof=1)[6:], windows.std(axis=1, ddof=1))
+    assert np.allclose(ts.rolling_min(0.7)[6:], windows.min(axis=1))
+    assert np.allclose(ts.rolling_max(0.7)[6:], windows.max(axis=1))
+
+    # Windows which evenly divide the data, and windows of a single element
+    assert np.allclose(ts.rolling_max(1.0)[9:], np.lib.stride_tricks.sliding_window_view(y, 10).max(axis=1))
+    assert np.allclose(ts.rolling_min(0.1), y)
+
+    with pytest.raises(ValueError):
+        _ = ts.rolling_mean(10.0)
+
+    # NaN only affects the windows which contain it
+    y_nan = y.copy()
+    y_nan[20] = np.nan
+    nan_windows = np.lib.stride_tricks.sliding_window_view(y_nan, 7)
+    ts_nan = TimeSeries(y_nan, ts.start, ts.stop, period=0.1, length=4.9, units="A")
+
+    for rolled, expected in ((ts_nan.rolling_mean(0.7), nan_windows.mean(axis=1)),
+                             (ts_nan.rolling_std(0.7), nan_windows.std(axis=1)),
+                             (ts_nan.rolling_min(0.7), nan_windows.min(axis=1)),
+                             (ts_nan.rolling_max(0.7), nan_windows.max(axis=1))):
+        assert np.all(np.isnan(rolled[20:27]))
+        assert np.allclose(rolled[6:], expected, equal_nan=True)
+
+def test_integrate():
+    x = np.array([0, 4]) + 946684800.0
+    power = quick_gen_timeseries(x, [0, 3600, 3600, 7200, 0], units="W")
+
+    energy = power.integrate()
+    assert np.allclose(energy, [0, 1800, 5400, 10800, 14400])
+    assert energy.units == power.ureg.watt * power.ureg.second
+    assert energy.start == power.start and energy.period == power.period
+
+    energy_wh = power.integrate(units="Wh")
+    assert np.allclose(energy_wh, [0, 0.5, 1.5, 3, 4])
+    assert energy_wh.units == power.ureg.watt_hour
+
+    with pytest.raises(ValueError):
+        _ = power.integrate(units="m")
+
+    # Too short to integrate over any time
+    assert np.array_equal(power[:1].integrate(), [0.0])
+    assert len(power[:0].integrate()) == 0
+
+def test_integrate_incremental():
+    x = np.array([0, 4]) + 946684800.0
+    power = quick_gen_timeseries(x, [0, 3600, 3600, 7200, 0], units="W")
+    extended_power = quick_gen_timeseries(np.array([0, 6]) + 946684800.0, [0, 3600, 3600, 7200, 0, 3600, 3600], units="W")
+
+    energy = power.integrate(units="Wh")
+    extended_energy = extended_power.integrate(units="Wh", initial=energy)
+
+    assert np.allclose(extended_energy, extended_power.integrate(units="Wh"))
+    assert np.allclose(extended_power.integrate(initial=energy), extended_power.integrate())
+
+    with pytest.raises(ValueError):
+        _ = power.integrate(initial=extended_energy)
+
+def test_derivative():
+    x = np.array([0, 4]) + 946684800.0
+    speed = quick_gen_timeseries(x, [0, 2, 4, 6, 8], units="m/s")
+
+    acceleration = speed.derivative()
+    assert np.allclose(acceleration, [2, 2, 2, 2, 2])
+    assert acceleration.units == speed.ureg.meter / speed.ureg.second ** 2
+
+    assert np.allclose(speed.derivative(units="km/h/s"), 7.2)
+
+    # Too short to differentiate, so treated as constant
+    assert np.array_equal(speed[:1].derivative(), [0.0])
+    assert len(speed[:0].derivative()) == 0
+
+def test_storage_dtype():
+    t = np.arange(0, 10.0, 0.5) + 946684800.0
+    y = np.sin(t)
+
+    ts = TimeSeries.from_arrays(t, y, 0.5, "V")
+    narrow = TimeSeries.from_arrays(t, y, 0.5, "V", dtype="float32")
+    assert narrow.dtype == np.float32
+    assert narrow.memory_usage() == ts.memory_usage() // 2
+    assert np.allclose(narrow, ts, atol=1e-6)
+
+    flags = TimeSeries.from_arrays(t, y > 0, 0.5, "", dtype="int8")
+    assert flags.dtype == np.int8
+    assert np.array_equal(flags, y > 0)
+
+    # Arithmetic and alignment only upcast when needed
+    assert (narrow * 2.0).dtype == np.float32
+    assert (narrow + ts).dtype == np.float64
+    assert TimeSeries.align(narrow, narrow.shift(0.25))[0].dtype == np.float32
+    assert TimeSeries.merge(narrow, narrow.shift(20)).dtype == np.float32
+    assert TimeSeries.merge(flags, flags.shift(20), fill_value=np.nan).dtype == np.float64
+
+    fresh = TimeSeries.from_arrays(t, y, 0.5, "V", dtype="float32")
+    assert fresh.memory_usage(deep=True) == fresh.nbytes
+    _ = fresh.x_axis
+    assert fresh.memory_usage(deep=True) == fresh.nbytes + len(fresh) * 8
+
+def test_pickle():
+    x = np.array([0, 9]) + 946684800.0
+    ts = quick_gen_timeseries(x, np.arange(10.0), units="m/s")
+    ts._meta = {"field": "VehicleVelocity"}
+
+    for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+        restored = pickle.loads(pickle.dumps(ts, protocol=protocol))
+
+        assert isinstance(restored, TimeSeries)
+        assert np.array_equal(restored, ts)
+        assert restored.start == ts.start and restored.stop == ts.stop
+        assert restored.period == ts.period and restored.length == ts.length
+        assert restored.meta == ts.meta
+
+        # Units are re-attached to the shared registry, so arithmetic with other series still works
+        assert restored.units == ts.units
+        assert np.allclose(restored - ts, 0)
+
+    # Under protocol 5, the data can be transferred out-of-band without a copy
+    large = quick_gen_timeseries(np.array([0, 9999]) + 946684800.0, np.arange(10000.0), units="m/s")
+    buffers = []
+    data = pickle.dumps(large, protocol=5, buffer_callback=buffers.append)
+    assert len(buffers) == 1
+    assert len(data) < 1000
+
+    restored = pickle.loads(data, buffers=buffers)
+    assert np.shares_memory(restored, large)
+    assert restored.units == large.units
+
+    frame = pickle.loads(pickle.dumps(TimeSeriesFrame.from_series(ts, ts * 2, names=["a", "b"])))
+    assert frame.units["b"] == ts.units
+    assert np.allclose(frame["b"], ts * 2)
+
+    raw = pickle.loads(pickle.dumps(RawSeries(x, [1.0, 2.0], "V")))
+    assert raw.units == TimeSeries.UnitRegistry.volt
+
+def _double_shared(handle):
+    ts = TimeSeries.from_shared(handle)
+    ts *= 2
+    result = str(ts.units), ts.meta, ts.start
+
+    # Workers release their attachment to the segment once they no longer view it
+    del ts
+    handle.close()
+
+    return *result, handle.name in _shared_memory._ATTACHED_SEGMENTS
+
+def test_shared_memory():
+    x = np.array([0, 9]) + 946684800.0
+    ts = quick_gen_timeseries(x, np.arange(10.0), units="A")
+    ts._meta = {"field": "PackCurrent"}
+
+    with ts.to_shared() as handle:
+        # The handle is small, regardless of the size of the data
+        assert len(pickle.dumps(handle)) < 1000
+
+        attached = TimeSeries.from_shared(handle)
+        assert np.array_equal(attached, ts)
+        assert not np.shares_memory(attached, ts)
+
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            units, meta, start, still_attached = executor.submit(_double_shared, handle).result()
+
+        # The worker modified the data in place, without copying it
+        assert np.array_equal(attached, ts * 2)
+        assert units == str(ts.units)
+        assert meta == ts.meta
+        assert start == ts.start
+        assert not still_attached
+
+        del attached
+
+    with pytest.raises(ValueError):
+        _ = TimeSeries.from_shared(handle)
+
+    # Closing while a TimeSeries still views the segment keeps it mapped until the view is released
+    handle = ts.to_shared()
+    attached = TimeSeries.from_shared(handle)
+    handle.close()
+
+    assert np.array_equal(attached, ts)
+    assert len(_shared_memory._RELEASED_SEGMENTS) == 1
+    with pytest.raises(ValueError):
+        _ = TimeSeries.from_shared(handle)
+
+    del attached
+    handle.close()
+    assert len(_shared_memory._RELEASED_SEGMENTS) == 0
+
+def test_save_and_open(tmp_path):
+    x = np.array([0, 999]) + 946684800.0
+    ts = quick_gen_timeseries(x, np.arange(1000, dtype=np.float32), units="km/h")
+    ts._meta = {"field": "VehicleSpeed", "car": "Brightside"}
+
+    path = tmp_path / "speed.ts"
+    ts.save(path)
+
+    opened = TimeSeries.open(path)
+    assert isinstance(opened, TimeSeries)
+    assert isinstance(opened.base, np.memmap)
+    assert opened.dtype == np.float32
+    assert np.array_equal(opened, ts)
+    assert opened.start == ts.start and opened.stop == ts.stop
+    assert opened.period == ts.period and opened.length == ts.length
+    assert opened.units == ts.units
+    assert opened.meta == ts.meta
+
+    # Data is aligned within the file
+    assert (opened.base.offset % 64) == 0
+
+    with pytest.raises(ValueError):
+        opened[0] = 1
+
+    # Writes go through to the file in "r+" mode
+    writable = TimeSeries.open(path, mode="r+")
+    writable[0] = 42
+    writable.base.flush()
+    del writable
+    assert TimeSeries.open(path)[0] == 42
+
+    # Modes which would truncate the file are rejected
+    with pytest.raises(ValueError):
+        _ = TimeSeries.open(path, mode="w+")
+    assert TimeSeries.open(path)[0] == 42
+
+    # Saved files get the usual permissions of new files, rather than those of temporary files
+    umask = os.umask(0)
+    os.umask(umask)
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o666 & ~umask
+
+    # A failed write leaves the existing file untouched
+    ts._meta = {"callback": print}
+    with pytest.raises(ValueError):
+        ts.save(path)
+    assert TimeSeries.open(path).meta == {"field": "VehicleSpeed", "car": "Brightside"}
+    assert [p.name for p in tmp_path.iterdir()] == ["speed.ts"]
+
+    (tmp_path / "data.csv").write_text("_time,_value\n")
+    with pytest.raises(ValueError):
+        _ = TimeSeries.open(tmp_path / "data.csv")
+
+def test_merge_policies():
+    first = quick_gen_timeseries(np.array([0, 4]) + 946684800.0, [1.0, 1, 1, 1, 1])
+    second = quick_gen_timeseries(np.array([3, 6]) + 946684800.0, [3.0, 3, 3, 3])
+    later = quick_gen_timeseries(np.array([10, 11]) + 946684800.0, [0.0, 5])
+
+    assert np.array_equal(TimeSeries.merge(first, second), [1, 1, 1, 3, 3, 3, 3])
+    assert np.array_equal(TimeSeries.merge(first, second, policy="first"), [1, 1, 1, 1, 1, 3, 3])
+    assert np.array_equal(TimeSeries.merge(first, second, policy="mean"), [1, 1, 1, 2, 2, 3, 3])
+
+    # Gaps can be told apart from real zeros
+    merged, mask = TimeSeries.merge(first, later, return_mask=True)
+    assert np.array_equal(merged, [1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 5])
+    assert np.array_equal(mask, [1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1])
+
+    segmented = TimeSeries.merge(later, second, first, segmented=True)
+    assert isinstance(segmented, SegmentedTimeSeries)
+    assert [len(segment) for segment in segmented.segments] == [7, 2]
+    assert segmented.segments[1].start == later.start
+    assert np.array_equal(segmented.segments[0], [1, 1, 1, 1, 1, 3, 3])
+
+    with pytest.raises(ValueError):
+        _ = TimeSeries.merge(first, second, policy="max")
+
+    # Series whose stop time does not match their elements, such as from generate_timeseries, span their elements
+    generated = TimeSeries.generate_timeseries(np.array([0.0, 5.0, 10.0]) + 946684800.0, [0.0, 5.0, 10.0], 1.0, "m")
+    generated_later = TimeSeries.generate_timeseries(np.array([20.0, 30.0]) + 946684800.0, [20.0, 30.0], 1.0, "m")
+    assert generated.stop == generated.start and len(generated) == 11
+
+    merged, mask = TimeSeries.merge(generated, generated_later, return_mask=True)
+    assert len(merged) == 31
+    assert np.array_equal(merged[mask], np.concatenate((np.arange(11.0), np.arange(20.0, 31.0))))
+    assert np.array_equal(TimeSeries.merge(generated), generated)
+
+def test_merge_many_chunks():
+    x = np.array([0, 9999]) + 946684800.0
+    ts = quick_gen_timeseries(x, np.arange(10000.0))
+    chunks = list(ChunkedTimeSeries.from_time_series(ts, 20).chunks())
+    assert len(chunks) == 500
+
+    assert np.array_equal(TimeSeries.merge(*chunks), ts)
+    assert np.array_equal(TimeSeries.merge(*reversed(chunks)), ts)
+    assert len(TimeSeries.merge(*chunks[::2], segmented=True).segments) == 250
+
+def test_range_stats():
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=100000)
+    values[5000:5100] = np.nan
+    ts = quick_gen_timeseries(np.array([0, 99999]) + 946684800.0, values)
+
+    for start_index, stop_index in [(0, 99999), (3, 70), (4990, 5200), (12345, 98765), (40, 40)]:
+        stats = ts.range_stats(ts.start + datetime.timedelta(seconds=start_index * ts.period),
+                               ts.start + datetime.timedelta(seconds=stop_index * ts.period))
+        window = values[start_index:stop_index + 1]
+
+        assert stats["count"] == np.count_nonzero(~np.isnan(window))
+        assert stats["min"] == np.nanmin(window)
+        assert stats["max"] == np.nanmax(window)
+        assert math.isclose(stats["mean"], np.nanmean(window), abs_tol=1e-12)
+
+    assert ts.memory_usage(deep=True) < ts.nbytes * 1.5
+
+    # Long series are plotted as a decimated envelope
+    ts._meta = {"measurement": "Test", "field": "Noise"}
+    ts.plot(show=False, max_points=1000)
+    plt.close("all")
+
+def test_at():
+    x = np.array([0, 9]) + 946684800.0
+    ts = quick_gen_timeseries(x, [1.0, 2, 3, 3, 3, 2, 4, 5, 4, 1])
+
+    unix_times = np.array([0, 1.25, 6.5, 9]) + 946684800.0
+    assert np.allclose(ts.at(unix_times), [1, 2.25, 4.5, 1])
+    assert np.array_equal(ts.at(unix_times, method="nearest"), [1, 2, 4, 1])
+    assert np.array_equal(ts.at(unix_times, method="previous"), [1, 2, 4, 1])
+    assert np.array_equal(ts.at(unix_times + 0.75, method="previous", fill_value=np.nan)[:3], [1, 3, 5])
+
+    # datetimes and datetime64 give the same results as UNIX timestamps
+    datetimes = [datetime.datetime.fromtimestamp(t, tz=datetime.timezone.utc) for t in unix_times]
+    assert np.allclose(ts.at(datetimes), ts.at(unix_times))
+    assert np.allclose(ts.at(np.array(unix_times * 1e9, dtype="datetime64[ns]")), ts.at(unix_times))
+    assert math.isclose(ts.at(datetimes[1]), 2.25)
+    assert math.isclose(ts[datetimes[1]], 2.25)
+
+    # Integers are whole UNIX timestamps in seconds, like floats
+    assert ts.at(946684801) == 2
+    assert np.array_equal(ts.at(np.array([946684801, 946684807])), [2, 5])
+
+    assert np.isnan(ts.at(unix_times - 1, fill_value=np.nan)[0])
+    with pytest.raises(IndexError):
+        _ = ts.at(unix_times - 1)
+    with pytest.raises(ValueError):
+        _ = ts.at(unix_times, method="cubic")
+
+def test_asof():
+    x = np.array([0, 9]) + 946684800.0
+    ts = quick_gen_timeseries(x, np.arange(10.0))
+
+    # The regular grid gives the same matches as a RawSeries with the same timestamps
+    raw = RawSeries(ts.axis.nanoseconds().view("datetime64[ns]"), np.arange(10.0), "m")
+    queries = np.array([-0.5, 0, 2.3, 4.5, 4.8, 9, 9.5]) + 946684800.0
+    for direction in ["backward", "forward", "nearest"]:
+        assert np.array_equal(ts.asof_indices(queries, direction), raw.asof_indices(queries, direction))
+        assert np.array_equal(ts.asof_indices(queries, direction, tolerance=0.3),
+                              raw.asof_indices(queries, direction, tolerance=0.3))
+
+    assert np.array_equal(ts.asof(queries, "forward", fill_value=-1), [0, 0, 3, 5, 5, 9, -1])
+    assert np.array_equal(ts.asof_indices(np.array([946684802, 946684805])), [2, 5])
+
+    # Sparse events can be paired with telemetry, and vice versa, without a common grid
+    brakes = RawSeries(np.array([2.5, 6]) + 946684800.0, [1, 0], "")
+    brakes_on_grid = ts.join_asof(brakes, fill_value=0)
+    assert np.array_equal(brakes_on_grid, [0, 0, 0, 1, 1, 1, 0, 0, 0, 0])
+    assert brakes_on_grid.axis == ts.axis
+    assert np.array_equal(raw.join_asof(ts).values, ts)
+
+    speeds = brakes.join_asof(ts, direction="nearest")
+    assert np.array_equal(speeds.values, [2, 6])
+    assert speeds.units == ts.units
+
+def test_freeze():
+    x = np.array([0, 4]) + 946684800.0
+    ts = quick_gen_timeseries(x, [1.0, 2, 3, 4, 5])
+    ts._meta = {"field": "PackVoltage", "tags": ["a"]}
+
+    same = quick_gen_timeseries(x, [1.0, 2, 3, 4, 5])
+    assert ts.content_hash == same.content_hash
+    assert ts.content_hash != quick_gen_timeseries(x + 1, [1.0, 2, 3, 4, 5]).content_hash
+    assert ts.content_hash != quick_gen_timeseries(x, [1.0, 2, 3, 4, 5], "V").content_hash
+    assert ts.content_hash != quick_gen_timeseries(x, [1.0, 2, 3, 4, 6]).content_hash
+
+    # Unfrozen TimeSeries re-hash after being modified
+    same[0] = 0
+    assert ts.content_hash != same.content_hash
+
+    frozen = ts.copy().freeze()
+    assert frozen.frozen and not ts.frozen
+    assert frozen.content_hash == ts.content_hash
+
+    with pytest.raises(ValueError):
+        frozen[0] = 0
+    with pytest.raises(ValueError):
+        frozen.meta["field"] = "Other"
+    with pytest.raises(ValueError):
+        frozen.meta = {}
+    with pytest.raises(ValueError):
+        frozen.override_units("V")
+    assert frozen.meta["tags"] == ("a",)
+
+    # Frozen TimeSeries are shared rather than copied, while derived results are ordinary TimeSeries
+    assert copy.deepcopy(frozen) is frozen
+    doubled = frozen * 2
+    assert not doubled.frozen
+    doubled[0] = 0
+    doubled.meta["field"] = "DoubledPackVoltage"
+    assert frozen.meta["field"] == "PackVoltage"
+
+    copied = frozen[1:3].copy()
+    copied.meta["tags"] = ["b"]
+    copied[0] = 0
+    assert isinstance(copy.copy(frozen.meta), dict)
+
+    restored = pickle.loads(pickle.dumps(frozen))
+    assert restored.frozen
+    assert restored.content_hash == frozen.content_hash